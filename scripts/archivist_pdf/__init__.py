@@ -0,0 +1,7 @@
+"""
+THE ARCHIVIST METHOD - shared PDF generator support.
+
+Pieces used by more than one generator in scripts/. The generators are run
+as plain scripts (python3 scripts/generate_*.py), so this package is
+imported as a sibling: `from archivist_pdf.inline import render_inline`.
+"""
@@ -0,0 +1,363 @@
+"""
+Markdown block structure for the chapter files.
+
+parse_blocks() turns one markdown file into a flat list of small block
+nodes (HeadingBlock, ParagraphBlock, BoxBlock, ...). The nodes hold plain
+strings only -- no ReportLab objects -- so one parse can be lowered by any
+generator (see archivist_pdf.lower) or kept around between builds.
+
+classify_lines() looks at every line of a file exactly once and packs what
+the block assembler needs to know about it into one byte of an array('B'):
+
+    bits 0-3   line kind (K_*), in the order parse_blocks tests them
+    PIPE       line contains '|'            (table rows continue)
+    FENCE      line starts with ```         (code blocks close)
+    BOX_EDGE   line contains ═ or ─         (boxed blocks close)
+    BREAK      line ends a running paragraph
+
+The assembler then only ever reads codes; no line is stripped, matched or
+looked ahead at a second time.
+"""
+
+import re
+from array import array
+
+# Bump whenever parse_blocks() output changes for the same input; cached
+# parses (archivist_pdf.cache) are keyed by it.
+PARSER_VERSION = 2
+
+# ── Line kinds ──
+K_BLANK = 0
+K_PARA = 1
+K_H1 = 2
+K_H2 = 3
+K_H3 = 4
+K_H4 = 5
+K_H1_NUMBERED = 6    # "# 1.2 ..." — section number, titled by the builder
+K_H1_TITLE = 7       # "# PATTERN ..." / "# EPILOGUE ..."
+K_BOX = 8
+K_FENCE = 9
+K_RULE = 10
+K_TIMESTAMP = 11
+K_TABLE = 12         # first row of a table (next line holds the --- rule)
+K_BULLET = 13
+K_NUMBERED = 14
+
+KIND_MASK = 0x0F
+PIPE = 0x10
+FENCE = 0x20
+BOX_EDGE = 0x40
+BREAK = 0x80
+
+RULE_LINES = frozenset(('---', '***', '___'))
+
+_H1_NUMBERED = re.compile(r'# \d+\.\d+')
+_TIMESTAMP = re.compile(r'\*?\*?\[T[+-]\d+:\d+\]')
+_TIMESTAMP_LOOSE = re.compile(r'\*?\*?\[T[+-]')
+_NUMBERED = re.compile(r'(\d+)\.\s+(.+)')
+_DIGIT_DOT = re.compile(r'\d+\.')
+
+
+def classify_lines(lines):
+    """Return (stripped_lines, codes) for a list of raw markdown lines."""
+    n = len(lines)
+    text = [ln.strip() for ln in lines]
+    codes = array('B', bytes(n))
+    next_dashes = False
+
+    # Walk backwards so the table test can see the following line for free.
+    for i in range(n - 1, -1, -1):
+        s = text[i]
+        dashes = '---' in lines[i]
+        if not s:
+            codes[i] = K_BLANK | BREAK
+            next_dashes = dashes
+            continue
+
+        c = s[0]
+        heavy = '═' in s
+        edge = heavy or '─' in s
+        pipe = '|' in s
+        fence = c == '`' and s.startswith('```')
+        table = pipe and next_dashes
+
+        flags = 0
+        if pipe:
+            flags |= PIPE
+        if fence:
+            flags |= FENCE
+        if edge:
+            flags |= BOX_EDGE
+
+        if c == '#':
+            brk = True
+            if s.startswith('# ') and _H1_NUMBERED.match(s):
+                kind = K_H1_NUMBERED
+            elif s.startswith('# PATTERN ') or s.startswith('# EPILOGUE'):
+                kind = K_H1_TITLE
+            elif edge:
+                kind = K_BOX
+            elif s.startswith('####'):
+                kind = K_H4
+            elif s.startswith('###'):
+                kind = K_H3
+            elif s.startswith('##'):
+                kind = K_H2
+            elif s.startswith('# '):
+                kind = K_H1
+            elif table:
+                kind = K_TABLE
+            else:
+                kind = K_PARA
+        else:
+            bullet = s.startswith('- ') or s.startswith('• ')
+            rule = s in RULE_LINES
+            stamp_loose = c == '*' or c == '['
+            if stamp_loose:
+                stamp_loose = _TIMESTAMP_LOOSE.match(s) is not None
+            digit_dot = c.isdigit() and _DIGIT_DOT.match(s) is not None
+            brk = (bullet or fence or heavy or rule or digit_dot or
+                   stamp_loose or table)
+
+            if edge:
+                kind = K_BOX
+            elif fence:
+                kind = K_FENCE
+            elif rule:
+                kind = K_RULE
+            elif stamp_loose and _TIMESTAMP.match(s):
+                kind = K_TIMESTAMP
+            elif table:
+                kind = K_TABLE
+            elif bullet:
+                kind = K_BULLET
+            elif digit_dot and _NUMBERED.match(s):
+                kind = K_NUMBERED
+            else:
+                kind = K_PARA
+
+        codes[i] = kind | flags | (BREAK if brk else 0)
+        next_dashes = dashes
+
+    return text, codes
+
+
+def split_numbered(s):
+    """('12', 'text') for a K_NUMBERED line."""
+    num, rest = s.split('.', 1)
+    return num, rest.strip()
+
+
+# ══════════════════════════════════════════════════════════════
+# BLOCK NODES
+# ══════════════════════════════════════════════════════════════
+
+class Block:
+    """Base for block nodes: slot-only, compared and printed field by field."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        return (type(self) is type(other) and
+                all(getattr(self, n) == getattr(other, n) for n in self.__slots__))
+
+    def __repr__(self):
+        fields = ', '.join(f'{n}={getattr(self, n)!r}' for n in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
+class HeadingBlock(Block):
+    """level 1-4. role is 'section' for '# 1.2 ...', 'title' for
+    '# PATTERN ...' / '# EPILOGUE', otherwise None."""
+    __slots__ = ('level', 'text', 'role')
+
+
+class ParagraphBlock(Block):
+    __slots__ = ('text',)
+
+
+class BulletBlock(Block):
+    __slots__ = ('text',)
+
+
+class NumberedBlock(Block):
+    __slots__ = ('num', 'text')
+
+
+class TimestampBlock(Block):
+    __slots__ = ('text',)
+
+
+class RuleBlock(Block):
+    __slots__ = ()
+
+
+# Code, tables and boxes are the blocks that can outgrow a page; they keep
+# the 1-based source line they start on, for layout diagnostics.
+
+class CodeBlock(Block):
+    __slots__ = ('code', 'line')
+
+
+class TableBlock(Block):
+    __slots__ = ('headers', 'rows', 'line')
+
+
+class BoxBlock(Block):
+    """btype is the detected callout type (see detect_box_type). title is
+    the title line found inside the box, if any. children are
+    ParagraphBlock / BulletBlock nodes, with None for a blank line."""
+    __slots__ = ('btype', 'title', 'children', 'line')
+
+
+# ── Boxes ──
+
+_BOX_KEYWORDS = ('GOLD NUGGET', 'KEY TAKEAWAY', 'QUICK WIN', 'WARNING',
+                 'BEFORE YOU', 'ARCHIVIST OBSERVES')
+_BOX_EMOJI = ('\U0001F48E', '\U0001F511', '\u26A1', '\u26A0', '\U0001F4DC')
+_BOX_TITLE_TAIL = re.compile(r'[\U0001F48E\U0001F511\u26A1\u26A0\uFE0F\U0001F4DC\s]+$')
+_BOX_TITLE_HEAD = re.compile(r'^[\U0001F48E\U0001F511\u26A1\u26A0\uFE0F\U0001F4DC\s]+')
+
+
+def detect_box_type(header, text):
+    c = (header + ' ' + text).upper()
+    if 'GOLD NUGGET' in c: return 'gold'
+    if 'KEY TAKEAWAY' in c: return 'takeaway'
+    if 'QUICK WIN' in c: return 'quickwin'
+    if 'WARNING' in c or 'BEFORE YOU' in c or '\u26A0' in c: return 'warning'
+    if 'ARCHIVIST OBSERVES' in c: return 'archivist'
+    if 'PATTERN ARCHAEOLOGY' in c and 'SUBJECT' in c: return 'log'
+    if 'PATTERN EXECUTION LOG' in c: return 'log'
+    if 'COPY TO PHONE' in c or 'QUICK REFERENCE' in c: return 'reference'
+    return 'info'
+
+
+def _box(body_lines, header, line):
+    body = '\n'.join(body_lines).strip()
+    if not body:
+        return None
+    block_lines = body.split('\n')
+
+    # A leading keyword / emoji line is the box's own title.
+    title = None
+    start = 0
+    for idx, bl_s in enumerate(block_lines):
+        if not bl_s:
+            continue
+        if (any(k in bl_s.upper() for k in _BOX_KEYWORDS) or
+                any(e in bl_s for e in _BOX_EMOJI)):
+            title = _BOX_TITLE_TAIL.sub('', bl_s).strip()
+            title = _BOX_TITLE_HEAD.sub('', title).strip()
+            start = idx + 1
+        break
+
+    children = []
+    remaining = '\n'.join(block_lines[start:]).strip()
+    if remaining:
+        for ls in remaining.split('\n'):
+            if not ls:
+                children.append(None)
+            elif ls.startswith('- ') or ls.startswith('\u2022 '):
+                children.append(BulletBlock(ls[2:]))
+            else:
+                children.append(ParagraphBlock(ls))
+    return BoxBlock(detect_box_type(header, body), title, children, line)
+
+
+def _table(table_lines, line):
+    if len(table_lines) < 3:
+        return None
+    headers = [c.strip() for c in table_lines[0].split('|') if c.strip()]
+    rows = []
+    for row_line in table_lines[2:]:  # skip header separator
+        cells = [c.strip() for c in row_line.split('|') if c.strip()]
+        if cells:
+            rows.append(cells)
+    if not headers or not rows:
+        return None
+    return TableBlock(headers, rows, line)
+
+
+# ══════════════════════════════════════════════════════════════
+# PARSER
+# ══════════════════════════════════════════════════════════════
+
+def parse_blocks(md_text):
+    """Parse one markdown file into a list of block nodes."""
+    out = []
+    lines = md_text.split('\n')
+    text, codes = classify_lines(lines)
+    n = len(lines)
+    i = 0
+
+    while i < n:
+        code = codes[i]
+        kind = code & KIND_MASK
+        s = text[i]
+
+        if kind == K_BLANK:
+            i += 1
+            continue
+
+        # Boxed blocks (═ or ─)
+        if kind == K_BOX:
+            j = i + 1
+            while j < n and not codes[j] & BOX_EDGE:
+                j += 1
+            box = _box(text[i + 1:j], s, i + 1)
+            if box is not None:
+                out.append(box)
+            i = j + 1
+            continue
+
+        # Code blocks
+        if kind == K_FENCE:
+            j = i + 1
+            while j < n and not codes[j] & FENCE:
+                j += 1
+            out.append(CodeBlock('\n'.join(lines[i + 1:j]), i + 1))
+            i = j + 1
+            continue
+
+        # Tables
+        if kind == K_TABLE:
+            j = i
+            while j < n and codes[j] & PIPE:
+                j += 1
+            table = _table(text[i:j], i + 1)
+            if table is not None:
+                out.append(table)
+            i = j
+            continue
+
+        # Regular paragraph (collect continuation lines)
+        if kind == K_PARA:
+            j = i + 1
+            while j < n and not codes[j] & BREAK:
+                j += 1
+            out.append(ParagraphBlock(' '.join(text[i:j])))
+            i = j
+            continue
+
+        if kind in _HEADING_LEVELS:
+            out.append(HeadingBlock(_HEADING_LEVELS[kind], s.lstrip('#').strip(),
+                                    _HEADING_ROLES.get(kind)))
+        elif kind == K_RULE:
+            out.append(RuleBlock())
+        elif kind == K_TIMESTAMP:
+            out.append(TimestampBlock(s.strip('*')))
+        elif kind == K_BULLET:
+            out.append(BulletBlock(s[2:].strip()))
+        elif kind == K_NUMBERED:
+            out.append(NumberedBlock(*split_numbered(s)))
+        i += 1
+
+    return out
+
+
+_HEADING_LEVELS = {K_H1: 1, K_H2: 2, K_H3: 3, K_H4: 4,
+                   K_H1_NUMBERED: 1, K_H1_TITLE: 1}
+_HEADING_ROLES = {K_H1_NUMBERED: 'section', K_H1_TITLE: 'title'}
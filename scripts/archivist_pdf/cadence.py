@@ -0,0 +1,83 @@
+"""
+Full pages placed by page count: the Complete Archive's pull quotes, one
+about every 35 pages.
+
+Where a quote lands depends on how many pages come before it, which no
+builder knows while it assembles the story, and which a worker laying out
+one part (archivist_pdf.parallel) or a part taken from the cache cannot
+know either. So the story only holds Slots, zero-size markers at the
+places a quote may go -- between chapters, never inside one. Layout
+records the page each Slot reaches through the doc's afterFlowable hook,
+like the contents marks (archivist_pdf.toc). With every page counted,
+place() picks the slots nearest each multiple of the cadence; the quote
+pages are laid out once, on their own, and the merge inserts them there.
+Nothing else moves, so nothing is laid out twice.
+
+    quotes = Cadence(35, 'quote', [[Spacer(...), Paragraph(q, ...)] for q in QUOTES])
+    story.append(Slot())                # wherever a quote may go
+    layout.build(story, path, cadence=quotes)
+    print(quotes.summary())   # "Pull quotes: 17 placed, every 31-40 pages"
+"""
+
+from reportlab.platypus import PageBreak
+from reportlab.platypus.doctemplate import ActionFlowable
+
+SLOT = 'slot'   # mark key of a Slot
+
+
+class Slot(ActionFlowable):
+    """A place a Cadence page may be inserted: before the page layout is
+    on when it reaches the slot. Changes nothing itself."""
+
+    mark_key = SLOT
+
+    def __init__(self):
+        ActionFlowable.__init__(self, ('slot',))
+
+    def apply(self, doc):
+        pass
+
+
+class Cadence:
+    def __init__(self, every, template, pages, label="Pull quotes"):
+        self.every = every
+        self.template = template   # page template the pages are laid out on
+        self.pages = pages         # flowables of each page, used in order
+        self.label = label
+        self.placed = []           # 0-based indexes in the finished document
+
+    def place(self, slots):
+        """The slots, page indexes in layout order, to insert a page before:
+        each the slot nearest to `every` pages after the last inserted page
+        (or the first page), skipping any less than half that, with at most
+        one page per entry of pages."""
+        chosen = []
+        last = 0
+        for i, slot in enumerate(slots):
+            if len(chosen) == len(self.pages):
+                break
+            since = slot + len(chosen) - last
+            if since < self.every // 2:
+                continue
+            later = slots[i + 1] + len(chosen) - last if i + 1 < len(slots) else None
+            if since >= self.every or (later is not None
+                                       and later - self.every > self.every - since):
+                last = slot + len(chosen)   # where the inserted page lands
+                chosen.append(slot)
+        self.placed = [slot + n for n, slot in enumerate(chosen)]
+        return chosen
+
+    def story(self, count):
+        """The first count pages, one after another."""
+        story = []
+        for flowables in self.pages[:count]:
+            story.extend(flowables)
+            story.append(PageBreak())
+        return story
+
+    def summary(self):
+        if not self.placed:
+            return f"{self.label}: none placed"
+        gaps = [b - a for a, b in zip([0] + self.placed, self.placed)]
+        return (f"{self.label}: {len(self.placed)} placed, "
+                f"every {min(gaps)}-{max(gaps)} pages")
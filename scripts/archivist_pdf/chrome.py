@@ -0,0 +1,34 @@
+"""
+Page chrome drawn once per document and placed by reference.
+
+Page callbacks repaint the same background, rules and running text on
+every page. A callback wrapped in static_chrome() is recorded as a PDF Form
+XObject the first time it runs on a canvas; every later page places that
+form with a single Do operator instead of repeating the drawing. Anything
+that changes from page to page -- the page number -- is drawn outside it:
+
+    @static_chrome
+    def _body_chrome(c, doc):
+        ...                     # background, header, footer rule and text
+
+    def draw_body(c, doc):
+        _body_chrome(c, doc)
+        c.drawRightString(x, y, str(c.getPageNumber()))
+"""
+
+import functools
+
+
+def static_chrome(draw):
+    """Run draw(canvas, doc) once per canvas as a form; place it after."""
+    name = f"chrome_{draw.__name__}"
+
+    @functools.wraps(draw)
+    def place(canvas, doc):
+        if not canvas.hasForm(name):
+            canvas.beginForm(name)
+            draw(canvas, doc)
+            canvas.endForm()
+        canvas.doForm(name)
+
+    return place
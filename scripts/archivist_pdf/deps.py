@@ -0,0 +1,134 @@
+"""
+Dependency manifest: the files each product was built from.
+
+Every generator records what it reads while it builds -- each markdown
+source through its load_file(), each candidate path it found missing, and
+its own code -- and once the PDF is written saves them, with a hash of
+each as it was read, to root/deps-v<N>/<product>.json. scripts/build_pdfs.py
+compares those hashes with the files on disk and rebuilds only the products
+whose inputs changed.
+
+The code is hashed once, by snapshot() when the generator is imported: it
+is what the process runs, whatever is on disk by the time the PDF is saved.
+A build daemon's forked children (scripts/build_daemon.py) run the code
+their parent imported, perhaps long before.
+
+    CODE = snapshot(Path(__file__), *PACKAGE_DIR.glob('*.py'))   # at import
+
+    DEPS.start()
+    text = load_file(path)              # load_file() calls DEPS.read(path)
+    DEPS.code(CODE)
+    DEPS.save(CACHE_DIR, 'field-guide-4', output_path)
+    print(DEPS.summary())               # "Dependencies: 58 files recorded"
+
+    stale(CACHE_DIR, 'field-guide-4')   # [] when the PDF is up to date
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import reportlab
+
+# Bump when the manifest changes shape; older manifests then read as missing.
+DEPS_VERSION = 1
+
+
+def file_hash(path):
+    """Digest of the file's bytes, or None if it cannot be read."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def snapshot(*paths):
+    """{resolved path: hash} of paths as they are now."""
+    return {Path(path).resolve(): file_hash(path) for path in paths}
+
+
+def edited(code):
+    """The paths of snapshot code whose files differ on disk now."""
+    return [path for path, digest in code.items() if file_hash(path) != digest]
+
+
+def _manifest_path(root, product):
+    return root / f"deps-v{DEPS_VERSION}" / f"{product}.json"
+
+
+class DependencyRecorder:
+    def __init__(self):
+        self._files = {}   # path -> hash when first read (None: missing)
+
+    def start(self):
+        """Forget the last build's files; builders call it first."""
+        self._files = {}
+
+    def read(self, *paths):
+        """Record paths as read now, or as looked for and missing."""
+        for path in paths:
+            path = Path(path).resolve()
+            if path not in self._files:
+                self._files[path] = file_hash(path)
+
+    def code(self, code):
+        """Record the files of snapshot code as it saw them."""
+        for path, digest in code.items():
+            self._files.setdefault(path, digest)
+
+    def save(self, root, product, output):
+        """Write the manifest for product, built to output. Paths are kept
+        relative to root's parent, the checkout."""
+        base = root.resolve().parent
+        manifest = {
+            'reportlab': reportlab.Version,
+            'output': os.path.relpath(Path(output).resolve(), base),
+            'inputs': {os.path.relpath(p, base): h
+                       for p, h in sorted(self._files.items())},
+        }
+        path = _manifest_path(root, product)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"  [warn] Dependency manifest not written: {e}")
+
+    def summary(self):
+        return f"Dependencies: {len(self._files)} files recorded"
+
+
+DEPS = DependencyRecorder()
+
+
+def load_manifest(root, product):
+    """The manifest save() wrote for product, or None."""
+    try:
+        with open(_manifest_path(root, product), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def stale(root, product):
+    """Why product needs rebuilding, as a list of reasons; [] if it does not."""
+    manifest = load_manifest(root, product)
+    if manifest is None:
+        return ["never built"]
+    base = root.resolve().parent
+    if not (base / manifest['output']).exists():
+        return [f"{manifest['output']} missing"]
+    if manifest['reportlab'] != reportlab.Version:
+        return [f"ReportLab {manifest['reportlab']} -> {reportlab.Version}"]
+    reasons = []
+    for name, digest in manifest['inputs'].items():
+        now = file_hash(base / name)
+        if now != digest:
+            what = "added" if digest is None else "removed" if now is None else "changed"
+            reasons.append(f"{name} {what}")
+    return reasons
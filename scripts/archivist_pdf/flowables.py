@@ -0,0 +1,244 @@
+"""
+Flowables shared by the generators: rules, dividers, write-in blanks and
+callout boxes.
+"""
+
+from reportlab.platypus import Flowable, Spacer
+
+from archivist_pdf.watchdog import WATCHDOG
+from archivist_pdf.theme import BG_CALLOUT, BORDER_COLOR, TEAL, TEAL_DIM, CONTENT_W
+
+
+class HorizontalRule(Flowable):
+    def __init__(self, width=None, color=TEAL_DIM, thickness=1):
+        Flowable.__init__(self)
+        self._width = width
+        self.color = color
+        self.thickness = thickness
+
+    def draw(self):
+        self.canv.setStrokeColor(self.color)
+        self.canv.setLineWidth(self.thickness)
+        self.canv.line(0, 0, self._width or CONTENT_W, 0)
+
+    def wrap(self, availWidth, availHeight):
+        self._width = self._width or availWidth
+        return (self._width, self.thickness + 6)
+
+
+class TealDivider(Flowable):
+    def __init__(self, width=None):
+        Flowable.__init__(self)
+        self._width = width
+
+    def wrap(self, availWidth, availHeight):
+        self._width = self._width or availWidth
+        return (self._width, 20)
+
+    def draw(self):
+        mid = self._width / 2
+        self.canv.setStrokeColor(TEAL_DIM)
+        self.canv.setLineWidth(0.5)
+        self.canv.line(mid - 120, 10, mid - 15, 10)
+        self.canv.setFillColor(TEAL)
+        self.canv.saveState()
+        self.canv.translate(mid, 10)
+        self.canv.rotate(45)
+        self.canv.rect(-4, -4, 8, 8, fill=1, stroke=0)
+        self.canv.restoreState()
+        self.canv.line(mid + 15, 10, mid + 120, 10)
+
+
+class WriteArea(Flowable):
+    """Blank lined area for writing exercises."""
+    def __init__(self, num_lines=4, width=None, label=None):
+        Flowable.__init__(self)
+        self._width = width
+        self.num_lines = num_lines
+        self.label = label
+        self.line_height = 24
+
+    def wrap(self, availWidth, availHeight):
+        self._width = self._width or availWidth
+        label_h = 16 if self.label else 0
+        self._height = label_h + self.num_lines * self.line_height + 8
+        return (self._width, self._height)
+
+    def draw(self):
+        y = self._height
+        if self.label:
+            self.canv.setFont('Helvetica-Bold', 9.5)
+            self.canv.setFillColor(TEAL)
+            y -= 14
+            self.canv.drawString(0, y, self.label)
+            y -= 6
+        self.canv.setStrokeColor(BORDER_COLOR)
+        self.canv.setLineWidth(0.5)
+        for i in range(self.num_lines):
+            y -= self.line_height
+            self.canv.line(8, y, self._width - 8, y)
+
+
+class WriteLine(Flowable):
+    """A blank to fill in: a rule in place of a Courier line of underscores.
+
+    Takes the same space as Paragraph('_' * chars, style) for a one-line
+    style and draws where the underscores would."""
+    def __init__(self, style, chars=47):
+        Flowable.__init__(self)
+        self.style = style
+        self.chars = chars
+
+    def wrap(self, availWidth, availHeight):
+        return (availWidth, self.style.leading)
+
+    def getSpaceBefore(self):
+        return self.style.spaceBefore
+
+    def getSpaceAfter(self):
+        return self.style.spaceAfter
+
+    def _rule(self):
+        """(x, y, length, thickness) of the underscores this replaces."""
+        st = self.style
+        size = st.fontSize
+        # Courier: 600/1000 em advance; '_' spans 75-125/1000 em below the
+        # baseline, which sits one font size below the top of the line
+        return (st.leftIndent, st.leading - 1.1 * size,
+                self.chars * 0.6 * size, 0.05 * size)
+
+    def draw(self):
+        x, y, length, thickness = self._rule()
+        self.canv.setStrokeColor(self.style.textColor)
+        self.canv.setLineWidth(thickness)
+        self.canv.line(x, y, x + length, y)
+
+
+class BoxedContent(Flowable):
+    """Content in a styled box with background and left border.
+
+    A box too tall for the space left is split there, between children or
+    inside one (a Paragraph splits between its lines), and the rest carries
+    on in a box of the same style on the next page. Only a child that
+    cannot split and does not fit even a fresh frame is clipped.
+
+    Children are wrapped once per inner width; wrap(), split() and draw()
+    all reuse those heights, and the halves of a split inherit them."""
+    MIN_SPLIT = 36  # Least content worth starting a box with at a page foot
+    _source = None  # (path, line) lowered from, for archivist_pdf.watchdog
+
+    def __init__(self, content_flowables, width=None, bg_color=BG_CALLOUT,
+                 border_color=TEAL, padding=12):
+        Flowable.__init__(self)
+        self._content = [f for f in content_flowables if f is not None]
+        self._box_width = width or CONTENT_W
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self.padding = padding
+        self._height = 0
+        self._measured = None  # (inner width, child heights)
+        self._clip = None      # height to clip to, for an unsplittable box
+
+    def _inner_width(self):
+        return max(self._box_width - 2 * self.padding - 8, 50)
+
+    def _child_heights(self, availHeight):
+        inner_w = self._inner_width()
+        if self._measured is None or self._measured[0] != inner_w:
+            heights = []
+            h = 0
+            for f in self._content:
+                try:
+                    _, fh = f.wrap(inner_w, max(availHeight - h, 50))
+                except Exception as e:
+                    WATCHDOG.swallowed(self, f, e)
+                    fh = 14  # fallback line height
+                heights.append(fh)
+                h += fh
+            self._measured = (inner_w, heights)
+        return self._measured[1]
+
+    def wrap(self, availWidth, availHeight):
+        if not self._content:
+            return (0, 0)
+        self._box_width = min(self._box_width, availWidth)
+        self._height = sum(self._child_heights(availHeight)) + 2 * self.padding
+        if self._clip is not None:
+            self._height = min(self._height, self._clip)
+        return (self._box_width, self._height)
+
+    def _piece(self, content, heights=None):
+        box = BoxedContent(content, self._box_width, self.bg_color,
+                           self.border_color, self.padding)
+        if heights is not None:
+            box._measured = (self._measured[0], heights)
+        box._source = self._source
+        return box
+
+    def split(self, availWidth, availHeight):
+        """Fill availHeight with as much content as fits and continue the
+        rest in a second box; [] moves the whole box to the next frame."""
+        if not self._content:
+            return []
+        if self._height <= availHeight:
+            return []  # fits, no split needed
+
+        heights = self._child_heights(availHeight)
+        inner_w = self._measured[0]
+        target = availHeight - 2 * self.padding
+        h = 0
+        for idx, fh in enumerate(heights):
+            if h + fh > target:
+                break
+            h += fh
+
+        # Split inside the child that crosses the page foot, if it can
+        child = self._content[idx]
+        try:
+            parts = child.split(inner_w, target - h)
+        except Exception as e:
+            WATCHDOG.swallowed(self, child, e)
+            parts = []
+        if len(parts) == 2 and h + parts[0].wrap(inner_w, target - h)[1] >= self.MIN_SPLIT:
+            return [self._piece(self._content[:idx] + parts[:1]),
+                    self._piece(parts[1:] + self._content[idx + 1:])]
+        # A Paragraph that refuses to split drops the lines draw() needs
+        if hasattr(child, 'breakLines') and not hasattr(child, 'blPara'):
+            child.wrap(inner_w, heights[idx])
+
+        # Otherwise split before it, unless that leaves too little here
+        if idx > 0 and h >= self.MIN_SPLIT:
+            rest, rest_heights = self._content[idx:], heights[idx:]
+            while rest and isinstance(rest[0], Spacer):
+                rest, rest_heights = rest[1:], rest_heights[1:]
+            if rest:
+                return [self._piece(self._content[:idx], heights[:idx]),
+                        self._piece(rest, rest_heights)]
+
+        if getattr(self, '_postponed', 0):
+            # Already moved to a fresh frame and still nothing splits:
+            # clip rather than fail the build.
+            clipped = self._piece(self._content, heights)
+            clipped._clip = availHeight
+            WATCHDOG.warn(self, f"clipped to {availHeight:.0f} of "
+                                f"{self._height:.0f} pt")
+            return [clipped]
+        return []
+
+    def draw(self):
+        if not self._content:
+            return
+        self.canv.setFillColor(self.bg_color)
+        self.canv.roundRect(0, 0, self._box_width, self._height, 4, fill=1, stroke=0)
+        if self.border_color:
+            self.canv.setStrokeColor(self.border_color)
+            self.canv.setLineWidth(3)
+            self.canv.line(2, 4, 2, self._height - 4)
+        y = self._height - self.padding
+        for f, fh in zip(self._content, self._child_heights(self._height)):
+            try:
+                if y - fh >= -self.padding:
+                    f.drawOn(self.canv, self.padding + 8, y - fh)
+            except Exception as e:
+                WATCHDOG.swallowed(self, f, e)
+            y -= fh
@@ -0,0 +1,123 @@
+"""
+Unrenderable-glyph filter for the generators that set text in the base-14
+Helvetica fonts, which have no emoji or pictograph glyphs.
+
+The character set is the one the old per-call strip_emoji() regex used.
+It is merged into sorted codepoint ranges once at import, and the filter is
+a str.translate() over a table that decides each codepoint the first time
+it is seen. Pure-ASCII text (most lines of the book) is returned untouched.
+"""
+
+from bisect import bisect_right
+
+# (first, last) codepoints, inclusive -- same list as the original regex.
+EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F700, 0x1F77F),  # alchemical symbols
+    (0x1F780, 0x1F7FF),  # Geometric Shapes Extended
+    (0x1F800, 0x1F8FF),  # Supplemental Arrows-C
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA00, 0x1FA6F),  # Chess Symbols
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+    (0x2702, 0x27B0),    # Dingbats
+    (0x24C2, 0x1F251),
+    (0x1F926, 0x1F937),
+    (0x10000, 0x10FFFF),
+    (0x200D, 0x200D),
+    (0x2640, 0x2642),
+    (0x2600, 0x2B55),
+    (0x23CF, 0x23CF),
+    (0x23E9, 0x23E9),
+    (0x231A, 0x231A),
+    (0xFE0F, 0xFE0F),
+    (0x3030, 0x3030),
+    (0x2934, 0x2935),
+    (0x25AA, 0x25AB),
+    (0x25B6, 0x25B6),
+    (0x25C0, 0x25C0),
+    (0x25FB, 0x25FE),
+    (0x2614, 0x2615),
+    (0x2648, 0x2653),
+    (0x267F, 0x267F),
+    (0x2693, 0x2693),
+    (0x26A1, 0x26A1),
+    (0x26AA, 0x26AB),
+    (0x26BD, 0x26BE),
+    (0x26C4, 0x26C5),
+    (0x26CE, 0x26CE),
+    (0x26D4, 0x26D4),
+    (0x26EA, 0x26EA),
+    (0x26F2, 0x26F3),
+    (0x26F5, 0x26F5),
+    (0x26FA, 0x26FA),
+    (0x26FD, 0x26FD),
+    (0x2705, 0x2705),
+    (0x2708, 0x270D),
+    (0x270F, 0x270F),
+    (0x2712, 0x2712),
+    (0x2714, 0x2714),
+    (0x2716, 0x2716),
+    (0x271D, 0x271D),
+    (0x2721, 0x2721),
+    (0x2728, 0x2728),
+    (0x2733, 0x2734),
+    (0x2744, 0x2744),
+    (0x2747, 0x2747),
+    (0x274C, 0x274C),
+    (0x274E, 0x274E),
+    (0x2753, 0x2755),
+    (0x2757, 0x2757),
+    (0x2763, 0x2764),
+    (0x2795, 0x2797),
+    (0x27A1, 0x27A1),
+    (0x27BF, 0x27BF),
+    (0x2B05, 0x2B07),
+    (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50),
+    (0x2B55, 0x2B55),
+    (0x231A, 0x231B),
+    (0x23E9, 0x23F3),
+    (0x23F8, 0x23FA),
+    (0x1F48E, 0x1F48E),  # gem/diamond emoji
+)
+
+
+def _merge(ranges):
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return [lo for lo, _ in merged], [hi for _, hi in merged]
+
+
+_STARTS, _ENDS = _merge(EMOJI_RANGES)
+
+
+def is_emoji(cp):
+    """True if codepoint cp is in one of EMOJI_RANGES."""
+    k = bisect_right(_STARTS, cp) - 1
+    return k >= 0 and cp <= _ENDS[k]
+
+
+class _DeletionTable(dict):
+    """str.translate() table: None deletes, the codepoint itself keeps.
+    Filled on demand, so only characters that actually occur are decided."""
+
+    def __missing__(self, cp):
+        value = None if is_emoji(cp) else cp
+        self[cp] = value
+        return value
+
+
+_TABLE = _DeletionTable()
+
+
+def strip_emoji(text):
+    """Remove emoji and other glyphs Helvetica cannot draw."""
+    if text.isascii():
+        return text
+    return text.translate(_TABLE)
@@ -0,0 +1,112 @@
+"""
+Inline markdown -> ReportLab paragraph markup.
+
+Every body line, bullet, table cell and box line in the generators passes
+through here, so it is written as a single scan: one C-level split on the
+characters that matter, then one pass over the resulting tokens.
+
+    ***text***   ->  <b><i>text</i></b>
+    **text**     ->  <b>text</b>
+    *text*       ->  <i>text</i>
+    `text`       ->  Courier, teal
+    & < >        ->  &amp; &lt; &gt;
+
+Emphasis markers that never close are written back out as literal
+asterisks, so the result is always well-nested markup that Paragraph
+accepts. Code spans are literal: asterisks inside backticks stay asterisks.
+"""
+
+import re
+
+TEAL_HEX = '14B8A6'
+CODE_OPEN = f'<font face="Courier" color="#{TEAL_HEX}">'
+CODE_CLOSE = '</font>'
+
+_SPECIAL = re.compile(r'[*`&<>]')
+_TOKEN = re.compile(r'(\*{1,3}|`[^`]+`|[&<>])')
+_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;'}
+
+# Marker sizes: 1 = italic, 2 = bold
+_OPEN = {1: '<i>', 2: '<b>'}
+_CLOSE = {1: '</i>', 2: '</b>'}
+_LITERAL = {1: '*', 2: '**'}
+
+
+def escape(text):
+    """Escape text for use inside Paragraph markup (no inline formatting)."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _find_open(stack, size):
+    for j in range(len(stack) - 1, -1, -1):
+        if stack[j][0] == size:
+            return j
+    return -1
+
+
+def _close(size, j, out, stack):
+    # Markers opened inside the one being closed can no longer close
+    # without mis-nesting, so they fall back to literal asterisks.
+    for inner_size, pos in stack[j + 1:]:
+        out[pos] = _LITERAL[inner_size]
+    del stack[j:]
+    out.append(_CLOSE[size])
+
+
+def _open(size, out, stack):
+    stack.append((size, len(out)))
+    out.append(_OPEN[size])
+
+
+def _emphasis(n, out, stack):
+    if n == 3:
+        j_i = _find_open(stack, 1)
+        j_b = _find_open(stack, 2)
+        if j_i < 0 and j_b < 0:
+            _open(2, out, stack)
+            _open(1, out, stack)
+            return
+        if j_i >= 0 and j_b >= 0:
+            first, second = (1, 2) if j_i > j_b else (2, 1)
+            _close(first, _find_open(stack, first), out, stack)
+            _close(second, _find_open(stack, second), out, stack)
+            return
+        # Only one of the pair is open: close it, open the other.
+        size = 1 if j_i >= 0 else 2
+        _close(size, j_i if size == 1 else j_b, out, stack)
+        _open(3 - size, out, stack)
+        return
+
+    j = _find_open(stack, n)
+    # An opener with nothing after it is not emphasis (regex needs .+).
+    if j < 0 or stack[j][1] == len(out) - 1:
+        _open(n, out, stack)
+    else:
+        _close(n, j, out, stack)
+
+
+def render_inline(text):
+    """Escape `text` and convert inline markdown to Paragraph markup."""
+    if _SPECIAL.search(text) is None:
+        return text
+
+    parts = _TOKEN.split(text)
+    out = [parts[0]] if parts[0] else []
+    stack = []  # (marker size, index of its opening tag in out)
+
+    for k in range(1, len(parts), 2):
+        tok = parts[k]
+        c = tok[0]
+        if c == '*':
+            _emphasis(len(tok), out, stack)
+        elif c == '`':
+            out.append(CODE_OPEN + escape(tok[1:-1]) + CODE_CLOSE)
+        else:
+            out.append(_ESCAPES[c])
+        lit = parts[k + 1]
+        if lit:
+            out.append(lit)
+
+    for size, pos in stack:
+        out[pos] = _LITERAL[size]
+    return ''.join(out)
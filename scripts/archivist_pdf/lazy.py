@@ -0,0 +1,47 @@
+"""
+Deferred flowables: chapter content that is built only when layout gets to it.
+
+A builder can queue a DeferredFlowables placeholder instead of a chapter's
+Paragraphs. ExpandingDocTemplate swaps the placeholder for the real
+flowables just before the frame needs them. Platypus removes each flowable
+from the story once it is drawn, so a chapter's objects only live while
+their pages are being laid out, not for the whole build.
+"""
+
+from reportlab.platypus import Flowable
+
+from archivist_pdf.watchdog import WatchedDocTemplate
+
+
+class DeferredFlowables(Flowable):
+    """Placeholder for the list returned by build(), called at layout time.
+
+    Only valid in an ExpandingDocTemplate story; any other template would
+    try to lay out the placeholder itself. weight is a rough count of the
+    flowables build() returns, for archivist_pdf.parallel to share out work.
+    """
+
+    def __init__(self, build, weight=1):
+        Flowable.__init__(self)
+        self._build = build
+        self.weight = weight
+
+    def expand(self):
+        return self._build()
+
+    def wrap(self, availWidth, availHeight):
+        raise TypeError("DeferredFlowables must be laid out by ExpandingDocTemplate")
+
+
+class ExpandingDocTemplate(WatchedDocTemplate):
+    """WatchedDocTemplate that expands DeferredFlowables as it reaches them."""
+
+    def __init__(self, filename, **kw):
+        WatchedDocTemplate.__init__(self, filename, **kw)
+        self.expanded = 0
+
+    def filterFlowables(self, flowables):
+        while flowables and isinstance(flowables[0], DeferredFlowables):
+            # An empty expansion leaves None, which handle_flowable skips.
+            flowables[0:1] = flowables[0].expand() or [None]
+            self.expanded += 1
@@ -0,0 +1,216 @@
+"""
+Lowering: block nodes (archivist_pdf.blocks) -> ReportLab flowables.
+
+FlowableLowering only reads nodes, so the same parse can be lowered once
+for the Complete Archive and again for every Field Guide, each with its own
+paragraph styles.
+"""
+
+from reportlab.lib.colors import HexColor
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from archivist_pdf.blocks import (
+    parse_blocks, HeadingBlock, ParagraphBlock, BulletBlock, NumberedBlock,
+    TimestampBlock, RuleBlock, CodeBlock, TableBlock, BoxBlock,
+)
+from archivist_pdf.flowables import HorizontalRule, TealDivider, BoxedContent
+from archivist_pdf.inline import TEAL_HEX, escape, render_inline
+from archivist_pdf.paragraphs import Paragraph
+from archivist_pdf.styles import STYLES
+from archivist_pdf.theme import (
+    BG_CALLOUT, BG_CODE, TEAL, TEAL_DIM, GOLD, BORDER_COLOR, RED_ACCENT,
+    CONTENT_W,
+)
+from archivist_pdf.watchdog import source_of
+
+# btype -> (border, background, title style, body style, default title)
+BOX_CONFIGS = {
+    'gold':      (GOLD, HexColor("#242010"), 'gold_title', 'gold_body', '\u2666 GOLD NUGGET'),
+    'takeaway':  (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', '\u2611 KEY TAKEAWAYS'),
+    'quickwin':  (HexColor("#22C55E"), HexColor("#1A2A1A"), 'callout_title', 'callout_body', '\u26A1 QUICK WIN'),
+    'warning':   (RED_ACCENT, HexColor("#2A1A1A"), 'callout_title', 'warning_body', '\u26A0 IMPORTANT'),
+    'archivist': (TEAL_DIM, HexColor("#1E2428"), 'callout_title', 'callout_body', '\U0001F4DC THE ARCHIVIST OBSERVES'),
+    'log':       (TEAL_DIM, BG_CODE, 'callout_title', 'callout_body', None),
+    'reference': (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', None),
+    'info':      (TEAL_DIM, BG_CALLOUT, 'callout_title', 'callout_body', None),
+}
+
+# Blocks lowered as Spacer + flowable(s) + Spacer (see count())
+_WRAPPED = (RuleBlock, CodeBlock, TableBlock, BoxBlock)
+
+
+class FlowableLowering:
+    """Turn block nodes into flowables using a generator's style sheet.
+
+    skip_roles lists HeadingBlock roles the caller renders itself (e.g. the
+    Archive draws its own chapter title pages for 'section' and 'title').
+    With a BlockCache, parse() reuses earlier parses of the same text.
+    Code, table and box flowables are tagged _source = (path, line) for
+    archivist_pdf.watchdog; parse() takes the path from a SourceText.
+    """
+
+    def __init__(self, styles, skip_roles=('section',), cache=None):
+        self.styles = styles
+        self.skip_roles = frozenset(skip_roles)
+        self.cache = cache
+        self._source = None   # path of the blocks being lowered
+        self._dispatch = {
+            HeadingBlock: self._heading,
+            ParagraphBlock: self._paragraph,
+            BulletBlock: self._bullet,
+            NumberedBlock: self._numbered,
+            TimestampBlock: self._timestamp,
+            RuleBlock: self._rule,
+            CodeBlock: self._code_block,
+            TableBlock: self._table,
+            BoxBlock: self._box,
+        }
+
+    def blocks(self, md_text):
+        """Block list for md_text, through the cache when there is one."""
+        if self.cache is not None:
+            return self.cache.blocks(md_text)
+        return parse_blocks(md_text)
+
+    def parse(self, md_text):
+        """Parse markdown and lower it in one call."""
+        return self.lower(self.blocks(md_text), source_of(md_text))
+
+    def lower(self, blocks, source=None):
+        """Flowables for blocks; source is the file they were parsed from."""
+        out = []
+        dispatch = self._dispatch
+        self._source = source
+        for block in blocks:
+            dispatch[type(block)](block, out)
+        return out
+
+    def count(self, blocks):
+        """len(self.lower(blocks)), without building anything."""
+        n = 0
+        for b in blocks:
+            kind = type(b)
+            if kind is HeadingBlock:
+                if b.role not in self.skip_roles:
+                    n += 4 if b.level == 2 else 1
+            elif kind in _WRAPPED:
+                n += 3
+            else:
+                n += 1
+        return n
+
+    # ── Text blocks ──
+
+    def _heading(self, b, out):
+        if b.role in self.skip_roles:
+            return
+        t = render_inline(b.text)
+        if b.level == 4:
+            out.append(Paragraph(t, self.styles['sub3_header']))
+        elif b.level == 3:
+            out.append(Paragraph(t, self.styles['subsection_header']))
+        elif b.level == 2:
+            out.append(Spacer(1, 4))
+            out.append(Paragraph(t, self.styles['section_header']))
+            out.append(HorizontalRule(color=TEAL_DIM))
+            out.append(Spacer(1, 4))
+        else:
+            out.append(Paragraph(t, self.styles['chapter_title']))
+
+    def _paragraph(self, b, out):
+        out.append(Paragraph(render_inline(b.text), self.styles['body']))
+
+    def _bullet(self, b, out):
+        out.append(Paragraph(
+            f'\u2022  {render_inline(b.text)}', self.styles['bullet']))
+
+    def _numbered(self, b, out):
+        out.append(Paragraph(
+            f'<font color="#{TEAL_HEX}">{b.num}.</font>  {render_inline(b.text)}',
+            self.styles['numbered']))
+
+    def _timestamp(self, b, out):
+        out.append(Paragraph(render_inline(b.text), self.styles['timestamp']))
+
+    def _rule(self, b, out):
+        out.append(Spacer(1, 6))
+        out.append(TealDivider())
+        out.append(Spacer(1, 6))
+
+    # ── Boxes, code, tables ──
+
+    def _box(self, b, out):
+        btype = b.btype
+        border, bg, title_key, body_key, default_title = BOX_CONFIGS.get(
+            btype, BOX_CONFIGS['info'])
+
+        # For quickwin/warning, create custom title style with different color
+        title_style = self.styles[title_key]
+        if btype == 'quickwin':
+            title_style = STYLES.derive(title_style, textColor=HexColor("#22C55E"))
+        elif btype == 'warning':
+            title_style = STYLES.derive(title_style, textColor=RED_ACCENT)
+        body_style = self.styles[body_key]
+
+        inner = []
+        title = default_title or b.title
+        if title:
+            inner.append(Paragraph(escape(title), title_style))
+            inner.append(Spacer(1, 4))
+
+        for child in b.children:
+            if child is None:
+                inner.append(Spacer(1, 3))
+            elif type(child) is BulletBlock:
+                bt = render_inline(child.text)
+                inner.append(Paragraph(f'\u2022  {bt}', STYLES.derive(
+                    body_style, leftIndent=16)))
+            else:
+                inner.append(Paragraph(render_inline(child.text), body_style))
+
+        box = BoxedContent(inner, bg_color=bg, border_color=border)
+        box._source = (self._source, b.line)
+        out.append(Spacer(1, 6))
+        out.append(box)
+        out.append(Spacer(1, 10))
+
+    def _code_block(self, b, out):
+        out.append(Spacer(1, 4))
+        inner = []
+        for ln in b.code.split('\n'):
+            escaped = escape(ln) if ln.strip() else ' '
+            inner.append(Paragraph(escaped, self.styles['code']))
+        box = BoxedContent(inner, bg_color=BG_CODE, border_color=TEAL_DIM)
+        box._source = (self._source, b.line)
+        out.append(box)
+        out.append(Spacer(1, 6))
+
+    def _table(self, b, out):
+        data = [[Paragraph(escape(h), self.styles['table_header']) for h in b.headers]]
+        for row in b.rows:
+            data.append([Paragraph(render_inline(c), self.styles['table_cell'])
+                        for c in row])
+
+        # Pad rows to have same number of columns
+        ncols = len(b.headers)
+        for row in data:
+            while len(row) < ncols:
+                row.append(Paragraph('', self.styles['table_cell']))
+
+        col_w = CONTENT_W / ncols
+        t = Table(data, colWidths=[col_w] * ncols)
+        t._source = (self._source, b.line)
+        t.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), HexColor("#222222")),
+            ('BACKGROUND', (0, 1), (-1, -1), HexColor("#1E1E1E")),
+            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+
+        out.append(Spacer(1, 6))
+        out.append(t)
+        out.append(Spacer(1, 8))
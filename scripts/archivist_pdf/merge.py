@@ -0,0 +1,291 @@
+"""
+PDF fragments written by ReportLab, merged into one file.
+
+Parallel layout (archivist_pdf.parallel) writes a document as several PDFs,
+one per process. merge() copies every object of each fragment into one
+file under new numbers, keeps each fragment's fonts and forms as they are,
+and puts all the pages under a single page tree, in order. Streams are
+copied byte for byte; only the dictionaries around them are renumbered.
+
+A page can also get an overlay: content drawn after the fragment was
+written, such as its page number in the whole document. overlay() runs a
+canvas callback on a scratch canvas and returns its operators, and merge()
+appends them to the page's content stream after a q ... Q around the
+page's own content, so they start from a clean graphics state.
+
+    ops = overlay(lambda c: c.drawRightString(540, 48, "17"))
+    merge(['part-000.pdf', 'part-001.pdf'], 'book.pdf', {16: ops})
+
+The merged pages need not be every page of every fragment in turn: pages=
+lists them, so a fragment's pages can replace others -- the numbered table
+of contents over the pages reserved for it (archivist_pdf.toc) -- or go
+between them -- pull quotes (archivist_pdf.cadence). A page can also get
+link annotations to other pages of the merged file.
+
+Only what ReportLab itself writes is understood: one classic xref table,
+direct stream lengths, a flat page tree. Anything else raises ValueError.
+"""
+
+import base64
+import hashlib
+import io
+import re
+import zlib
+
+from reportlab.pdfbase.pdfmetrics import getFont, standardFonts
+from reportlab.pdfgen.canvas import Canvas
+
+_STARTXREF = re.compile(rb'startxref\s+(\d+)\s+%%EOF\s*$')
+_XREF_ENTRY = re.compile(rb'(\d{10}) (\d{5}) ([nf])')
+_OBJ_HEAD = re.compile(rb'(\d+) 0 obj\r?\n')
+_REF = re.compile(rb'(\d+) 0 R')
+_LENGTH = re.compile(rb'/Length (\d+)(?! \d+ R)')
+_STREAM = re.compile(rb'stream\r?\n')
+_FILTER = re.compile(rb'/Filter (?:\[([^\]]*)\]|(/\w+))')
+_TF = re.compile(r'/(F\d+)( [\d.]+ Tf)')
+
+OVERLAY_PREFIX = 'FO.'   # font resource names used by overlays
+
+
+class Overlay:
+    """Content stream operators to draw over a page, and the base-14 fonts
+    they set text in."""
+
+    def __init__(self, ops, fonts):
+        self.ops = ops
+        self.fonts = fonts
+
+
+_scratch = None   # canvas overlay() draws on, reused for its font names
+
+
+def overlay(draw):
+    """draw(canvas) on a scratch canvas, as an Overlay for merge()."""
+    global _scratch
+    if _scratch is None:
+        _scratch = Canvas(io.BytesIO())
+    canvas = _scratch
+    canvas.saveState()
+    mark = len(canvas._code)
+    draw(canvas)
+    ops = '\n'.join(canvas._code[mark:])
+    canvas.restoreState()
+    del canvas._code[mark - 1:]
+    names = {internal[1:]: name for name, internal in canvas._doc.fontMapping.items()}
+    fonts = set()
+
+    def rename(m):
+        name = names[m.group(1)]
+        if name not in standardFonts or getFont(name).encName != 'WinAnsiEncoding':
+            raise ValueError(f"overlay font {name} is not a base-14 text font")
+        fonts.add(name)
+        return f"/{OVERLAY_PREFIX}{name}{m.group(2)}"
+
+    ops = _TF.sub(rename, ops)
+    return Overlay(ops.encode('latin-1'), sorted(fonts))
+
+
+class _Fragment:
+    """The objects of one ReportLab PDF: {number: (dictionary, stream)}."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.path = path
+        self.header = data[:data.index(b'\n', data.index(b'\n') + 1) + 1]
+        m = _STARTXREF.search(data)
+        if m is None:
+            raise ValueError(f"{path}: no startxref")
+        xref = int(m.group(1))
+        trailer = data.index(b'trailer', xref)
+        offsets = [int(off) for off, _, kind in _XREF_ENTRY.findall(data[xref:trailer])
+                   if kind == b'n']
+        self.objects = {}
+        for offset in offsets:
+            num, body = self._read(data, offset)
+            self.objects[num] = body
+        self.root = self._ref(data[trailer:], b'/Root')
+        self.info = self._ref(data[trailer:], b'/Info')
+        self.pages = self._ref(self.objects[self.root][0], b'/Pages')
+        kids = self.objects[self.pages][0]
+        kids = kids[kids.index(b'/Kids'):kids.index(b']', kids.index(b'/Kids'))]
+        self.kids = [int(n) for n in _REF.findall(kids)]
+        if any(b'/Type /Pages' in self.objects[kid][0] for kid in self.kids):
+            raise ValueError(f"{path}: nested page tree")
+
+    def _read(self, data, offset):
+        m = _OBJ_HEAD.match(data, offset)
+        if m is None:
+            raise ValueError(f"{self.path}: no object at {offset}")
+        start = m.end()
+        end = data.index(b'endobj', start)
+        s = _STREAM.search(data, start, end)
+        if s is None:
+            return int(m.group(1)), (data[start:end], b'')
+        head = data[start:s.start()]
+        length = _LENGTH.search(head)
+        if length is None:
+            raise ValueError(f"{self.path}: object {m.group(1).decode()} "
+                             f"has an indirect stream length")
+        stop = data.index(b'endstream', s.end() + int(length.group(1)))
+        stop = data.index(b'\n', stop) + 1
+        return int(m.group(1)), (head, data[s.start():stop])
+
+    @staticmethod
+    def _ref(text, key):
+        m = re.search(re.escape(key) + rb' (\d+) 0 R', text)
+        if m is None:
+            raise ValueError(f"no {key.decode()} reference")
+        return int(m.group(1))
+
+
+def _overlaid(head, stream, ops):
+    """A content stream object with ops drawn after its own content. The
+    result is Flate-compressed without the ASCII85 layer: it is only there
+    for 7-bit transport, and re-encoding it costs more than the merge."""
+    m = _FILTER.search(head)
+    filters = (m.group(1) or m.group(2)).split() if m else []
+    if filters not in ([], [b'/FlateDecode'], [b'/ASCII85Decode', b'/FlateDecode']):
+        raise ValueError(f"unsupported stream filters {b' '.join(filters).decode()}")
+    start = stream.index(b'\n') + 1
+    data = stream[start:start + int(_LENGTH.search(head).group(1))]
+    if b'/ASCII85Decode' in filters:
+        data = base64.a85decode(data.rstrip()[:-2])
+    if b'/FlateDecode' in filters:
+        data = zlib.decompress(data)
+    data = zlib.compress(b'q\n' + data + b'\nQ\n' + ops)
+    head = head[:m.start()] + head[m.end():] if m else head
+    head = _LENGTH.sub(b'/Filter [ /FlateDecode ] /Length %d' % len(data), head, 1)
+    return head, b'stream\n' + data + b'\nendstream\n'
+
+
+def merge(paths, out_path, overlays=None, links=None, pages=None):
+    """Write the fragments at paths to out_path as one PDF.
+
+    pages lists the merged document's pages as (fragment index, 0-based
+    page in that fragment); by default every page of every fragment, in
+    order. Pages not listed are left out. overlays maps 0-based page
+    indexes in the merged document to the Overlay to draw on that page.
+    links maps a page index to [((x1, y1, x2, y2), target page index)],
+    link annotations to add to the page. Returns the number of pages."""
+    overlays = overlays or {}
+    links = links or {}
+    fragments = [_Fragment(p) for p in paths]
+    if pages is None:
+        pages = [(n, j) for n, frag in enumerate(fragments) for j in range(len(frag.kids))]
+    order = [(n, fragments[n].kids[j]) for n, j in pages]
+    index = {page: i for i, page in enumerate(order)}
+    if len(index) != len(order):
+        raise ValueError("a page is listed more than once")
+
+    body = [None, None]   # (dictionary, stream) by new number - 1
+    pages_num, root_num = 1, 2
+
+    fonts = {}            # base font -> object number
+    for name in sorted({f for o in overlays.values() for f in o.fonts}):
+        body.append((f"<<\n/BaseFont /{name} /Encoding /WinAnsiEncoding "
+                     f"/Name /{OVERLAY_PREFIX}{name} /Subtype /Type1 "
+                     f"/Type /Font\n>>\n".encode('latin-1'), b''))
+        fonts[name] = len(body)
+    font_refs = b''.join(b'/%s%s %d 0 R ' % (OVERLAY_PREFIX.encode(), name.encode(), num)
+                         for name, num in fonts.items())
+
+    # Number every kept object first: a link can point at any later page.
+    plans = []            # (fragment, objects kept, old -> new number)
+    count = len(body)
+    for n, frag in enumerate(fragments):
+        dropped = {frag.root, frag.pages, frag.info}
+        for kid in frag.kids:
+            if (n, kid) not in index:
+                dropped.add(kid)
+                dropped.update(int(c) for c in re.findall(rb'/Contents (\d+) 0 R',
+                                                          frag.objects[kid][0]))
+        keep = [o for o in frag.objects if o not in dropped]
+        if n == 0:
+            keep.append(frag.info)
+        numbers = {old: count + i + 1 for i, old in enumerate(keep)}
+        numbers[frag.pages] = pages_num
+        if n == 0:
+            numbers[frag.root] = root_num
+        count += len(keep)
+        plans.append((frag, keep, numbers))
+    kids = [plans[n][2][kid] for n, kid in order]
+    annots = {}           # page index -> [annotation object number]
+    for i in sorted(links):
+        annots[i] = list(range(count + 1, count + 1 + len(links[i])))
+        count += len(links[i])
+
+    info_num = None
+    for n, (frag, keep, numbers) in enumerate(plans):
+        def renumber(m, numbers=numbers, frag=frag):
+            try:
+                return b'%d 0 R' % numbers[int(m.group(1))]
+            except KeyError:
+                raise ValueError(f"{frag.path}: object {m.group(1).decode()} "
+                                 f"refers to a page left out") from None
+
+        contents = {}     # content stream object -> Overlay for its page
+        font_dicts = set()
+        page_annots = {}  # page object -> its new annotation numbers
+        for kid in frag.kids:
+            i = index.get((n, kid))
+            if i in annots:
+                if b'/Annots' in frag.objects[kid][0]:
+                    raise ValueError(f"{frag.path}: page {kid} already has /Annots")
+                page_annots[kid] = annots[i]
+            page = overlays.get(i)
+            if page is None:
+                continue
+            head = frag.objects[kid][0]
+            m = re.search(rb'/Contents (\d+) 0 R', head)
+            if m is None:
+                raise ValueError(f"{frag.path}: page {kid} has no single /Contents")
+            contents[int(m.group(1))] = page
+            m = re.search(rb'/Font (\d+) 0 R', head)
+            if m is None and page.fonts:
+                raise ValueError(f"{frag.path}: page {kid} has no shared /Font resources")
+            if m is not None:
+                font_dicts.add(int(m.group(1)))
+
+        for old in keep:
+            head, stream = frag.objects[old]
+            head = _REF.sub(renumber, head)
+            if old in contents:
+                head, stream = _overlaid(head, stream, contents[old].ops)
+            elif old in font_dicts:
+                # Overlay fonts join the fragment's shared font dictionary.
+                head = head.replace(b'<<\n', b'<<\n' + font_refs, 1)
+            elif old in page_annots:
+                refs = b' '.join(b'%d 0 R' % a for a in page_annots[old])
+                head = head.replace(b'<<\n', b'<<\n/Annots [ %s ] ' % refs, 1)
+            body.append((head, stream))
+        if n == 0:
+            body[root_num - 1] = (_REF.sub(renumber, frag.objects[frag.root][0]), b'')
+            info_num = numbers[frag.info]
+
+    for i in sorted(links):
+        for (x1, y1, x2, y2), target in links[i]:
+            body.append((b'<<\n/Border [ 0 0 0 ] /Dest [ %d 0 R /Fit ] '
+                         b'/Rect [ %.2f %.2f %.2f %.2f ] /Subtype /Link /Type /Annot\n>>\n'
+                         % (kids[target], x1, y1, x2, y2), b''))
+
+    body[pages_num - 1] = (b'<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>\n'
+                           % (len(kids), b' '.join(b'%d 0 R' % k for k in kids)), b'')
+
+    out = io.BytesIO()
+    out.write(fragments[0].header)
+    offsets = []
+    for num, (head, stream) in enumerate(body, 1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n' % num + head + stream + b'endobj\n')
+    digest = hashlib.md5(out.getvalue()).hexdigest().encode('ascii')
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(body) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<<\n/ID \n[<%s><%s>]\n/Info %d 0 R\n/Root %d 0 R\n/Size %d\n>>\n'
+              b'startxref\n%d\n%%%%EOF\n'
+              % (digest, digest, info_num, root_num, len(body) + 1, xref))
+    with open(out_path, 'wb') as f:
+        f.write(out.getvalue())
+    return len(kids)
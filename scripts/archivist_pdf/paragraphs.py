@@ -0,0 +1,281 @@
+"""
+Paragraph with process-wide caches of parsed markup and line breaks.
+
+ReportLab's Paragraph runs its XML markup parser every time one is
+constructed. The products repeat a lot of text -- every Field Guide carries
+the same Four Doors, 90-day, crisis and template chapters, and the Complete
+Archive carries them again -- so this Paragraph keeps the parser's output
+keyed by (markup text, style values) and reuses it.
+
+Styles are keyed by value, not by object: each builder calls
+create_styles() afresh, and boxes derive one-off bullet styles, but equal
+styles produce equal fragments. Fragments are shared between paragraphs;
+layout only ever sets the same cached attributes on them and clones a
+fragment before changing its text.
+
+Once the fragments and the wrap widths are fixed, so are the line breaks.
+LINES keeps breakLines() results, pickled, keyed by a hash of (fragment
+key, widths); a hit unpickles a private copy, since splitting a paragraph
+edits its lines. A paragraph that BoxedContent wraps again at the same
+width reuses its own last result. A builder can attach a file under its
+cache directory to carry the breaks over to the next build:
+
+    LINES.attach(CACHE_DIR, 'archive')   # load; resets the counters
+    doc.build(story)
+    LINES.save()
+    print(LINES.summary())   # "Line-break cache: 900 hits (850 from disk), ..."
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import weakref
+
+from reportlab import Version as RL_VERSION
+from reportlab.platypus import Paragraph as _Paragraph
+from reportlab.platypus.paraparser import ParaParser
+from reportlab.platypus.paragraph import textTransformFrags
+
+
+class FragmentCache:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+        self._entries = {}
+        self._style_keys = weakref.WeakKeyDictionary()
+
+    def style_key(self, style):
+        key = self._style_keys.get(style)
+        if key is None:
+            key = tuple(sorted((k, repr(v)) for k, v in style.__dict__.items()
+                               if k not in ('name', 'parent')))
+            self._style_keys[style] = key
+        return key
+
+    def parse(self, text, style, case_sensitive):
+        """(key, cleaned text, frags, bullet frags) for text in style, or None if
+        the markup changes the style (a <para> tag) and cannot be shared."""
+        key = (text, self.style_key(style), case_sensitive)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        parser = ParaParser()
+        parser.caseSensitive = case_sensitive
+        parsed_style, frags, bullet_frags = parser.parse(text, style)
+        if frags is None:
+            raise ValueError("xml parser error (%s) in paragraph beginning\n'%s'"
+                             % (parser.errors[0], text[:min(30, len(text))]))
+        if parsed_style is not style:
+            return None
+        textTransformFrags(frags, style)
+        entry = (key, text, frags, bullet_frags)
+        self._entries[key] = entry
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def summary(self):
+        return (f"Paragraph cache: {self.hits} hits, {self.misses} parses "
+                f"({len(self._entries)} distinct)")
+
+
+FRAGMENTS = FragmentCache()
+
+
+# Bump when the shape of a stored entry changes.
+LINES_VERSION = 1
+
+
+class LineBreakCache:
+    def __init__(self):
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.enabled = True
+        self._blobs = {}         # digest -> pickled entry
+        self._from_disk = set()  # loaded by attach(), not looked up yet
+        self._used = set()       # digests this build looked up, for save()
+        self._path = None
+        self._saved = 0.0        # seconds of breakLines() skipped by hits
+        self._load_time = 0.0    # seconds spent unpickling hits
+
+    def attach(self, root, name):
+        """Use root/lines-v<N>-rl<version>/<name>.pickle as the disk tier
+        and reset the counters for a new build."""
+        self._path = root / f"lines-v{LINES_VERSION}-rl{RL_VERSION}" / f"{name}.pickle"
+        try:
+            with open(self._path, 'rb') as f:
+                stored = pickle.load(f)
+        except Exception:
+            # Missing or unreadable: start empty; save() overwrites it.
+            stored = {}
+        self._from_disk = stored.keys() - self._blobs.keys()
+        self._blobs.update(stored)
+        self._used = set()
+        self.hits = self.disk_hits = self.misses = 0
+        self._saved = self._load_time = 0.0
+
+    def break_lines(self, para, widths):
+        """para.breakLines(widths) as (broken lines, entry)."""
+        digest = _digest(para._frag_key, widths)
+        self._used.add(digest)
+        data = self._blobs.get(digest)
+        if data is not None:
+            t0 = time.perf_counter()
+            entry = pickle.loads(data)
+            self._load_time += time.perf_counter() - t0
+            if digest in self._from_disk:
+                self._from_disk.discard(digest)
+                self.disk_hits += 1
+            else:
+                self.hits += 1
+            self._saved += entry[3]
+            return _restore(para, entry), entry
+
+        t0 = time.perf_counter()
+        bl_para = _Paragraph.breakLines(para, widths)
+        cost = time.perf_counter() - t0
+        self.misses += 1
+        if para._splitLongWordCount or para._hyphenations:
+            # Split words do not pickle; leave these uncached.
+            self._used.discard(digest)
+            return bl_para, None
+        entry = (bl_para, para.frags if bl_para.kind == 1 else None,
+                 para._width_max, cost)
+        self._blobs[digest] = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        return bl_para, entry
+
+    def rewrap(self, entry):
+        """Count a paragraph re-wrapped at widths it has already broken for."""
+        self.hits += 1
+        self._saved += entry[3]
+
+    def save(self):
+        """Write the entries this build used to the attached file."""
+        if self._path is None or not self.enabled:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({d: self._blobs[d] for d in self._used}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            print(f"  [warn] Line-break cache not written: {e}")
+
+    def delta(self):
+        """The entries used and counters since the last delta() or attach(),
+        for merge() in another process; archivist_pdf.parallel's workers
+        send theirs back after each part."""
+        delta = ({d: self._blobs[d] for d in self._used},
+                 (self.hits, self.disk_hits, self.misses, self._saved, self._load_time))
+        self._used = set()
+        self.hits = self.disk_hits = self.misses = 0
+        self._saved = self._load_time = 0.0
+        return delta
+
+    def merge(self, delta):
+        """Count a worker's delta() as part of this build."""
+        blobs, (hits, disk_hits, misses, saved, load_time) = delta
+        self._blobs.update(blobs)
+        self._used.update(blobs)
+        self.hits += hits
+        self.disk_hits += disk_hits
+        self.misses += misses
+        self._saved += saved
+        self._load_time += load_time
+
+    def clear(self):
+        self._blobs.clear()
+        self._from_disk = set()
+        self._used = set()
+        self._path = None
+        self.hits = self.disk_hits = self.misses = 0
+        self._saved = self._load_time = 0.0
+
+    def summary(self):
+        saved_ms = (self._saved - self._load_time) * 1000
+        return (f"Line-break cache: {self.hits + self.disk_hits} hits "
+                f"({self.disk_hits} from disk), {self.misses} breaks, "
+                f"~{saved_ms:.0f} ms saved")
+
+
+_style_digests = {}
+
+
+def _digest(frag_key, widths):
+    """Stable name for a line-break entry, the same in every process."""
+    text, style_key, case_sensitive = frag_key
+    style = _style_digests.get(style_key)
+    if style is None:
+        style = _style_digests[style_key] = hashlib.blake2b(
+            repr(style_key).encode('utf-8'), digest_size=8).hexdigest()
+    h = hashlib.blake2b(text.encode('utf-8'), digest_size=16)
+    h.update(f"\0{style}\0{case_sensitive}\0{widths!r}".encode('ascii'))
+    return h.hexdigest()
+
+
+def _restore(para, entry):
+    """Apply breakLines()'s side effects on para from a cached entry."""
+    bl_para, frags, width_max, _ = entry
+    if frags is not None:
+        para.frags = frags
+    para.height = 0
+    para._width_max = width_max
+    para._splitLongWordCount = para._hyphenations = 0
+    return bl_para
+
+
+LINES = LineBreakCache()
+
+
+class Paragraph(_Paragraph):
+    """reportlab Paragraph that takes parsed fragments from FRAGMENTS and
+    line breaks from LINES."""
+
+    _frag_key = None  # FRAGMENTS key, when the fragments came from there
+    _broken = None    # (widths, entry) of the last breakLines() from LINES
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        if frags is None and FRAGMENTS.enabled:
+            entry = FRAGMENTS.parse(cleaner(text), style, self.caseSensitive)
+            if entry is not None:
+                self._frag_key, text, frags, bullet_frags = entry
+                if bullet_frags:
+                    bulletText = bullet_frags
+                self.text = text
+                self.frags = list(frags)
+                self.style = style
+                self.bulletText = bulletText
+                self.debug = 0
+                return
+        _Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+
+    def breakLines(self, width):
+        # A bullet narrows the first width in place; leave those uncached.
+        if (self._frag_key is None or self.bulletText or not LINES.enabled
+                or not isinstance(width, list)):
+            return _Paragraph.breakLines(self, width)
+        widths = tuple(width)
+        if self._broken is not None and self._broken[0] == widths:
+            entry = self._broken[1]
+            LINES.rewrap(entry)
+            return _restore(self, entry)
+        bl_para, entry = LINES.break_lines(self, widths)
+        self._broken = (widths, entry) if entry is not None else None
+        return bl_para
+
+    def split(self, availWidth, availHeight):
+        parts = _Paragraph.split(self, availWidth, availHeight)
+        # Splitting edits the broken lines in place; break afresh next time.
+        self._broken = None
+        return parts
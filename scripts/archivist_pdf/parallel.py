@@ -0,0 +1,338 @@
+"""
+Parallel layout: a story cut at its hard page breaks, laid out in several
+processes and merged into one PDF.
+
+Every part divider, chapter title page and pull quote ends with a top-level
+PageBreak, and layout after one does not depend on layout before it except
+through the page number. cut() splits the story after each of them,
+recording which page template the next page starts on; ParallelLayout packs
+those segments into a few parts of about equal weight, lays each part out
+in a forked worker as its own PDF, and merges the parts in order
+(archivist_pdf.merge). Page numbers are not known until every part is laid
+out, so the workers' templates leave them off and the merge draws them.
+
+    layout = ParallelLayout(make_doc, number_page, numbered=('body',))
+    pages = layout.build(story, path)
+    print(layout.summary())   # "Parallel layout: 108 segments in 8 parts,
+                              #  8 laid out on 4 worker(s), merge 140 ms"
+
+make_doc(path, numbered) returns the doc template; with numbered=False its
+page callbacks skip the number, which number_page(canvas, n) draws instead.
+With one worker, or where fork() is unavailable, build() is one plain
+doc.build() of the whole story with numbered=True.
+
+A builder that names its parts passes parts=[(key, story index)] and a
+PartCache (archivist_pdf.partcache): each named part is one fragment,
+cached parts are reused, and the rest are laid out -- in workers, or in
+this process with one worker -- and merged with them.
+
+Every layout also records the pages its marked flowables land on. With
+them a builder can pass cadence=, pages to insert by page count -- the
+archive's pull quotes (archivist_pdf.cadence) -- and contents=, a function
+returning its table of contents (archivist_pdf.toc), which is laid out once
+more, numbered, over the pages the story reserved for it. Either way even
+the one-worker build is laid out unnumbered and goes through the merge.
+
+Forked workers inherit the story, so DeferredFlowables expand (and lower
+their chapters) inside the worker. Line breaks the workers compute go back
+to LINES, and their watchdog reports to WATCHDOG; the other caches'
+counters stay in the workers.
+"""
+
+import bisect
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from reportlab import rl_config
+from reportlab.platypus import NextPageTemplate, PageBreak
+
+from archivist_pdf import toc
+from archivist_pdf.cadence import SLOT
+from archivist_pdf.merge import merge, overlay
+from archivist_pdf.paragraphs import LINES
+from archivist_pdf.watchdog import WATCHDOG
+
+# Parts per worker: more balances uneven chapters better, but every part
+# repeats its fonts and page chrome in the merged file.
+PARTS_PER_WORKER = 2
+
+
+def cut(story):
+    """The story as [(page template or None, start index, flowables)]
+    segments, each starting on a fresh page."""
+    segments = []
+    template = None
+    current = None
+    start = 0
+    for i, f in enumerate(story):
+        if isinstance(f, NextPageTemplate):
+            if isinstance(f.action[1], str):
+                template = f.action[1]
+        elif isinstance(f, PageBreak):
+            if getattr(f, 'nextTemplate', None):
+                template = f.nextTemplate
+            segments.append((current, start, story[start:i + 1]))
+            current, start = template, i + 1
+    if start < len(story):
+        segments.append((current, start, story[start:]))
+    return segments
+
+
+def _weight(flowables):
+    return sum(getattr(f, 'weight', 1) for f in flowables)
+
+
+def pack(segments, parts):
+    """Consecutive segments joined into at most parts lists of about equal
+    weight, as [(page template, flowables)]."""
+    total = sum(_weight(s) for _, _, s in segments)
+    packed = []
+    done = 0
+    for template, _, flowables in segments:
+        w = _weight(flowables)
+        # Start a new part once this one has its share of the weight.
+        if packed and done * parts < total * len(packed):
+            packed[-1][1].extend(flowables)
+        else:
+            packed.append((template, list(flowables)))
+        done += w
+    return packed
+
+
+def group(segments, parts):
+    """Segments joined into the builder's named parts, as
+    [(key, page template, flowables)]. parts is [(key, story index)] in
+    story order; a segment belongs to the last part that starts at or
+    before it."""
+    grouped = []
+    i = -1
+    for template, start, flowables in segments:
+        while i + 1 < len(parts) and parts[i + 1][1] <= start:
+            i += 1
+            grouped.append(None)
+        if grouped and grouped[-1] is not None:
+            grouped[-1][2].extend(flowables)
+        elif grouped:
+            grouped[-1] = (parts[i][0], template, list(flowables))
+        else:
+            grouped.append((None, template, list(flowables)))
+    return [g for g in grouped if g is not None]
+
+
+def _layout(make_doc, template, story, path):
+    """Lay story out to an unnumbered PDF at path, starting on template.
+    Returns (page templates, marks, LINES delta, WATCHDOG report), marks
+    being [(page index, key)] for the flowables laid out with a mark_key
+    (archivist_pdf.toc, archivist_pdf.cadence), in layout order."""
+    # Plain Flate streams: the merge rewrites every numbered page's stream,
+    # and ASCII85 is only 7-bit armour the final file does not need.
+    use_a85, rl_config.useA85 = rl_config.useA85, 0
+    try:
+        doc = make_doc(path, numbered=False)
+        if template is not None:
+            doc._firstPageTemplateIndex = [t.id for t in doc.pageTemplates].index(template)
+        templates = []
+        marks = []
+
+        def after_flowable(flowable):
+            key = getattr(flowable, 'mark_key', None)
+            if key is not None:
+                marks.append((len(templates), key))
+
+        doc.afterPage = lambda: templates.append(doc.pageTemplate.id)
+        doc.afterFlowable = after_flowable
+        doc.build(story)
+    finally:
+        rl_config.useA85 = use_a85
+    return templates, marks, LINES.delta(), WATCHDOG.report()
+
+
+_JOB = None   # (make_doc, [(page template, flowables, path)]), for forked workers
+
+
+def _layout_part(index):
+    make_doc, parts = _JOB
+    template, story, path = parts[index]
+    return _layout(make_doc, template, story, path)
+
+
+class ParallelLayout:
+    def __init__(self, make_doc, number_page, numbered=(), workers=None):
+        self.make_doc = make_doc
+        self.number_page = number_page
+        self.numbered = set(numbered)
+        self.workers = workers or os.cpu_count() or 1
+        self.segments = 0
+        self.parts = 0
+        self.laid_out = 0
+        self.used = 1
+        self.merge_time = 0.0
+        self.entries = 0
+
+    def build(self, story, path, parts=None, cache=None, contents=None, cadence=None):
+        """Lay story out into the PDF at path; returns the page count.
+
+        parts, [(key, story index)], names where each of the builder's parts
+        starts; with a PartCache, parts whose key is cached are reused and
+        only the rest are laid out. A None key is never cached.
+
+        contents() returns the flowables of the table of contents, whose
+        unnumbered copy the story holds; they are laid out again with the
+        page numbers of this layout and patched over it. A Cadence
+        (archivist_pdf.cadence) has its pages inserted at the story's Slots
+        by page count, before the contents are numbered."""
+        if self.workers < 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            self.workers = 1
+        segments = cut(story)
+        self.segments = len(segments)
+        serial = cache is None and (self.workers == 1 or len(segments) < 2)
+        if serial and contents is None and cadence is None:
+            self.parts = self.laid_out = self.used = 1
+            doc = self.make_doc(path, numbered=True)
+            doc.build(story)
+            return doc.page
+
+        with tempfile.TemporaryDirectory(prefix='archivist-layout-') as directory:
+            if serial:
+                # One fragment; the merge still numbers it, as pages may be
+                # inserted.
+                self.parts = self.laid_out = self.used = 1
+                todo = [(0, None, None, story, os.path.join(directory, "book.pdf"))]
+                results = [_layout(self.make_doc, None, story, todo[0][4])]
+                fragments = [None]
+            else:
+                todo, fragments = self._plan(segments, parts, cache, directory)
+                self.laid_out = len(todo)
+                self.used = max(1, min(self.workers, len(todo)))
+                results = self._run([(t, f, p) for _, _, t, f, p in todo])
+
+            reports = []
+            for (i, key, _, _, tmp), (templates, marks, lines, report) in zip(todo, results):
+                LINES.merge(lines)
+                reports.append(report)
+                fragments[i] = (cache.put(key, tmp, templates, marks) if key is not None
+                                else tmp, templates, marks)
+
+            t0 = time.perf_counter()
+            paths = [p for p, _, _ in fragments]
+            pages, templates, marks = [], [], []
+            for n, (_, page_templates, page_marks) in enumerate(fragments):
+                marks.extend((len(pages) + page, key) for page, key in page_marks)
+                pages.extend((n, j) for j in range(len(page_templates)))
+                templates.extend(page_templates)
+            if cadence is not None:
+                reports.append(self._cadence(cadence, paths, pages, templates, marks,
+                                             directory))
+            overlays, links = {}, {}
+            if contents is not None:
+                reports.append(self._contents(contents, paths, pages, templates, marks,
+                                              directory, links))
+            for i, template in enumerate(templates):
+                if template in self.numbered:
+                    overlays[i] = overlay(lambda c, n=i + 1: self.number_page(c, n))
+            WATCHDOG.start()
+            for report in reports:
+                if report is not None:
+                    WATCHDOG.merge(report)
+            count = merge(paths, path, overlays, links, pages)
+            self.merge_time = time.perf_counter() - t0
+        return count
+
+    def _plan(self, segments, parts, cache, directory):
+        """The parts to lay out, [(index, cache key, page template,
+        flowables, path)], and the fragments list with cached parts filled
+        in as (path, page templates, marks)."""
+        if parts:
+            jobs = group(segments, parts)
+        else:
+            jobs = [(None, t, f) for t, f in pack(segments, self.workers * PARTS_PER_WORKER)]
+        self.parts = len(jobs)
+        fragments = [None] * len(jobs)
+        todo = []
+        for i, (key, template, flowables) in enumerate(jobs):
+            if key is not None and cache is not None:
+                key = f"{key}-{template}"
+                fragments[i] = cache.get(key)
+                if fragments[i] is None:
+                    todo.append((i, key, template, flowables, cache.reserve(key)))
+            else:
+                todo.append((i, None, template, flowables,
+                             os.path.join(directory, f"part-{i:03d}.pdf")))
+        return todo, fragments
+
+    def _cadence(self, cadence, paths, pages, templates, marks, directory):
+        """Lay cadence's pages out and insert them at the slots it picks,
+        updating pages, templates and marks to match. Returns the layout's
+        WATCHDOG report, or None if no page was placed."""
+        at = cadence.place([page for page, key in marks if key == SLOT])
+        if not at:
+            return None
+        tmp = os.path.join(directory, "cadence.pdf")
+        page_templates, _, lines, report = _layout(self.make_doc, cadence.template,
+                                                   cadence.story(len(at)), tmp)
+        LINES.merge(lines)
+        if len(page_templates) != len(at):
+            raise ValueError(f"{len(at)} cadence pages laid out to {len(page_templates)}")
+        paths.append(tmp)
+        n = len(paths) - 1
+        # From the end, so the earlier slots' indexes stay put.
+        for j in reversed(range(len(at))):
+            pages.insert(at[j], (n, j))
+            templates.insert(at[j], page_templates[j])
+        marks[:] = [(page + bisect.bisect_right(at, page), key) for page, key in marks]
+        return report
+
+    def _contents(self, contents, paths, pages, templates, marks, directory, links):
+        """Lay the numbered contents out over the pages marks reserve for
+        them, updating pages and filling in links. Returns the layout's
+        WATCHDOG report, or None if nothing was laid out."""
+        span = toc.reserved(marks)
+        if span is None:
+            print("  [warn] Contents: no reserved pages in the story")
+            return None
+        first, count = span
+        story = contents()
+        for key in toc.number(story, marks):
+            print(f"  [warn] Contents: no page for {key!r}")
+        tmp = os.path.join(directory, "contents.pdf")
+        # Layout empties the list it is given; the lines keep their links.
+        page_templates, _, lines, report = _layout(self.make_doc, templates[first],
+                                                   list(story), tmp)
+        LINES.merge(lines)
+        if len(page_templates) != count:
+            print(f"  [warn] Contents: laid out to {len(page_templates)} pages, "
+                  f"{count} reserved; left unnumbered")
+            return report
+        paths.append(tmp)
+        pages[first:first + count] = [(len(paths) - 1, j) for j in range(count)]
+        links.update(toc.links(story, first))
+        self.entries = sum(isinstance(f, toc.ContentsLine) and f.page is not None
+                           for f in story)
+        return report
+
+    def _run(self, parts):
+        """_layout() each (page template, flowables, path), in workers when
+        there is more than one part and more than one worker."""
+        global _JOB
+        if self.used == 1 or len(parts) < 2:
+            return [_layout(self.make_doc, *part) for part in parts]
+        _JOB = (self.make_doc, parts)
+        try:
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(self.used, mp_context=context) as pool:
+                return list(pool.map(_layout_part, range(len(parts))))
+        finally:
+            _JOB = None
+
+    def summary(self):
+        if self.parts == 1 and self.laid_out == 1 and self.merge_time == 0:
+            return f"Parallel layout: off, {self.segments} segments on 1 worker"
+        text = (f"Parallel layout: {self.segments} segments in {self.parts} parts, "
+                f"{self.laid_out} laid out on {self.used} worker(s), "
+                f"merge {self.merge_time * 1000:.0f} ms")
+        if self.entries:
+            text += f", {self.entries} contents entries numbered"
+        return text
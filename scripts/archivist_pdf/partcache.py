@@ -0,0 +1,136 @@
+"""
+On-disk cache of laid-out parts: PDF fragments reused across builds.
+
+A builder that names its parts (an orientation section, each pattern, ...)
+gives each one a key over everything its pages depend on: the source text
+it reads, the pull quotes it places, the styles and the code that lays it
+out. archivist_pdf.parallel looks every part up here before layout, lays
+out only the misses, and merges hits and fresh fragments alike, so editing
+one pattern file re-lays out that pattern and nothing else.
+
+Fragments are stored without page numbers (the merge draws those), with
+the page template of each page and the contents marks laid out on them
+(archivist_pdf.toc) alongside, under
+root/parts-v<N>/<name>/<key>.pdf. Keys are "<part>-<digest>..."; save()
+drops the entries of the parts the last build used that it did not look
+up -- their superseded versions -- and leaves other parts alone, so builders
+that share some parts (the Field Guides) can share one directory.
+
+    cache = PartCache(CACHE_DIR, 'complete-archive')
+    version = code_version(CODE)        # CODE: the generator's deps.snapshot()
+    layout.build(story, path, parts=[...], cache=cache)
+    print(cache.summary())   # "Part cache: 1 laid out, 15 reused"
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import time
+
+import reportlab
+
+# Bump when the stored fragment or its metadata changes shape.
+PARTS_VERSION = 2
+
+# A .tmp file older than this was left by a build that died; newer ones may
+# belong to a build still running in another process.
+STALE_TMP = 3600
+
+_KEY = re.compile(r'(.+?)-[0-9a-f]{32}')   # part name, then its digest
+
+
+def code_version(code):
+    """Digest of the code that lays the parts out, an
+    archivist_pdf.deps.snapshot() taken when it was imported, and the
+    ReportLab version."""
+    h = hashlib.blake2b(reportlab.Version.encode('ascii'), digest_size=16)
+    for path in sorted(code):
+        h.update(f"\0{path.name}\0{code[path]}".encode('utf-8'))
+    return h.hexdigest()
+
+
+class PartCache:
+    def __init__(self, root, name, version=PARTS_VERSION):
+        self.dir = root / f"parts-v{version}" / name
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        self._reserved = set()   # temporary paths reserve() handed out
+
+    @staticmethod
+    def _part(key):
+        m = _KEY.match(key)
+        return m.group(1) if m else None
+
+    def get(self, key):
+        """(fragment path, page templates, marks) stored for key, or None."""
+        self._used.add(key)
+        try:
+            with open(self.dir / f"{key}.pickle", 'rb') as f:
+                templates, marks = pickle.load(f)
+        except Exception:
+            # Missing or unreadable: a miss; put() overwrites it.
+            self.misses += 1
+            return None
+        path = self.dir / f"{key}.pdf"
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return str(path), templates, marks
+
+    def reserve(self, key):
+        """A path to lay key's fragment out to, inside the cache directory."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.dir, prefix=f"{key}-", suffix='.tmp')
+        os.close(fd)
+        self._reserved.add(os.path.basename(tmp))
+        return tmp
+
+    def put(self, key, tmp, templates, marks):
+        """Store the fragment laid out at reserve()'s path; returns its path."""
+        path = self.dir / f"{key}.pdf"
+        try:
+            os.replace(tmp, path)
+            fd, meta = tempfile.mkstemp(dir=self.dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((templates, marks), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(meta, self.dir / f"{key}.pickle")
+        except OSError as e:
+            print(f"  [warn] Part cache not written: {e}")
+            return tmp
+        return str(path)
+
+    def save(self):
+        """Remove the other entries of the parts the last build looked up,
+        and temporary files no build is still writing."""
+        try:
+            names = os.listdir(self.dir)
+        except OSError:
+            return
+        parts = {self._part(key) for key in self._used}
+        stale = time.time() - STALE_TMP
+        for name in names:
+            key, ext = os.path.splitext(name)
+            if ext == '.tmp':
+                if name not in self._reserved and not self._older(name, stale):
+                    continue
+            elif key in self._used or self._part(key) not in parts:
+                continue
+            try:
+                os.remove(self.dir / name)
+            except OSError:
+                pass
+        self._used = set()
+        self._reserved = set()
+
+    def _older(self, name, when):
+        try:
+            return os.path.getmtime(self.dir / name) < when
+        except OSError:
+            return False
+
+    def summary(self):
+        return f"Part cache: {self.misses} laid out, {self.hits} reused"
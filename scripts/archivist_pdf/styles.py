@@ -0,0 +1,49 @@
+"""
+Derived paragraph styles, interned for the whole process.
+
+Boxes and cards derive small variations of a sheet style -- an indented
+bullet, an oblique tagline, a red title -- for every line they lower, and
+each builder's create_styles() makes its sheet afresh. STYLES.derive()
+creates each (parent values, overrides) combination once and hands the same
+object to every later request, from any builder, so the styles built for
+the Complete Archive serve every Field Guide after it, and per-style state
+keyed on the object (FRAGMENTS' style keys) is computed once.
+
+    style = STYLES.derive(S['callout_body'], leftIndent=16)
+    print(STYLES.summary())   # "Style registry: 4200 derived, 6 distinct"
+
+Interned styles are shared; never change one after deriving it.
+"""
+
+from reportlab.lib.styles import ParagraphStyle
+
+from archivist_pdf.paragraphs import FRAGMENTS
+
+
+class StyleRegistry:
+    def __init__(self):
+        self.requests = 0
+        self._styles = {}   # (parent value key, overrides) -> ParagraphStyle
+
+    def derive(self, parent, **overrides):
+        """ParagraphStyle(parent=parent, **overrides), created once per value."""
+        self.requests += 1
+        key = (FRAGMENTS.style_key(parent),
+               tuple(sorted((k, repr(v)) for k, v in overrides.items())))
+        style = self._styles.get(key)
+        if style is None:
+            style = ParagraphStyle(f"{parent.name}~{len(self._styles) + 1}",
+                                   parent=parent, **overrides)
+            self._styles[key] = style
+        return style
+
+    def clear(self):
+        self._styles.clear()
+        self.requests = 0
+
+    def summary(self):
+        return (f"Style registry: {self.requests} derived, "
+                f"{len(self._styles)} distinct")
+
+
+STYLES = StyleRegistry()
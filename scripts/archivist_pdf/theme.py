@@ -0,0 +1,29 @@
+"""
+Palette and page geometry shared by the dark-theme generators.
+"""
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.colors import HexColor
+
+# ── Design Specs ──
+BG_DARK = HexColor("#1A1A1A")          # Background on ALL pages
+BG_CALLOUT = HexColor("#242424")       # Callout box background
+BG_CODE = HexColor("#222222")          # Code block background
+TEAL = HexColor("#14B8A6")             # Primary accent
+TEAL_DIM = HexColor("#0F7B6E")         # Dimmed teal
+GOLD = HexColor("#F59E0B")             # Gold nugget accent
+PINK = HexColor("#EC4899")
+WHITE = HexColor("#FFFFFF")            # Headers
+TEXT_PRIMARY = HexColor("#E5E5E5")     # Body text
+TEXT_SECONDARY = HexColor("#9CA3AF")   # Secondary text
+TEXT_DIM = HexColor("#6B7280")         # Dim text
+BORDER_COLOR = HexColor("#333333")     # Subtle borders
+RED_ACCENT = HexColor("#EF4444")       # Warning accent
+
+PAGE_W, PAGE_H = letter
+MARGIN_L = 0.75 * inch
+MARGIN_R = 0.75 * inch
+MARGIN_T = 0.7 * inch
+MARGIN_B = 0.7 * inch
+CONTENT_W = PAGE_W - MARGIN_L - MARGIN_R
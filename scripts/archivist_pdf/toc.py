@@ -0,0 +1,114 @@
+"""
+Table of contents with real page numbers, from a single layout pass.
+
+The contents come before the pages they list, so their numbers are not
+known when layout reaches them. Instead of laying the book out twice, the
+builder reserves the contents pages: its contents, with each entry a
+ContentsLine, are laid out in the pass with the number column left blank.
+The flowable that opens each entry's pages -- a part divider's label, a
+chapter title -- carries a key, given by mark(), and ParallelLayout records
+the page each marked flowable lands on from the doc's afterFlowable hook.
+After the pass it lays the contents out once more, alone and numbered, and
+the merge puts those pages in place of the reserved ones. The numbers sit
+in a fixed column, so both layouts take the same pages. Each numbered line
+links to its page.
+
+    def contents():                     # fresh flowables on every call
+        return [mark(Paragraph("CONTENTS", ...), CONTENTS),
+                ContentsLine("What This Is", "WHAT THIS IS", style), ...,
+                PageBreak()]
+
+    story.extend(contents())            # reserved, unnumbered
+    story.append(mark(Paragraph("WHAT THIS IS", ...), "WHAT THIS IS"))
+    layout.build(story, path, contents=contents)
+"""
+
+from reportlab.lib.enums import TA_RIGHT
+from reportlab.platypus import Flowable
+
+from archivist_pdf.paragraphs import Paragraph
+from archivist_pdf.styles import STYLES
+
+CONTENTS = 'contents'   # key of the contents pages themselves
+
+
+def mark(flowable, key):
+    """flowable, recorded as the start of key's pages when it is laid out.
+    The first flowable marked with a key wins."""
+    flowable.mark_key = key
+    return flowable
+
+
+class ContentsLine(Flowable):
+    """One contents entry: its label, and key's page number right-aligned
+    in a fixed column. page is the 0-based page index number() fills in;
+    None leaves the column blank."""
+
+    NUMBER_W = 40
+
+    def __init__(self, text, key, style):
+        Flowable.__init__(self)
+        self.key = key
+        self.mark_key = CONTENTS
+        self.style = style
+        self.label = Paragraph(text, style)
+        self.page = None
+        self.links = []   # (page drawn on, rect) for each numbered draw
+
+    def wrap(self, availWidth, availHeight):
+        _, height = self.label.wrap(availWidth - self.NUMBER_W, availHeight)
+        self.width, self.height = availWidth, height
+        return self.width, self.height
+
+    def getSpaceBefore(self):
+        return self.label.getSpaceBefore()
+
+    def getSpaceAfter(self):
+        return self.label.getSpaceAfter()
+
+    def draw(self):
+        self.label.drawOn(self.canv, 0, 0)
+        if self.page is None:
+            return
+        number = Paragraph(str(self.page + 1), STYLES.derive(
+            self.style, alignment=TA_RIGHT, leftIndent=0, firstLineIndent=0))
+        _, height = number.wrap(self.NUMBER_W, self.height)
+        number.drawOn(self.canv, self.width - self.NUMBER_W, self.height - height)
+        x, y = self.canv.absolutePosition(0, 0)
+        self.links.append((self.canv.getPageNumber() - 1,
+                           (x, y, x + self.width, y + self.height)))
+
+
+def reserved(marks):
+    """(first page, page count) of the contents among marks, [(page, key)]
+    in layout order; None if there are none."""
+    pages = [page for page, key in marks if key == CONTENTS]
+    if not pages:
+        return None
+    return pages[0], pages[-1] - pages[0] + 1
+
+
+def number(story, marks):
+    """Give every ContentsLine in story the page its key was first marked
+    on. Returns the keys that were never marked."""
+    first = {}
+    for page, key in marks:
+        first.setdefault(key, page)
+    missing = []
+    for line in story:
+        if isinstance(line, ContentsLine):
+            line.page = first.get(line.key)
+            if line.page is None:
+                missing.append(line.key)
+    return missing
+
+
+def links(story, start):
+    """{page index: [(rect, target page index)]} for the numbered lines of
+    story, laid out from page start on."""
+    out = {}
+    for line in story:
+        if isinstance(line, ContentsLine):
+            for page, rect in line.links:
+                out.setdefault(start + page, []).append((rect, line.page))
+    return out
@@ -0,0 +1,73 @@
+"""
+Content tree watcher: wait for edits, then for the burst of saves to end.
+
+Polls the modification time and size of every matching file under a
+directory -- a stat per file, about 2 ms for the whole content tree -- so it
+needs nothing beyond the standard library and sees edits from any editor,
+including the write-to-temp-and-rename kind. An editor saving several files,
+or one file several times, is one change: wait() returns once the tree has
+been quiet for DEBOUNCE seconds.
+
+    watcher = ContentWatcher(CONTENT_DIR)
+    while True:
+        paths, saved = watcher.wait()   # changed paths, time.time() of the save
+        ...
+"""
+
+import os
+import time
+
+POLL_INTERVAL = 0.1   # seconds between scans
+DEBOUNCE = 0.2        # seconds the tree must stay unchanged
+
+
+class ContentWatcher:
+    def __init__(self, root, suffix='.md', interval=POLL_INTERVAL, debounce=DEBOUNCE):
+        self.root = root
+        self.suffix = suffix
+        self.interval = interval
+        self.debounce = debounce
+        self._state = self.scan()
+
+    def scan(self):
+        """{path: (mtime_ns, size)} for every matching file."""
+        state = {}
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(self.suffix):
+                    path = os.path.join(directory, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue   # removed between listing and stat
+                    state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def _changed(self, state):
+        return {p for p in state.keys() | self._state.keys()
+                if state.get(p) != self._state.get(p)}
+
+    def wait(self):
+        """Block until files are added, removed or changed and then left
+        alone for the debounce time. Returns (sorted changed paths, the
+        time.time() of the earliest save among them)."""
+        while True:
+            time.sleep(self.interval)
+            state = self.scan()
+            changed = self._changed(state)
+            if changed:
+                break
+        seen = time.time()
+        quiet = time.monotonic()
+        self._state, pending = state, changed
+        while time.monotonic() - quiet < self.debounce:
+            time.sleep(self.interval)
+            state = self.scan()
+            changed = self._changed(state)
+            if changed:
+                self._state = state
+                pending |= changed
+                quiet = time.monotonic()
+        saves = [self._state[p][0] / 1e9 for p in pending if p in self._state]
+        # A removal has no save time; count from when it was seen.
+        return sorted(pending), min(saves, default=seen)
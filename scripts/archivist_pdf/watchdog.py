@@ -0,0 +1,244 @@
+"""
+Layout watchdog: doc.build() either finishes in bounded time or says why not.
+
+A flowable that is taller than a frame and cannot split -- a long code box,
+a table with one huge row -- makes Platypus either give up with a bare
+LayoutError after all the work before it, or, with a split that never gets
+smaller, run on page after page. WatchedDocTemplate runs every build under
+WATCHDOG, which watches how much of each page's frames the story fills:
+
+  - a flowable Platypus cannot place (LayoutError) is shrunk to fit one
+    frame (KeepInFrame) and the build carries on, with a warning naming it;
+  - STALL_PAGES pages in a row with nothing drawn that takes up height --
+    the same remainder carried from page to page -- shrink the flowable at
+    the front of the story the same way. A table or box splitting across
+    many pages leaves the story as long as before, but draws its rows;
+  - a build still running after LAYOUT_TIMEOUT seconds, or an element that
+    fails again once shrunk, stops with LayoutStall. Where SIGALRM exists
+    the timeout also interrupts a wrap() or split() that never returns.
+
+Warnings and errors name the flowable type, the page and the markdown file
+and line it was lowered from. Lowering tags code, table and box flowables
+with _source = (path, line); the path comes from SourceText, the str that
+the builders' load_file() returns. Untagged flowables (split pieces, plain
+paragraphs) are reported against the last tagged one laid out before them.
+
+    doc = WatchedDocTemplate(path, pagesize=letter, ...)
+    doc.build(story)
+    print(WATCHDOG.summary())   # "Layout watchdog: 612 pages laid out in 2.4 s, 0 shrunk, 0 warnings"
+"""
+
+import contextlib
+import signal
+import threading
+import time
+
+from reportlab.platypus import BaseDocTemplate, KeepInFrame, LayoutError
+
+LAYOUT_TIMEOUT = 300   # seconds one doc.build() may take
+STALL_PAGES = 25       # pages in a row without any height drawn
+
+
+class LayoutStall(LayoutError):
+    """doc.build() made no progress; the message names the flowable."""
+
+
+class SourceText(str):
+    """Markdown text that remembers the file it was read from."""
+
+    def __new__(cls, text, path):
+        self = str.__new__(cls, text)
+        self.path = path
+        return self
+
+
+def source_of(text):
+    """The path SourceText text was read from, or None."""
+    return getattr(text, 'path', None)
+
+
+class LayoutWatchdog:
+    def __init__(self, timeout=LAYOUT_TIMEOUT, stall_pages=STALL_PAGES):
+        self.timeout = timeout
+        self.stall_pages = stall_pages
+        self.shrunk = []         # descriptions of elements shrunk to fit
+        self.warnings = 0        # problems flowables worked around themselves
+        self._start = None
+        self._deadline = None
+        self._took = 0.0
+        self._current = None     # flowable being handled
+        self._page = 0
+        self._drawn = 0.0        # height drawn since the last page began
+        self._still = 0          # pages in a row with none drawn
+        self._source = None      # last (path, line) laid out
+
+    def start(self):
+        """Reset the per-build state; WatchedDocTemplate.build() calls it."""
+        self._start = time.monotonic()
+        self._deadline = self._start + self.timeout
+        self._took = 0.0
+        self._current = None
+        self.shrunk = []
+        self.warnings = 0
+        self._page = 0
+        self._drawn = 0.0
+        self._still = 0
+        self._source = None
+
+    def check(self, doc, flowables):
+        """Called before each flowable is handled; raises LayoutStall."""
+        first = self._current = flowables[0]
+        source = getattr(first, '_source', None)
+        if source is not None:
+            self._source = source
+
+        if time.monotonic() > self._deadline:
+            self._timed_out()
+
+        if doc.page != self._page:
+            first_page = not self._page
+            self._page = doc.page
+            if self._drawn or first_page:
+                self._drawn = 0.0
+                self._still = 0
+                return
+            self._still += 1
+            if self._still >= self.stall_pages:
+                self._still = 0
+                reason = f"no progress for {self.stall_pages} pages"
+                flowables[0] = self.shrink(first, doc, reason)
+
+    def drew(self, height):
+        """Count height taken up in a frame by the flowable just handled."""
+        self._drawn += height
+
+    @contextlib.contextmanager
+    def alarm(self):
+        """Raise LayoutStall from wherever layout is once the timeout passes,
+        where the platform and thread allow a SIGALRM handler."""
+        if (not hasattr(signal, 'setitimer')
+                or threading.current_thread() is not threading.main_thread()):
+            yield
+            return
+
+        def expired(signum, frame):
+            self._timed_out()
+
+        previous = signal.signal(signal.SIGALRM, expired)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    def finish(self):
+        self._took = time.monotonic() - self._start
+
+    def _timed_out(self):
+        raise LayoutStall(f"Layout still running after {self.timeout} s, "
+                          f"{self.describe(self._current, self._page)}")
+
+    def recover(self, doc, first, flowables, error):
+        """Shrink first after Platypus failed to place it, or re-raise."""
+        if isinstance(error, LayoutStall) or getattr(first, '_shrunk', False):
+            raise LayoutStall(f"{error}\n{self.describe(first, doc.page)}") from error
+        shrunk = self.shrink(first, doc, str(error).split('\n')[0])
+        if flowables and flowables[0] is first:
+            flowables[0] = shrunk
+        else:
+            flowables.insert(0, shrunk)
+
+    def shrink(self, flowable, doc, reason):
+        """flowable scaled to fit one frame, after a warning."""
+        if getattr(flowable, '_shrunk', False):
+            raise LayoutStall(f"{reason}, {self.describe(flowable, doc.page)}")
+        where = self.describe(flowable, doc.page)
+        print(f"  [warn] Layout: {reason}; shrinking {where}")
+        self.shrunk.append(where)
+        if hasattr(flowable, '_postponed'):
+            del flowable._postponed
+        fitted = KeepInFrame(0, 0, [flowable], mode='shrink')
+        fitted._shrunk = True
+        return fitted
+
+    def warn(self, owner, message):
+        """Report a problem a flowable worked around without failing."""
+        self.warnings += 1
+        print(f"  [warn] Layout: {type(owner).__name__} {message}, "
+              f"{self._where(getattr(owner, '_source', None))}")
+
+    def swallowed(self, owner, child, error):
+        """Report an exception a container caught from one of its children."""
+        self.warn(owner, f"child {type(child).__name__} failed "
+                         f"({type(error).__name__}: {error})")
+
+    def describe(self, flowable, page):
+        return f"{type(flowable).__name__} on page {page}, " \
+               f"{self._where(getattr(flowable, '_source', None))}"
+
+    def _where(self, source):
+        if source is not None:
+            prefix = "from"
+        else:
+            source, prefix = self._source, "after"
+        if source is None:
+            return "source unknown"
+        path, line = source
+        return f"{prefix} {path or '<text>'} line {line}"
+
+    def report(self):
+        """Pages, time, shrunk elements and warnings of the last build, for
+        merge()."""
+        return self._page, self._took, list(self.shrunk), self.warnings
+
+    def merge(self, report):
+        """Count another build's report() as part of this one."""
+        pages, took, shrunk, warnings = report
+        self._page += pages
+        self._took += took
+        self.shrunk.extend(shrunk)
+        self.warnings += warnings
+
+    def summary(self):
+        """Counts every page each build laid out: with merge(), a page laid
+        out twice (the reserved contents, archivist_pdf.toc) counts twice."""
+        return (f"Layout watchdog: {self._page} pages laid out in {self._took:.1f} s, "
+                f"{len(self.shrunk)} shrunk, {self.warnings} warnings")
+
+
+WATCHDOG = LayoutWatchdog()
+
+
+class WatchedDocTemplate(BaseDocTemplate):
+    """BaseDocTemplate whose build() runs under WATCHDOG."""
+
+    def build(self, flowables, *args, **kw):
+        WATCHDOG.start()
+        try:
+            with WATCHDOG.alarm():
+                BaseDocTemplate.build(self, flowables, *args, **kw)
+        finally:
+            WATCHDOG.finish()
+
+    def handle_flowable(self, flowables):
+        # Platypus calls filterFlowables() again; on an expanded head it is a no-op.
+        self.filterFlowables(flowables)
+        if flowables[0] is None:
+            return BaseDocTemplate.handle_flowable(self, flowables)
+        WATCHDOG.check(self, flowables)
+        first = flowables[0]
+        frame = getattr(self, 'frame', None)
+        top = frame._y if frame is not None else None
+        try:
+            BaseDocTemplate.handle_flowable(self, flowables)
+        except LayoutError as e:
+            WATCHDOG.recover(self, first, flowables, e)
+        else:
+            # A frame end resets the frame's _y to its top, so only a drop
+            # in the same frame counts: the flowable, or its first split
+            # piece, drawn. An element shrunk by the watchdog is a stand-in
+            # for a stuck one, not progress.
+            if (self.frame is frame and top is not None and frame._y < top
+                    and not getattr(first, '_shrunk', False)):
+                WATCHDOG.drew(top - frame._y)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - block parse scaling benchmark
+
+Concatenates every markdown file in the-archivist-method/ into one document
+and runs the Complete Archive's markdown pipeline over it at 1x, 2x and 4x
+size. Per-line cost should stay flat as the document grows. The three
+stages are timed on their own: classify_lines(), parse_blocks() (which
+includes classification) and lowering the blocks to flowables.
+
+Usage:
+    python3 scripts/benchmarks/block_parse.py
+    python3 scripts/benchmarks/block_parse.py --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_complete_archive as gca  # noqa: E402
+from archivist_pdf.blocks import (  # noqa: E402
+    TableBlock, classify_lines, parse_blocks)
+from archivist_pdf.lower import FlowableLowering  # noqa: E402
+
+CONTENT_ROOT = SCRIPTS_DIR.parent / "the-archivist-method"
+TWO_ROW_TABLE = "| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |"
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def check_table_lines(doc, blocks):
+    """Every TableBlock's line must be its header row's 1-based source
+    line, the location the layout watchdog reports."""
+    lines = doc.split('\n')
+    for b in blocks:
+        if not isinstance(b, TableBlock):
+            continue
+        if not isinstance(b.line, int) or not lines[b.line - 1].lstrip().startswith('|'):
+            raise SystemExit(f"TableBlock.line is {b.line!r}, not a table's source line")
+        if b.line > 1 and lines[b.line - 2].lstrip().startswith('|'):
+            raise SystemExit(f"TableBlock.line {b.line} is not the table's first line")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--repeat', type=int, default=3,
+                    help='timing rounds; the best round is reported')
+    args = ap.parse_args()
+
+    files = sorted(CONTENT_ROOT.rglob('*.md'))
+    corpus = '\n\n'.join(p.read_text(encoding='utf-8') for p in files)
+    for doc in (TWO_ROW_TABLE, corpus):
+        check_table_lines(doc, parse_blocks(doc))
+    lowering = FlowableLowering(gca.create_styles(),
+                                skip_roles=('section', 'title'))
+
+    print(f"\n{'='*60}")
+    print("  BLOCK PARSE BENCHMARK")
+    print(f"  Source: {CONTENT_ROOT} ({len(files)} files)")
+    print(f"{'='*60}\n")
+    print(f"  {'size':>5} {'lines':>8} {'classify':>12} {'blocks':>12} "
+          f"{'lower':>12} {'us/line':>9}")
+
+    for mult in (1, 2, 4):
+        doc = '\n\n'.join([corpus] * mult)
+        lines = doc.split('\n')
+        blocks = parse_blocks(doc)
+        t_cls = best_of(lambda: classify_lines(lines), args.repeat)
+        t_blk = best_of(lambda: parse_blocks(doc), args.repeat)
+        t_low = best_of(lambda: lowering.lower(blocks), args.repeat)
+        per_line = (t_blk + t_low) / len(lines) * 1e6
+        print(f"  {mult:>4}x {len(lines):>8} {t_cls * 1000:>9.1f} ms "
+              f"{t_blk * 1000:>9.1f} ms {t_low * 1000:>9.1f} ms {per_line:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
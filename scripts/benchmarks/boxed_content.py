@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - BoxedContent measurement benchmark
+
+Builds the Complete Archive twice in fresh processes: once as shipped, where
+BoxedContent wraps each child once per inner width, and once with that memo
+cleared before every use, which re-wraps every child in each wrap(),
+split() and draw() as the box used to. Reports build time and how many
+child wraps the boxes made and the CPU time spent in them, with the
+line-break cache on and off.
+
+PDFs are written to outputs/ as in a normal build.
+
+Usage:
+    python3 scripts/benchmarks/boxed_content.py
+    python3 scripts/benchmarks/boxed_content.py --repeat 5
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def child(memo, lines, repeat):
+    import generate_complete_archive as gca
+    from archivist_pdf.flowables import BoxedContent
+    from archivist_pdf.paragraphs import LINES
+
+    LINES.enabled = lines
+    measure = BoxedContent._child_heights
+    wraps = [0, 0.0]   # child wraps, seconds spent in them
+
+    def counted(self, availHeight):
+        if not memo:
+            self._measured = None
+        if self._measured is not None and self._measured[0] == self._inner_width():
+            return self._measured[1]
+        wraps[0] += len(self._content)
+        t0 = time.process_time()
+        heights = measure(self, availHeight)
+        wraps[1] += time.process_time() - t0
+        return heights
+
+    BoxedContent._child_heights = counted
+    best = None
+    for _ in range(repeat):
+        wraps[:] = [0, 0.0]
+        t0 = time.process_time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            gca.CompleteArchiveBuilder().build()
+        elapsed = time.process_time() - t0
+        if best is None or elapsed < best['build']:
+            best = {'build': elapsed, 'wraps': wraps[0], 'in_wraps': wraps[1]}
+    print(json.dumps(best))
+
+
+def run(memo, lines, repeat):
+    out = subprocess.run(
+        [sys.executable, __file__, '--child', str(int(memo)), str(int(lines)),
+         '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--repeat', type=int, default=3,
+                    help='builds per process; the best is reported')
+    ap.add_argument('--child', nargs=2, type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(bool(args.child[0]), bool(args.child[1]), args.repeat)
+        return
+
+    print(f"\n{'='*60}")
+    print("  BOXEDCONTENT MEASUREMENT BENCHMARK")
+    print(f"  Complete Archive, best of {args.repeat} builds (CPU time)")
+    print(f"{'='*60}\n")
+    print(f"  {'line cache':>10} {'children':>10} {'child wraps':>12} "
+          f"{'in wraps':>10} {'build':>10}")
+    for lines in (False, True):
+        for memo in (False, True):
+            r = run(memo, lines, args.repeat)
+            print(f"  {'on' if lines else 'off':>10} "
+                  f"{'memo' if memo else 're-wrap':>10} {r['wraps']:>12} "
+                  f"{r['in_wraps'] * 1000:>7.0f} ms {r['build']:>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - emoji filter benchmark
+
+Feeds every line of every markdown file in the-archivist-method/ through
+the old per-call regex strip_emoji() from generate-archive-pdf.py and
+through archivist_pdf.glyphs.strip_emoji, and checks they agree.
+
+Two numbers per implementation:
+    per call    one strip of every line
+    per line    what parse_markdown() paid per line: the old code stripped
+                the line and then clean_text() stripped it again, the new
+                code strips it once
+
+Usage:
+    python3 scripts/benchmarks/emoji_filter.py
+    python3 scripts/benchmarks/emoji_filter.py --repeat 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from archivist_pdf.glyphs import strip_emoji  # noqa: E402
+
+CONTENT_ROOT = SCRIPTS_DIR.parent / "the-archivist-method"
+
+
+def legacy_strip_emoji(text):
+    """strip_emoji() as it was in generate-archive-pdf.py: compiled per call."""
+    emoji_pattern = re.compile(
+        "["
+        "\U0001F600-\U0001F64F"  # emoticons
+        "\U0001F300-\U0001F5FF"  # symbols & pictographs
+        "\U0001F680-\U0001F6FF"  # transport & map symbols
+        "\U0001F700-\U0001F77F"  # alchemical symbols
+        "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
+        "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+        "\U0001FA00-\U0001FA6F"  # Chess Symbols
+        "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+        "\U00002702-\U000027B0"  # Dingbats
+        "\U000024C2-\U0001F251"
+        "\U0001f926-\U0001f937"
+        "\U00010000-\U0010ffff"
+        "\u200d"
+        "\u2640-\u2642"
+        "\u2600-\u2B55"
+        "\u23cf"
+        "\u23e9"
+        "\u231a"
+        "\ufe0f"
+        "\u3030"
+        "\u2934"
+        "\u2935"
+        "\u25aa-\u25ab"
+        "\u25b6"
+        "\u25c0"
+        "\u25fb-\u25fe"
+        "\u2614-\u2615"
+        "\u2648-\u2653"
+        "\u267f"
+        "\u2693"
+        "\u26a1"
+        "\u26aa-\u26ab"
+        "\u26bd-\u26be"
+        "\u26c4-\u26c5"
+        "\u26ce"
+        "\u26d4"
+        "\u26ea"
+        "\u26f2-\u26f3"
+        "\u26f5"
+        "\u26fa"
+        "\u26fd"
+        "\u2702"
+        "\u2705"
+        "\u2708-\u270d"
+        "\u270f"
+        "\u2712"
+        "\u2714"
+        "\u2716"
+        "\u271d"
+        "\u2721"
+        "\u2728"
+        "\u2733-\u2734"
+        "\u2744"
+        "\u2747"
+        "\u274c"
+        "\u274e"
+        "\u2753-\u2755"
+        "\u2757"
+        "\u2763-\u2764"
+        "\u2795-\u2797"
+        "\u27a1"
+        "\u27b0"
+        "\u27bf"
+        "\u2b05-\u2b07"
+        "\u2b1b-\u2b1c"
+        "\u2b50"
+        "\u2b55"
+        "\u231a-\u231b"
+        "\u23e9-\u23f3"
+        "\u23f8-\u23fa"
+        "\U0001F48E"  # gem/diamond emoji
+        "]+", flags=re.UNICODE
+    )
+    return emoji_pattern.sub('', text)
+
+
+def time_fn(fn, lines, calls, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for s in lines:
+            for _ in range(calls):
+                fn(s)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--repeat', type=int, default=5,
+                    help='timing rounds; the best round is reported')
+    args = ap.parse_args()
+
+    files = sorted(CONTENT_ROOT.rglob('*.md'))
+    lines = [ln.rstrip() for p in files
+             for ln in p.read_text(encoding='utf-8').split('\n') if ln.strip()]
+    non_ascii = sum(1 for s in lines if not s.isascii())
+
+    legacy_call = time_fn(legacy_strip_emoji, lines, 1, args.repeat)
+    table_call = time_fn(strip_emoji, lines, 1, args.repeat)
+    legacy_line = time_fn(legacy_strip_emoji, lines, 2, args.repeat)
+
+    diffs = [s for s in lines if legacy_strip_emoji(s) != strip_emoji(s)]
+
+    n = len(lines)
+    print(f"\n{'='*60}")
+    print("  EMOJI FILTER BENCHMARK")
+    print(f"  Source: {CONTENT_ROOT}")
+    print(f"{'='*60}\n")
+    print(f"  Files:               {len(files)}")
+    print(f"  Lines:               {n}  ({non_ascii} with non-ASCII characters)")
+    print(f"  Regex, per call:     {legacy_call * 1000:8.2f} ms  "
+          f"{legacy_call / n * 1e6:6.2f} us/line")
+    print(f"  Table, per call:     {table_call * 1000:8.2f} ms  "
+          f"{table_call / n * 1e6:6.2f} us/line")
+    print(f"  Regex, per line:     {legacy_line * 1000:8.2f} ms  (strip + clean_text)")
+    print(f"  Table, per line:     {table_call * 1000:8.2f} ms  (one strip)")
+    print(f"  Speedup per call:    {legacy_call / table_call:.1f}x")
+    print(f"  Speedup per line:    {legacy_line / table_call:.1f}x")
+    print(f"  Output differs:      {len(diffs)} of {n}")
+    for s in diffs[:5]:
+        print(f"\n    input:  {s[:100]!r}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - inline markup micro-benchmark
+
+Runs the Complete Archive parse + lowering over every markdown file in
+the-archivist-method/, records each string it hands to the inline renderer
+(body paragraphs, bullets, numbered items, table cells, box lines), then
+times the old _esc + _inline regex chain against
+archivist_pdf.inline.render_inline on exactly those strings.
+
+Usage:
+    python3 scripts/benchmarks/inline_markup.py
+    python3 scripts/benchmarks/inline_markup.py --repeat 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_complete_archive as gca  # noqa: E402
+from archivist_pdf import lower  # noqa: E402
+from archivist_pdf.inline import render_inline  # noqa: E402
+
+CONTENT_ROOT = SCRIPTS_DIR.parent / "the-archivist-method"
+
+
+def legacy_inline(text):
+    """The chain MarkdownParser used before the tokenizer: _esc then _inline."""
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b><i>\1</i></b>', text)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
+    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
+    text = re.sub(r'`([^`]+)`',
+        lambda m: f'<font face="Courier" color="#14B8A6">{m.group(1)}</font>', text)
+    return text
+
+
+def collect_strings(root):
+    """Parse every chapter and capture the renderer's inputs."""
+    seen = []
+
+    def recording(text):
+        seen.append(text)
+        return render_inline(text)
+
+    parser = lower.FlowableLowering(gca.create_styles())
+    original = lower.render_inline
+    lower.render_inline = recording
+    try:
+        files = sorted(root.rglob('*.md'))
+        for path in files:
+            parser.parse(path.read_text(encoding='utf-8'))
+    finally:
+        lower.render_inline = original
+    return files, seen
+
+
+def time_fn(fn, strings, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for s in strings:
+            fn(s)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--repeat', type=int, default=10,
+                    help='timing rounds; the best round is reported')
+    args = ap.parse_args()
+
+    files, strings = collect_strings(CONTENT_ROOT)
+    chars = sum(len(s) for s in strings)
+
+    legacy = time_fn(legacy_inline, strings, args.repeat)
+    single = time_fn(render_inline, strings, args.repeat)
+
+    diffs = [s for s in strings if legacy_inline(s) != render_inline(s)]
+
+    n = len(strings)
+    print(f"\n{'='*60}")
+    print("  INLINE MARKUP BENCHMARK")
+    print(f"  Source: {CONTENT_ROOT}")
+    print(f"{'='*60}\n")
+    print(f"  Files:               {len(files)}")
+    print(f"  Strings rendered:    {n}  ({chars / max(n, 1):.0f} chars avg)")
+    print(f"  Legacy regex chain:  {legacy * 1000:8.2f} ms  "
+          f"{legacy / n * 1e6:6.2f} us/paragraph")
+    print(f"  Single-pass:         {single * 1000:8.2f} ms  "
+          f"{single / n * 1e6:6.2f} us/paragraph")
+    print(f"  Speedup:             {legacy / single:.2f}x")
+    print(f"  Output differs:      {len(diffs)} of {n}")
+    for s in diffs[:5]:
+        print(f"\n    input:  {s[:100]}")
+        print(f"    legacy: {legacy_inline(s)[:100]}")
+        print(f"    new:    {render_inline(s)[:100]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - paragraph fragment cache benchmark
+
+Builds all nine Field Guides and the Complete Archive in one process, first
+with archivist_pdf.paragraphs.FRAGMENTS disabled (every Paragraph runs the
+markup parser, as before) and then enabled, and reports build time and how
+many Paragraphs were parsed versus served from the cache.
+
+PDFs are written to outputs/ as in a normal build.
+
+Usage:
+    python3 scripts/benchmarks/paragraph_cache.py
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_complete_archive as gca  # noqa: E402
+import generate_field_guide as gfg  # noqa: E402
+from archivist_pdf.paragraphs import FRAGMENTS  # noqa: E402
+
+
+def build_all():
+    with contextlib.redirect_stdout(io.StringIO()):
+        for pnum in sorted(gfg.PATTERN_NAMES):
+            gfg.FieldGuideBuilder(pnum).build()
+        gca.CompleteArchiveBuilder().build()
+
+
+def run(enabled):
+    FRAGMENTS.clear()
+    FRAGMENTS.enabled = enabled
+    t0 = time.perf_counter()
+    build_all()
+    return time.perf_counter() - t0, FRAGMENTS.hits, FRAGMENTS.misses
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.parse_args()
+
+    # Warm-up: block cache, fonts, imports
+    run(False)
+    off, _, _ = run(False)
+    on, hits, misses = run(True)
+
+    print(f"\n{'='*60}")
+    print("  PARAGRAPH FRAGMENT CACHE BENCHMARK")
+    print("  Products: 9 Field Guides + Complete Archive, one process")
+    print(f"{'='*60}\n")
+    print(f"  Cache off:           {off:6.2f} s   every Paragraph parsed")
+    print(f"  Cache on:            {on:6.2f} s   {misses} parsed, {hits} reused")
+    print(f"  Paragraphs reused:   {hits / max(hits + misses, 1) * 100:.0f}%")
+    print(f"  Speedup:             {off / on:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - text width cache benchmark
+
+Builds the Complete Archive with archivist_pdf.metrics.WIDTHS installed and
+without it, each in a fresh process, with the line-break cache turned off so
+every paragraph is broken and every word measured. The first build in a
+process starts with an empty width table; later rounds reuse it, as the
+Field Guides do when several are built in one process.
+
+PDFs are written to outputs/ as in a normal build.
+
+Usage:
+    python3 scripts/benchmarks/text_widths.py
+    python3 scripts/benchmarks/text_widths.py --repeat 5
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def child(mode, repeat):
+    import generate_complete_archive as gca
+    from archivist_pdf.metrics import WIDTHS
+    from archivist_pdf.paragraphs import LINES
+
+    LINES.enabled = False
+    if mode == 'off':
+        WIDTHS.install = lambda *a, **k: None
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            gca.CompleteArchiveBuilder().build()
+        times.append(time.perf_counter() - t0)
+    print(json.dumps({'times': times, 'summary': WIDTHS.summary()}))
+
+
+def run(mode, repeat):
+    out = subprocess.run(
+        [sys.executable, __file__, '--child', mode, '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--repeat', type=int, default=3,
+                    help='builds per process; the first is reported as cold')
+    ap.add_argument('--child', choices=('on', 'off'), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.child, args.repeat)
+        return
+
+    off = run('off', args.repeat)
+    on = run('on', args.repeat)
+
+    print(f"\n{'='*60}")
+    print("  TEXT WIDTH CACHE BENCHMARK")
+    print(f"  Complete Archive, line-break cache off, {args.repeat} builds per process")
+    print(f"{'='*60}\n")
+    print(f"  {'':>12} {'cold':>10} {'warm (best)':>12}")
+    for label, r in (('widths off', off), ('widths on', on)):
+        warm = min(r['times'][1:]) if len(r['times']) > 1 else r['times'][0]
+        print(f"  {label:>12} {r['times'][0]:>8.2f} s {warm:>10.2f} s")
+    print(f"\n  {on['summary']} (all builds)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - Warm build daemon.
+
+Usage:
+    python3 build_daemon.py                      # JSON lines on stdin/stdout
+    python3 build_daemon.py --socket PATH        # serve on a Unix socket
+    python3 build_daemon.py --socket PATH --send field-guide-4 crash-course
+    python3 build_daemon.py --watch [PRODUCT...]   # rebuild on content edits
+
+The daemon imports ReportLab and the three generators, creates their style
+sheets and parses the whole content tree once, then builds on request.
+Every job runs in a child forked from that warm parent, so it starts with
+all of it in memory and leaves nothing behind; before each request the
+parent re-reads the content tree and parses whatever was edited since the
+last one. Children run the code the parent imported, and key the part
+cache and the dependency manifests by it (archivist_pdf.deps.snapshot), so
+once a generator or archivist_pdf is edited the daemon refuses to build
+until it is restarted. Requests are served one at a time; within a request the products
+build concurrently, one child per core (--workers to choose), with the
+Field Guides as one generate_field_guide.py batch.
+
+Requests and responses are one JSON object per line:
+
+    {"id": 1, "build": ["field-guide-4", "crash-course"]}
+    {"id": 2, "build": "changed"}      # what build_pdfs.py changed would build
+    {"id": 3, "build": "all"}
+
+    {"id": 1, "ok": true, "seconds": 0.61, "products": [
+        {"product": "field-guide-4", "output": "...", "pages": 100,
+         "kb": 179, "seconds": 0.38, "warnings": []}, ...]}
+
+Products are those of build_pdfs.py: complete-archive, crash-course,
+field-guide-1 ... field-guide-9. The daemon logs to stderr; with --send
+the client prints one line per product and exits non-zero on a failure.
+
+--watch builds the given products (all by default) that are out of date,
+then watches the-archivist-method/ (archivist_pdf/watch.py). After each
+burst of saves it rebuilds the watched products whose recorded inputs
+changed -- within each, only the parts whose sources changed are laid out
+again -- and prints how long after the save the PDFs were ready. After
+an edit to a generator or archivist_pdf it restarts itself, with the same
+arguments, before the next rebuild. The generators' --watch flags start
+this loop for their own products.
+"""
+
+import json
+import os
+import pickle
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+from build_pdfs import CACHE_DIR, GUIDES, PRODUCTS
+from archivist_pdf.deps import edited, stale
+from archivist_pdf.watch import ContentWatcher
+
+CONTENT_DIR = Path(__file__).parent.parent / "the-archivist-method"
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+# ══════════════════════════════════════════════════════════════
+# DAEMON
+# ══════════════════════════════════════════════════════════════
+
+class BuildDaemon:
+    def __init__(self, workers=None):
+        t0 = time.perf_counter()
+        # Imported here, not at the top, so --send does not pay for ReportLab.
+        import generate_complete_archive as archive
+        import generate_crash_course as crash
+        import generate_field_guide as guide
+        from archivist_pdf.cache import BlockCache
+        from archivist_pdf.metrics import WIDTHS
+
+        self.archive, self.crash, self.guide = archive, crash, guide
+        # What each generator hashed of its code as it was imported.
+        self.code = {**archive.CODE, **crash.CODE, **guide.CODE}
+        self.workers = workers or os.cpu_count() or 1
+        WIDTHS.install()
+        # One parse cache serves every generator: entries are keyed by text.
+        self.cache = BlockCache(CACHE_DIR)
+        self.styles = {
+            'archive': archive.create_styles(),
+            'crash': crash.create_styles(),
+            'guide': guide.create_styles(),
+        }
+        n, parsed = self.refresh()
+        log(f"  Build daemon ready in {time.perf_counter() - t0:.2f} s "
+            f"({n} sources, {parsed} parsed)")
+
+    def refresh(self):
+        """Parse the sources edited since the last request, here, so every
+        child inherits them. Returns (sources, parsed)."""
+        n, parsed, _ = self.cache.prefetch(sorted(CONTENT_DIR.rglob('*.md')))
+        return n, parsed
+
+    def handle(self, request):
+        """The response to one request."""
+        t0 = time.perf_counter()
+        response = {'id': request.get('id')}
+        products = request.get('build')
+        if products == 'changed':
+            products = [p for p in PRODUCTS if stale(CACHE_DIR, p)]
+        elif products == 'all':
+            products = list(PRODUCTS)
+        elif isinstance(products, str):
+            products = [products]
+        if not isinstance(products, list) or not set(products) <= set(PRODUCTS):
+            response.update(ok=False, error=f"unknown build {request.get('build')!r}")
+            return response
+        code = self.edited()
+        if code:
+            response.update(ok=False, error=f"{', '.join(code)} edited since the "
+                                            "daemon started; restart it")
+            return response
+
+        _, parsed = self.refresh()
+        if parsed:
+            log(f"  {parsed} edited source(s) parsed")
+        results = self._run(self._jobs(products))
+        response.update(ok=all('error' not in r for r in results),
+                        seconds=round(time.perf_counter() - t0, 3), products=results)
+        return response
+
+    def edited(self):
+        """The names of the code files that differ from what was imported."""
+        return sorted(path.name for path in edited(self.code))
+
+    def _jobs(self, products):
+        """[(products, build function)], the Field Guides as one batch."""
+        jobs = []
+        if 'complete-archive' in products:
+            jobs.append((['complete-archive'], self._build_archive))
+        if 'crash-course' in products:
+            jobs.append((['crash-course'], self._build_crash_course))
+        guides = [p for p in GUIDES if p in products]
+        if guides:
+            pnums = [int(p.rsplit('-', 1)[1]) for p in guides]
+            jobs.append((guides, lambda: self._build_guides(pnums)))
+        return jobs
+
+    def _build_archive(self):
+        builder = self.archive.CompleteArchiveBuilder(
+            styles=self.styles['archive'], cache=self.cache)
+        return [('complete-archive', builder.build(), builder.pages, None, None)]
+
+    def _build_crash_course(self):
+        builder = self.crash.CrashCourseBuilder(self.styles['crash'])
+        return [('crash-course', builder.build(), builder.pages, None, None)]
+
+    def _build_guides(self, pnums):
+        results = self.guide.build_guides(pnums, styles=self.styles['guide'],
+                                          cache=self.cache)
+        return [(f"field-guide-{pnum}", path, pages, took, warnings)
+                for pnum, path, pages, _, took, warnings, error in results if not error]
+
+    def _run(self, jobs):
+        """Run each job in a forked child, up to self.workers at a time;
+        returns the product results in job order."""
+        sys.stdout.flush()
+        sys.stderr.flush()
+        running = {}   # pid -> (job index, start, log file, result path)
+        done = {}
+        todo = list(enumerate(jobs))
+        with tempfile.TemporaryDirectory(prefix='archivist-daemon-') as directory:
+            while todo or running:
+                while todo and len(running) < self.workers:
+                    i, (_, build) = todo.pop(0)
+                    out = os.path.join(directory, f"job-{i}.log")
+                    result = os.path.join(directory, f"job-{i}.pickle")
+                    running[_fork(build, out, result)] = (i, time.perf_counter(), out, result)
+                pid, status = os.wait()
+                i, start, out, result = running.pop(pid)
+                done[i] = self._collect(jobs[i][0], status, time.perf_counter() - start,
+                                        out, result)
+        return [r for i in sorted(done) for r in done[i]]
+
+    @staticmethod
+    def _collect(products, status, took, out, result):
+        """Results for a finished child's products. Seconds and warnings
+        are the child's unless the build reported its own per product."""
+        with open(out, encoding='utf-8', errors='replace') as f:
+            lines = f.read().splitlines()
+        warnings = [line.strip() for line in lines if '[warn]' in line]
+        built = {}
+        if os.waitstatus_to_exitcode(status) == 0 and os.path.exists(result):
+            with open(result, 'rb') as f:
+                built = {r[0]: r for r in pickle.load(f)}
+        results = []
+        for product in products:
+            if product not in built:
+                results.append({'product': product, 'error': "build failed",
+                                'log': lines[-20:], 'warnings': warnings})
+                continue
+            _, path, pages, seconds, own = built[product]
+            results.append({
+                'product': product, 'output': path, 'pages': pages,
+                'kb': round(os.path.getsize(path) / 1024),
+                'seconds': round(took if seconds is None else seconds, 3),
+                'warnings': warnings if own is None else own,
+            })
+        return results
+
+    # ── Watching ──
+
+    def watch(self, products=PRODUCTS):
+        """Rebuild products whenever their sources change; runs until
+        interrupted."""
+        watcher = ContentWatcher(CONTENT_DIR)
+        self._rebuild(products)
+        log(f"  Watching {CONTENT_DIR} for {len(products)} product(s); Ctrl-C to stop")
+        try:
+            while True:
+                paths, saved = watcher.wait()
+                names = ', '.join(os.path.basename(p) for p in paths[:3])
+                more = f" (+{len(paths) - 3} more)" if len(paths) > 3 else ""
+                log(f"\n  [{time.strftime('%H:%M:%S')}] {len(paths)} file(s) "
+                    f"changed: {names}{more}")
+                response = self._rebuild(products)
+                if response is not None:
+                    log(f"  Refreshed {time.time() - saved:.2f} s after the save "
+                        f"(build {response['seconds']:.2f} s)")
+        except KeyboardInterrupt:
+            pass
+
+    def _rebuild(self, products):
+        """Build the out-of-date products; the response, or None if none were."""
+        code = self.edited()
+        if code:
+            log(f"  {', '.join(code)} edited; restarting")
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        todo = [p for p in products if stale(CACHE_DIR, p)]
+        if not todo:
+            log("  Nothing to rebuild")
+            return None
+        return self._logged(self.handle({'build': todo}))
+
+    # ── Serving ──
+
+    def serve_stdin(self):
+        for line in sys.stdin:
+            if line.strip():
+                print(json.dumps(self._respond(line)), flush=True)
+
+    def serve_socket(self, path):
+        if os.path.exists(path):
+            os.unlink(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+        log(f"  Listening on {path}")
+        # Stop on SIGTERM as on Ctrl-C, removing the socket either way.
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile('rw', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            f.write(json.dumps(self._respond(line)) + '\n')
+                            f.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            os.unlink(path)
+
+    def _respond(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'ok': False, 'error': f"bad request: {e}"}
+        return self._logged(self.handle(request))
+
+    @staticmethod
+    def _logged(response):
+        """response, after a line per product and its warnings on stderr."""
+        for r in response.get('products', []):
+            if 'error' in r:
+                log(f"  [warn] {r['product']}: {r['error']}")
+            else:
+                log(f"  {r['product']:<18} {r['pages']:>4} pages {r['kb']:>5} KB "
+                    f"{r['seconds']:>6.2f} s")
+            for warning in r['warnings']:
+                log(f"     {warning}")
+        return response
+
+
+def _fork(build, out, result):
+    """Run build() in a child with its output in out and its return value
+    pickled to result; returns the child's pid."""
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 1
+    try:
+        fd = os.open(out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        value = build()
+        with open(result, 'wb') as f:
+            pickle.dump(value, f)
+        code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+# ══════════════════════════════════════════════════════════════
+# CLIENT
+# ══════════════════════════════════════════════════════════════
+
+def send(path, products):
+    """Send one build request to the daemon at path; returns its response."""
+    build = products[0] if products in (['changed'], ['all']) else products
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(path)
+        with conn.makefile('rw', encoding='utf-8') as f:
+            f.write(json.dumps({'id': 1, 'build': build}) + '\n')
+            f.flush()
+            conn.shutdown(socket.SHUT_WR)
+            return json.loads(f.readline())
+
+
+def main():
+    args = sys.argv[1:]
+    workers = path = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    if '--socket' in args:
+        i = args.index('--socket')
+        path = args[i + 1]
+        del args[i:i + 2]
+
+    if '--watch' in args:
+        products = args[args.index('--watch') + 1:] or PRODUCTS
+        unknown = set(products) - set(PRODUCTS)
+        if unknown:
+            print(f"Error: unknown product(s) {', '.join(sorted(unknown))}")
+            sys.exit(1)
+        BuildDaemon(workers).watch(products)
+        return
+
+    if '--send' in args:
+        if path is None:
+            print(__doc__)
+            sys.exit(1)
+        response = send(path, args[args.index('--send') + 1:])
+        if 'error' in response:
+            print(f"  [warn] {response['error']}")
+            sys.exit(1)
+        for r in response['products']:
+            if 'error' in r:
+                print(f"  [warn] {r['product']}: {r['error']}")
+                print('\n'.join(f"     {line}" for line in r['log']))
+                continue
+            print(f"  {r['product']:<18} {r['pages']:>4} pages {r['kb']:>5} KB "
+                  f"{r['seconds']:>6.2f} s  {r['output']}")
+            for warning in r['warnings']:
+                print(f"     {warning}")
+        print(f"  Done in {response['seconds']:.2f} s")
+        sys.exit(0 if response['ok'] else 1)
+
+    daemon = BuildDaemon(workers)
+    if path is None:
+        daemon.serve_stdin()
+    else:
+        daemon.serve_socket(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+THE ARCHIVIST METHOD - Rebuild the PDFs whose sources changed.
+
+Usage:
+    python3 build_pdfs.py changed [--dry-run]   # only what is out of date
+    python3 build_pdfs.py all                   # every product
+
+Each generator saves the files it read, with their hashes, to
+.cache/deps-v1/<product>.json (archivist_pdf/deps.py). `changed` compares
+them with the files on disk: a product is rebuilt when one of its sources
+or its code changed, appeared or disappeared, when its PDF is missing, or
+when it was never built here. A fix to 4.1-the-90-day-map.md rebuilds the
+nine Field Guides and the Complete Archive; a fix to one pattern's
+what-it-is file rebuilds that guide and the archive. --dry-run only lists
+what would be rebuilt, and why.
+
+Stale Field Guides are built together by one generate_field_guide.py
+batch; it, the Complete Archive and the Crash Course run concurrently, up
+to one per core.
+
+Products:
+    complete-archive    crash-course    field-guide-1 ... field-guide-9
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from archivist_pdf.deps import stale
+
+SCRIPTS_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPTS_DIR.parent / ".cache"
+
+GUIDES = [f"field-guide-{n}" for n in range(1, 10)]
+PRODUCTS = ["complete-archive", "crash-course"] + GUIDES
+
+
+def jobs(products):
+    """[(label, command)] that build products, Field Guides in one batch."""
+    todo = []
+    if "complete-archive" in products:
+        todo.append(("complete-archive",
+                     [sys.executable, str(SCRIPTS_DIR / "generate_complete_archive.py")]))
+    if "crash-course" in products:
+        todo.append(("crash-course",
+                     [sys.executable, str(SCRIPTS_DIR / "generate_crash_course.py")]))
+    guides = [p.rsplit('-', 1)[1] for p in GUIDES if p in products]
+    if guides:
+        label = "field-guide-" + ",".join(guides)
+        todo.append((label, [sys.executable,
+                             str(SCRIPTS_DIR / "generate_field_guide.py"), *guides]))
+    return todo
+
+
+def run(job):
+    """Run one generator; returns (label, seconds, output, return code)."""
+    label, command = job
+    t0 = time.perf_counter()
+    done = subprocess.run(command, cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    return label, time.perf_counter() - t0, done.stdout + done.stderr, done.returncode
+
+
+def main():
+    args = sys.argv[1:]
+    dry_run = '--dry-run' in args
+    args = [a for a in args if a != '--dry-run']
+    if args not in (['changed'], ['all']):
+        print(__doc__)
+        sys.exit(1)
+
+    print(f"\n{'='*60}")
+    print(f"  PDF BUILD: {args[0]}")
+    print(f"{'='*60}\n")
+
+    todo = []
+    for product in PRODUCTS:
+        reasons = stale(CACHE_DIR, product) if args == ['changed'] else ["requested"]
+        if not reasons:
+            print(f"  {product:<18} up to date")
+            continue
+        more = f" (+{len(reasons) - 1} more)" if len(reasons) > 1 else ""
+        print(f"  {product:<18} rebuild: {reasons[0]}{more}")
+        todo.append(product)
+
+    if not todo:
+        print("\n  Nothing to rebuild.")
+        return
+    if dry_run:
+        print(f"\n  {len(todo)} of {len(PRODUCTS)} products would be rebuilt.")
+        return
+
+    work = jobs(todo)
+    workers = max(1, min(len(work), os.cpu_count() or 1))
+    print(f"\n  Rebuilding {len(todo)} of {len(PRODUCTS)} products "
+          f"({len(work)} generator runs on {workers} worker(s))...")
+    t0 = time.perf_counter()
+    failed = False
+    with ThreadPoolExecutor(workers) as pool:
+        for label, took, output, code in pool.map(run, work):
+            if code != 0:
+                failed = True
+                print(f"  [warn] {label}: failed (exit {code})")
+                print('\n'.join(f"     {line}" for line in output.splitlines()[-20:]))
+                continue
+            print(f"  {label:<18} built in {took:.2f} s")
+            for line in output.splitlines():
+                if '[warn]' in line:
+                    print(f"     {line.strip()}")
+    print(f"\n  Done in {time.perf_counter() - t0:.2f} s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,9 @@ from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Flowable
 from reportlab.pdfgen import canvas
 
+from archivist_pdf.chrome import static_chrome
+from archivist_pdf.glyphs import strip_emoji
+
 # Colors matching Crash Course PDF
 DARK_BG = HexColor('#1A1A1A')
 WHITE = HexColor('#FAFAFA')
@@ -142,8 +145,10 @@ def create_styles():
         ),
     }
 
-def draw_dark_background(canvas, doc):
-    """Draw dark background and teal footer line on every page"""
+@static_chrome
+def _dark_background_chrome(canvas, doc):
+    """Dark background, teal footer line and footer text, the same on every
+    page, so drawn once and placed by reference"""
     canvas.saveState()
     
     # Dark background
@@ -166,98 +171,25 @@ def draw_dark_background(canvas, doc):
     canvas.setFillColor(MEDIUM_GRAY)
     canvas.drawString(MARGIN + 175, 0.35*inch, "CLASSIFIED")
     
+    canvas.restoreState()
+
+def draw_dark_background(canvas, doc):
+    """Draw dark background and teal footer line on every page"""
+    _dark_background_chrome(canvas, doc)
+    
     # Page number
+    canvas.saveState()
     canvas.setFillColor(WHITE)
     canvas.setFont('Helvetica-Bold', 10)
     canvas.drawRightString(PAGE_WIDTH - MARGIN, 0.35*inch, str(doc.page))
-    
     canvas.restoreState()
 
-def strip_emoji(text):
-    """Remove all emoji characters from text"""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F700-\U0001F77F"  # alchemical symbols
-        "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
-        "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-        "\U0001FA00-\U0001FA6F"  # Chess Symbols
-        "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-        "\U00002702-\U000027B0"  # Dingbats
-        "\U000024C2-\U0001F251"
-        "\U0001f926-\U0001f937"
-        "\U00010000-\U0010ffff"
-        "\u200d"
-        "\u2640-\u2642"
-        "\u2600-\u2B55"
-        "\u23cf"
-        "\u23e9"
-        "\u231a"
-        "\ufe0f"
-        "\u3030"
-        "\u2934"
-        "\u2935"
-        "\u25aa-\u25ab"
-        "\u25b6"
-        "\u25c0"
-        "\u25fb-\u25fe"
-        "\u2614-\u2615"
-        "\u2648-\u2653"
-        "\u267f"
-        "\u2693"
-        "\u26a1"
-        "\u26aa-\u26ab"
-        "\u26bd-\u26be"
-        "\u26c4-\u26c5"
-        "\u26ce"
-        "\u26d4"
-        "\u26ea"
-        "\u26f2-\u26f3"
-        "\u26f5"
-        "\u26fa"
-        "\u26fd"
-        "\u2702"
-        "\u2705"
-        "\u2708-\u270d"
-        "\u270f"
-        "\u2712"
-        "\u2714"
-        "\u2716"
-        "\u271d"
-        "\u2721"
-        "\u2728"
-        "\u2733-\u2734"
-        "\u2744"
-        "\u2747"
-        "\u274c"
-        "\u274e"
-        "\u2753-\u2755"
-        "\u2757"
-        "\u2763-\u2764"
-        "\u2795-\u2797"
-        "\u27a1"
-        "\u27b0"
-        "\u27bf"
-        "\u2b05-\u2b07"
-        "\u2b1b-\u2b1c"
-        "\u2b50"
-        "\u2b55"
-        "\u231a-\u231b"
-        "\u23e9-\u23f3"
-        "\u23f8-\u23fa"
-        "\U0001F48E"  # gem/diamond emoji
-        "]+", flags=re.UNICODE
-    )
-    return emoji_pattern.sub('', text)
-
 def clean_text(text):
     """Clean markdown, strip emoji, and escape special characters"""
-    # Strip emoji first
-    text = strip_emoji(text)
-    
+    return inline_markup(strip_emoji(text))
+
+def inline_markup(text):
+    """Convert markdown formatting and escape (text is already emoji-free)"""
     # Convert markdown formatting
     text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
     text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<i>\1</i>', text)
@@ -308,29 +240,29 @@ def parse_markdown(content, styles):
                 continue
             
             if line.startswith('# '):
-                text = clean_text(line[2:]).upper()
+                text = inline_markup(line[2:]).upper()
                 if text:
                     elements.append(Paragraph(text, styles['h1']))
             elif line.startswith('## '):
-                text = clean_text(line[3:])
+                text = inline_markup(line[3:])
                 if text:
                     elements.append(Paragraph(text, styles['h2']))
             elif line.startswith('### '):
-                text = clean_text(line[4:])
+                text = inline_markup(line[4:])
                 if text:
                     elements.append(Paragraph(text, styles['h3']))
             elif line.startswith('#### '):
-                text = clean_text(line[5:])
+                text = inline_markup(line[5:])
                 if text:
                     elements.append(Paragraph(text, styles['h4']))
             elif line.strip() in ['---', '***', '___']:
                 elements.append(Spacer(1, 20))
             elif line.startswith('> '):
-                quote_text = clean_text(line[2:])
+                quote_text = inline_markup(line[2:])
                 if quote_text:
                     elements.append(Paragraph(f'"{quote_text}"', styles['quote']))
             elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                text = clean_text(line.strip()[2:])
+                text = inline_markup(line.strip()[2:])
                 if text:
                     bullet = '<font color="#14B8A6"><b>•</b></font>'
                     elements.append(Paragraph(f'{bullet}  {text}', styles['bullet']))
@@ -338,12 +270,12 @@ def parse_markdown(content, styles):
                 match = re.match(r'^(\d+)\.\s*(.+)', line.strip())
                 if match:
                     num, text = match.groups()
-                    text = clean_text(text)
+                    text = inline_markup(text)
                     if text:
                         num_styled = f'<font color="#14B8A6"><b>{num}.</b></font>'
                         elements.append(Paragraph(f'{num_styled}  {text}', styles['bullet']))
             elif line.strip():
-                text = clean_text(line)
+                text = inline_markup(line)
                 if text:
                     elements.append(Paragraph(text, styles['body']))
         except Exception as e:
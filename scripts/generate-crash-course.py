@@ -20,6 +20,8 @@ from reportlab.platypus import (
 )
 from reportlab.pdfgen import canvas
 
+from archivist_pdf.chrome import static_chrome
+
 DARK_BG = HexColor('#1A1A1A')
 WHITE = HexColor('#FFFFFF')
 LIGHT_GRAY = HexColor('#E5E5E5')
@@ -160,7 +162,8 @@ def create_styles():
     }
 
 
-def draw_dark_background(canvas_obj, doc):
+@static_chrome
+def _dark_background_chrome(canvas_obj, doc):
     canvas_obj.saveState()
     canvas_obj.setFillColor(DARK_BG)
     canvas_obj.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=1, stroke=0)
@@ -174,6 +177,12 @@ def draw_dark_background(canvas_obj, doc):
     canvas_obj.drawString(MARGIN + 165, 0.35 * inch, "|")
     canvas_obj.setFillColor(MEDIUM_GRAY)
     canvas_obj.drawString(MARGIN + 175, 0.35 * inch, "CLASSIFIED")
+    canvas_obj.restoreState()
+
+
+def draw_dark_background(canvas_obj, doc):
+    _dark_background_chrome(canvas_obj, doc)
+    canvas_obj.saveState()
     canvas_obj.setFillColor(WHITE)
     canvas_obj.setFont('Helvetica-Bold', 10)
     canvas_obj.drawRightString(PAGE_WIDTH - MARGIN, 0.35 * inch, str(doc.page))
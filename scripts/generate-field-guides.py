@@ -18,6 +18,9 @@ from reportlab.platypus import (
 )
 from reportlab.pdfgen import canvas
 
+from archivist_pdf.chrome import static_chrome
+from archivist_pdf.glyphs import strip_emoji
+
 DARK_BG = HexColor('#1A1A1A')
 WHITE = HexColor('#FFFFFF')
 LIGHT_GRAY = HexColor('#E5E5E5')
@@ -291,7 +294,8 @@ def create_styles():
     }
 
 
-def draw_dark_background(canvas_obj, doc):
+@static_chrome
+def _dark_background_chrome(canvas_obj, doc):
     canvas_obj.saveState()
     canvas_obj.setFillColor(DARK_BG)
     canvas_obj.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=1, stroke=0)
@@ -305,6 +309,12 @@ def draw_dark_background(canvas_obj, doc):
     canvas_obj.drawString(MARGIN + 155, 0.35 * inch, "|")
     canvas_obj.setFillColor(MEDIUM_GRAY)
     canvas_obj.drawString(MARGIN + 165, 0.35 * inch, "CLASSIFIED")
+    canvas_obj.restoreState()
+
+
+def draw_dark_background(canvas_obj, doc):
+    _dark_background_chrome(canvas_obj, doc)
+    canvas_obj.saveState()
     canvas_obj.setFillColor(WHITE)
     canvas_obj.setFont('Helvetica-Bold', 10)
     canvas_obj.drawRightString(PAGE_WIDTH - MARGIN, 0.35 * inch, str(doc.page))
@@ -321,30 +331,11 @@ def draw_title_page(canvas_obj, doc):
     canvas_obj.restoreState()
 
 
-def strip_emoji(text):
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
-        "\U0001F700-\U0001F77F\U0001F780-\U0001F7FF\U0001F800-\U0001F8FF"
-        "\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF"
-        "\U00002702-\U000027B0\U000024C2-\U0001F251\U0001f926-\U0001f937"
-        "\U00010000-\U0010ffff\u200d\u2640-\u2642\u2600-\u2B55\u23cf"
-        "\u23e9\u231a\ufe0f\u3030\u2934\u2935\u25aa-\u25ab\u25b6\u25c0"
-        "\u25fb-\u25fe\u2614-\u2615\u2648-\u2653\u267f\u2693\u26a1"
-        "\u26aa-\u26ab\u26bd-\u26be\u26c4-\u26c5\u26ce\u26d4\u26ea"
-        "\u26f2-\u26f3\u26f5\u26fa\u26fd\u2702\u2705\u2708-\u270d"
-        "\u270f\u2712\u2714\u2716\u271d\u2721\u2728\u2733-\u2734"
-        "\u2744\u2747\u274c\u274e\u2753-\u2755\u2757\u2763-\u2764"
-        "\u2795-\u2797\u27a1\u27b0\u27bf\u2b05-\u2b07\u2b1b-\u2b1c"
-        "\u2b50\u2b55\u231a-\u231b\u23e9-\u23f3\u23f8-\u23fa"
-        "\U0001F48E"
-        "]+", flags=re.UNICODE
-    )
-    return emoji_pattern.sub('', text)
+def clean_text(text):
+    return inline_markup(strip_emoji(text))
 
 
-def clean_text(text):
-    text = strip_emoji(text)
+def inline_markup(text):
     text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
     text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<i>\1</i>', text)
     text = re.sub(r'__([^_]+)__', r'<b>\1</b>', text)
@@ -380,30 +371,30 @@ def parse_markdown(content, styles):
             if upper.startswith('=') and len(upper) > 5 and all(c in '= ' for c in upper):
                 continue
             if line.startswith('# '):
-                text = clean_text(line[2:]).upper()
+                text = inline_markup(line[2:]).upper()
                 if text:
                     elements.append(Paragraph(text, styles['h1']))
             elif line.startswith('## '):
-                text = clean_text(line[3:])
+                text = inline_markup(line[3:])
                 if text:
                     elements.append(Paragraph(text, styles['h2']))
             elif line.startswith('### '):
-                text = clean_text(line[4:])
+                text = inline_markup(line[4:])
                 if text:
                     elements.append(Paragraph(text, styles['h3']))
             elif line.startswith('#### '):
-                text = clean_text(line[5:])
+                text = inline_markup(line[5:])
                 if text:
                     elements.append(Paragraph(text, styles['h4']))
             elif line.strip() in ['---', '***', '___']:
                 elements.append(TealRule())
                 elements.append(Spacer(1, 10))
             elif line.startswith('> '):
-                qt = clean_text(line[2:])
+                qt = inline_markup(line[2:])
                 if qt:
                     elements.append(Paragraph(f'"{qt}"', styles['quote']))
             elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                text = clean_text(line.strip()[2:])
+                text = inline_markup(line.strip()[2:])
                 if text:
                     bullet = '<font color="#14B8A6"><b>&bull;</b></font>'
                     elements.append(Paragraph(f'{bullet}  {text}', styles['bullet']))
@@ -411,12 +402,12 @@ def parse_markdown(content, styles):
                 match = re.match(r'^(\d+)\.\s*(.+)', line.strip())
                 if match:
                     num, text = match.groups()
-                    text = clean_text(text)
+                    text = inline_markup(text)
                     if text:
                         ns = f'<font color="#14B8A6"><b>{num}.</b></font>'
                         elements.append(Paragraph(f'{ns}  {text}', styles['bullet']))
             elif line.strip():
-                text = clean_text(line)
+                text = inline_markup(line)
                 if text:
                     elements.append(Paragraph(text, styles['body']))
         except:
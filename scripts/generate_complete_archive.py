@@ -4,14 +4,25 @@ THE ARCHIVIST METHOD — COMPLETE ARCHIVE PDF Generator
 Assembles the full 600+ page flagship product ($297).
 
 Usage:
-    python3 generate_complete_archive.py
+    python3 generate_complete_archive.py [--workers N] [--no-cache]
+    python3 generate_complete_archive.py --watch   # rebuild on content edits
+
+Each part of the book (Part I, each pattern, ..., the epilogue) is laid out
+as its own PDF fragment and kept in .cache/parts-v2/; a rebuild lays out
+only the parts whose sources, styles or code changed and merges the rest
+from the cache (--no-cache: lay out everything, keep nothing). Layout runs
+in one process per core (--workers to choose); see archivist_pdf/parallel.py.
+--watch keeps rebuilding the archive as its sources are edited (see
+build_daemon.py).
 
 Output:
     outputs/THE-ARCHIVIST-METHOD-COMPLETE-ARCHIVE.pdf
 """
 
+import hashlib
 import os
-import re
+import sys
+import time
 from pathlib import Path
 
 from reportlab.lib.pagesizes import letter
@@ -20,8 +31,32 @@ from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.platypus import (
-    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer,
-    PageBreak, Table, TableStyle, NextPageTemplate, Flowable
+    PageTemplate, Frame, Spacer,
+    PageBreak, NextPageTemplate
+)
+
+from archivist_pdf.cache import BlockCache
+from archivist_pdf.cadence import Cadence, Slot
+from archivist_pdf.chrome import static_chrome
+from archivist_pdf.deps import DEPS, snapshot
+from archivist_pdf.flowables import (
+    HorizontalRule, TealDivider, WriteLine, BoxedContent,
+)
+from archivist_pdf.inline import escape
+from archivist_pdf.lazy import DeferredFlowables, ExpandingDocTemplate
+from archivist_pdf.lower import FlowableLowering
+from archivist_pdf.metrics import WIDTHS
+from archivist_pdf.parallel import ParallelLayout
+from archivist_pdf.partcache import PartCache, code_version
+from archivist_pdf.paragraphs import FRAGMENTS, LINES, Paragraph
+from archivist_pdf.styles import STYLES
+from archivist_pdf.watchdog import WATCHDOG, SourceText, source_of
+from archivist_pdf.stats import peak_rss_mb
+from archivist_pdf.toc import CONTENTS, ContentsLine, mark
+from archivist_pdf.theme import (
+    BG_DARK, TEAL, TEAL_DIM, GOLD, WHITE, TEXT_PRIMARY, TEXT_SECONDARY,
+    TEXT_DIM, BORDER_COLOR,
+    PAGE_W, PAGE_H, MARGIN_L, MARGIN_R, MARGIN_T, MARGIN_B, CONTENT_W,
 )
 
 # ══════════════════════════════════════════════════════════════
@@ -102,6 +137,7 @@ PATTERN_SECTION_SUBTITLES = {
 }
 
 # Pull quotes — powerful lines from the content, inserted every ~35 pages
+QUOTE_EVERY = 35
 PULL_QUOTES = [
     "You do not need to understand your pattern to interrupt it. You need to see it, name it, and do something different. Once.",
     "The pattern is not who you are. It is something that happens to you.",
@@ -123,185 +159,21 @@ PULL_QUOTES = [
     "Done is better than perfect. Ship it.",
 ]
 
-# ── Design Specs ──
-BG_DARK = HexColor("#1A1A1A")
-BG_CALLOUT = HexColor("#242424")
-BG_CODE = HexColor("#222222")
-TEAL = HexColor("#14B8A6")
-TEAL_DIM = HexColor("#0F7B6E")
-GOLD = HexColor("#F59E0B")
-PINK = HexColor("#EC4899")
-WHITE = HexColor("#FFFFFF")
-TEXT_PRIMARY = HexColor("#E5E5E5")
-TEXT_SECONDARY = HexColor("#9CA3AF")
-TEXT_DIM = HexColor("#6B7280")
-BORDER_COLOR = HexColor("#333333")
-RED_ACCENT = HexColor("#EF4444")
-
-PAGE_W, PAGE_H = letter
-MARGIN_L = 0.75 * inch
-MARGIN_R = 0.75 * inch
-MARGIN_T = 0.7 * inch
-MARGIN_B = 0.7 * inch
-CONTENT_W = PAGE_W - MARGIN_L - MARGIN_R
-
-CONTENT_DIR = Path(__file__).parent.parent / "content" / "book"
+CONTENT_DIR = Path(__file__).parent.parent / "the-archivist-method"
 OUTPUT_DIR = Path(__file__).parent.parent / "outputs"
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+PACKAGE_DIR = Path(__file__).parent / "archivist_pdf"
+# The code this process runs, hashed once as it is imported (archivist_pdf.deps).
+CODE = snapshot(Path(__file__), *PACKAGE_DIR.glob('*.py'))
 FOOTER_TEXT = "THE ARCHIVIST METHOD\u2122 | CLASSIFIED"
 
-
-# ══════════════════════════════════════════════════════════════
-# CUSTOM FLOWABLES
-# ══════════════════════════════════════════════════════════════
-
-class HorizontalRule(Flowable):
-    def __init__(self, width=None, color=TEAL_DIM, thickness=1):
-        Flowable.__init__(self)
-        self._width = width
-        self.color = color
-        self.thickness = thickness
-
-    def draw(self):
-        self.canv.setStrokeColor(self.color)
-        self.canv.setLineWidth(self.thickness)
-        self.canv.line(0, 0, self._width or CONTENT_W, 0)
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        return (self._width, self.thickness + 6)
-
-
-class TealDivider(Flowable):
-    def __init__(self, width=None):
-        Flowable.__init__(self)
-        self._width = width
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        return (self._width, 20)
-
-    def draw(self):
-        mid = self._width / 2
-        self.canv.setStrokeColor(TEAL_DIM)
-        self.canv.setLineWidth(0.5)
-        self.canv.line(mid - 120, 10, mid - 15, 10)
-        self.canv.setFillColor(TEAL)
-        self.canv.saveState()
-        self.canv.translate(mid, 10)
-        self.canv.rotate(45)
-        self.canv.rect(-4, -4, 8, 8, fill=1, stroke=0)
-        self.canv.restoreState()
-        self.canv.line(mid + 15, 10, mid + 120, 10)
-
-
-class BoxedContent(Flowable):
-    MAX_HEIGHT = 680
-
-    def __init__(self, content_flowables, width=None, bg_color=BG_CALLOUT,
-                 border_color=TEAL, padding=12):
-        Flowable.__init__(self)
-        self._content = [f for f in content_flowables if f is not None]
-        self._box_width = width or CONTENT_W
-        self.bg_color = bg_color
-        self.border_color = border_color
-        self.padding = padding
-        self._height = 0
-
-    def wrap(self, availWidth, availHeight):
-        if not self._content:
-            return (0, 0)
-        self._box_width = min(self._box_width, availWidth)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, max(availHeight - h, 50))
-                h += fh
-            except Exception:
-                h += 14
-        self._height = h + 2 * self.padding
-        if self._height > self.MAX_HEIGHT:
-            self._height = min(self._height, availHeight)
-        return (self._box_width, self._height)
-
-    def split(self, availWidth, availHeight):
-        if not self._content:
-            return []
-        if self._height <= availHeight:
-            return []
-        if availHeight < 200:
-            return []
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        split_idx = 0
-        target = availHeight - 2 * self.padding
-        for idx, f in enumerate(self._content):
-            try:
-                _, fh = f.wrap(inner_w, max(target - h, 50))
-            except Exception:
-                fh = 14
-            if h + fh > target and idx > 0:
-                split_idx = idx
-                break
-            h += fh
-        else:
-            return []
-        if split_idx == 0:
-            return []
-        first = BoxedContent(self._content[:split_idx], self._box_width,
-                             self.bg_color, self.border_color, self.padding)
-        second = BoxedContent(self._content[split_idx:], self._box_width,
-                              self.bg_color, self.border_color, self.padding)
-        return [first, second]
-
-    def draw(self):
-        if not self._content:
-            return
-        self.canv.setFillColor(self.bg_color)
-        self.canv.roundRect(0, 0, self._box_width, self._height, 4, fill=1, stroke=0)
-        if self.border_color:
-            self.canv.setStrokeColor(self.border_color)
-            self.canv.setLineWidth(3)
-            self.canv.line(2, 4, 2, self._height - 4)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        y = self._height - self.padding
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, self._height)
-                if y - fh >= -self.padding:
-                    f.drawOn(self.canv, self.padding + 8, y - fh)
-                y -= fh
-            except Exception:
-                y -= 14
-
-
-class WriteArea(Flowable):
-    def __init__(self, num_lines=4, width=None, label=None):
-        Flowable.__init__(self)
-        self._width = width
-        self.num_lines = num_lines
-        self.label = label
-        self.line_height = 24
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        label_h = 16 if self.label else 0
-        self._height = label_h + self.num_lines * self.line_height + 8
-        return (self._width, self._height)
-
-    def draw(self):
-        y = self._height
-        if self.label:
-            self.canv.setFont('Helvetica-Bold', 9.5)
-            self.canv.setFillColor(TEAL)
-            y -= 14
-            self.canv.drawString(0, y, self.label)
-            y -= 6
-        self.canv.setStrokeColor(BORDER_COLOR)
-        self.canv.setLineWidth(0.5)
-        for i in range(self.num_lines):
-            y -= self.line_height
-            self.canv.line(8, y, self._width - 8, y)
+# Source directories, in the order Parts I-VI and the epilogue read them
+ARCHIVE_SOURCE_DIRS = [
+    "module-0-emergency", "module-1-foundation", "module-2-four-doors",
+    "module-3-patterns", "module-5-advanced", "module-6-context",
+    "module-7-field-notes", "module-4-implementation", "module-8-resources",
+    "epilogue",
+]
 
 
 # ══════════════════════════════════════════════════════════════
@@ -483,6 +355,7 @@ def _draw_bg(c, doc):
     c.restoreState()
 
 
+@static_chrome
 def draw_cover(c, doc):
     _draw_bg(c, doc)
     c.saveState()
@@ -493,7 +366,8 @@ def draw_cover(c, doc):
     c.restoreState()
 
 
-def draw_body(c, doc):
+@static_chrome
+def _body_chrome(c, doc):
     _draw_bg(c, doc)
     c.saveState()
 
@@ -517,15 +391,29 @@ def draw_body(c, doc):
     c.setFont('Helvetica', 7)
     c.setFillColor(TEXT_DIM)
     c.drawString(MARGIN_L, y_ftr - 4, FOOTER_TEXT)
-    c.drawRightString(PAGE_W - MARGIN_R, y_ftr - 4, str(c.getPageNumber()))
 
     c.restoreState()
 
 
+def draw_body(c, doc):
+    _body_chrome(c, doc)
+    draw_page_number(c, c.getPageNumber())
+
+
+def draw_page_number(c, number):
+    c.saveState()
+    c.setFont('Helvetica', 7)
+    c.setFillColor(TEXT_DIM)
+    c.drawRightString(PAGE_W - MARGIN_R, MARGIN_B - 24, str(number))
+    c.restoreState()
+
+
+@static_chrome
 def draw_part(c, doc):
     _draw_bg(c, doc)
 
 
+@static_chrome
 def draw_quote(c, doc):
     _draw_bg(c, doc)
     # Teal left border accent
@@ -536,302 +424,15 @@ def draw_quote(c, doc):
     c.restoreState()
 
 
-# ══════════════════════════════════════════════════════════════
-# MARKDOWN PARSER
-# ══════════════════════════════════════════════════════════════
-
-class MarkdownParser:
-    def __init__(self, styles):
-        self.styles = styles
-
-    def _esc(self, text):
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-    def _inline(self, text):
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b><i>\1</i></b>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        teal_hex = '14B8A6'
-        text = re.sub(r'`([^`]+)`',
-            lambda m: f'<font face="Courier" color="#{teal_hex}">{m.group(1)}</font>', text)
-        return text
-
-    def parse(self, md_text):
-        out = []
-        lines = md_text.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-            s = line.strip()
-
-            if not s:
-                i += 1
-                continue
-
-            # Skip top-level headings with section numbers
-            if s.startswith('# ') and re.match(r'^# \d+\.\d+', s):
-                i += 1
-                continue
-
-            # Skip top-level headings that are pattern titles (handled by chapter pages)
-            if s.startswith('# PATTERN ') or s.startswith('# EPILOGUE'):
-                i += 1
-                continue
-
-            # Boxed blocks (═ or ─)
-            if '\u2550' in s or '\u2500' in s:
-                header_line = s
-                block = []
-                i += 1
-                while i < len(lines):
-                    ls = lines[i].strip()
-                    if '\u2550' in ls or '\u2500' in ls:
-                        i += 1
-                        break
-                    block.append(ls)
-                    i += 1
-                text = '\n'.join(block).strip()
-                if text:
-                    out.extend(self._box(text, header_line))
-                continue
-
-            # Code blocks
-            if s.startswith('```'):
-                code = []
-                i += 1
-                while i < len(lines):
-                    if lines[i].strip().startswith('```'):
-                        i += 1
-                        break
-                    code.append(lines[i])
-                    i += 1
-                out.extend(self._code_block('\n'.join(code)))
-                continue
-
-            # Headers
-            if s.startswith('####'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['sub3_header']))
-                i += 1; continue
-
-            if s.startswith('###'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['subsection_header']))
-                i += 1; continue
-
-            if s.startswith('##'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Spacer(1, 4))
-                out.append(Paragraph(t, self.styles['section_header']))
-                out.append(HorizontalRule(color=TEAL_DIM))
-                out.append(Spacer(1, 4))
-                i += 1; continue
-
-            if s.startswith('# '):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['chapter_title']))
-                i += 1; continue
-
-            # Horizontal rule
-            if s in ('---', '***', '___'):
-                out.append(Spacer(1, 6))
-                out.append(TealDivider())
-                out.append(Spacer(1, 6))
-                i += 1; continue
-
-            # Timestamps [T+00:00]
-            if re.match(r'^\*?\*?\[T[+-]\d+:\d+\]', s):
-                t = self._inline(self._esc(s.strip('*')))
-                out.append(Paragraph(t, self.styles['timestamp']))
-                i += 1; continue
-
-            # Tables
-            if '|' in s and i + 1 < len(lines) and '---' in lines[i + 1]:
-                table_lines = []
-                while i < len(lines) and '|' in lines[i].strip():
-                    table_lines.append(lines[i].strip())
-                    i += 1
-                out.extend(self._table(table_lines))
-                continue
-
-            # Bullet points
-            if s.startswith('- ') or s.startswith('\u2022 '):
-                bt = self._inline(self._esc(s[2:].strip()))
-                out.append(Paragraph(
-                    f'\u2022  {bt}', self.styles['bullet']))
-                i += 1; continue
-
-            # Numbered list
-            nm = re.match(r'^(\d+)\.\s+(.+)', s)
-            if nm:
-                num, txt = nm.group(1), nm.group(2).strip()
-                txt = self._inline(self._esc(txt))
-                out.append(Paragraph(
-                    f'<font color="#14B8A6">{num}.</font>  {txt}',
-                    self.styles['numbered']))
-                i += 1; continue
-
-            # Regular paragraph
-            paras = [s]
-            i += 1
-            while i < len(lines):
-                ns = lines[i].strip()
-                if (not ns or ns.startswith('#') or ns.startswith('- ') or
-                    ns.startswith('\u2022 ') or ns.startswith('```') or
-                    '\u2550' in ns or ns in ('---', '***', '___') or
-                    re.match(r'^\d+\.', ns) or re.match(r'^\*?\*?\[T[+-]', ns) or
-                    ('|' in ns and i + 1 < len(lines) and '---' in lines[i + 1])):
-                    break
-                paras.append(ns)
-                i += 1
-            full = ' '.join(paras)
-            full = self._inline(self._esc(full))
-            out.append(Paragraph(full, self.styles['body']))
-
-        return out
-
-    def _detect_type(self, header, text):
-        c = (header + ' ' + text).upper()
-        if 'GOLD NUGGET' in c: return 'gold'
-        if 'KEY TAKEAWAY' in c: return 'takeaway'
-        if 'QUICK WIN' in c: return 'quickwin'
-        if 'WARNING' in c or 'BEFORE YOU' in c or '\u26A0' in c: return 'warning'
-        if 'ARCHIVIST OBSERVES' in c: return 'archivist'
-        if 'PATTERN ARCHAEOLOGY' in c and 'SUBJECT' in c: return 'log'
-        if 'PATTERN EXECUTION LOG' in c: return 'log'
-        if 'COPY TO PHONE' in c or 'QUICK REFERENCE' in c: return 'reference'
-        return 'info'
-
-    def _box(self, text, header=""):
-        out = []
-        btype = self._detect_type(header, text)
-
-        configs = {
-            'gold':      (GOLD, HexColor("#242010"), 'gold_title', 'gold_body', '\u2666 GOLD NUGGET'),
-            'takeaway':  (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', '\u2611 KEY TAKEAWAYS'),
-            'quickwin':  (HexColor("#22C55E"), HexColor("#1A2A1A"), 'callout_title', 'callout_body', '\u26A1 QUICK WIN'),
-            'warning':   (RED_ACCENT, HexColor("#2A1A1A"), 'callout_title', 'warning_body', '\u26A0 IMPORTANT'),
-            'archivist': (TEAL_DIM, HexColor("#1E2428"), 'callout_title', 'callout_body', '\U0001F4DC THE ARCHIVIST OBSERVES'),
-            'log':       (TEAL_DIM, BG_CODE, 'callout_title', 'callout_body', None),
-            'reference': (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', None),
-            'info':      (TEAL_DIM, BG_CALLOUT, 'callout_title', 'callout_body', None),
-        }
-
-        border, bg, title_key, body_key, default_title = configs.get(btype, configs['info'])
-
-        title_style = self.styles[title_key]
-        if btype == 'quickwin':
-            title_style = ParagraphStyle(f'QW_{id(text)}', parent=title_style,
-                                         textColor=HexColor("#22C55E"))
-        elif btype == 'warning':
-            title_style = ParagraphStyle(f'WN_{id(text)}', parent=title_style,
-                                         textColor=RED_ACCENT)
-        body_style = self.styles[body_key]
-
-        inner = []
-        block_lines = text.split('\n')
-        start = 0
-        title = default_title
-
-        for idx, bl in enumerate(block_lines):
-            bl_s = bl.strip()
-            if not bl_s: continue
-            emoji_markers = ['\U0001F48E', '\U0001F511', '\u26A1', '\u26A0', '\U0001F4DC']
-            keywords = ['GOLD NUGGET', 'KEY TAKEAWAY', 'QUICK WIN', 'WARNING', 'BEFORE YOU', 'ARCHIVIST OBSERVES']
-            if any(k in bl_s.upper() for k in keywords) or any(e in bl_s for e in emoji_markers):
-                if title is None:
-                    title = re.sub(r'[\U0001F48E\U0001F511\u26A1\u26A0\U0001F4DC\s]+$', '', bl_s).strip()
-                    title = re.sub(r'^[\U0001F48E\U0001F511\u26A1\u26A0\U0001F4DC\s]+', '', title).strip()
-                start = idx + 1
-                break
-            break
-
-        if title:
-            inner.append(Paragraph(self._esc(title), title_style))
-            inner.append(Spacer(1, 4))
-
-        remaining = '\n'.join(block_lines[start:]).strip()
-        if remaining:
-            for ln in remaining.split('\n'):
-                ls = ln.strip()
-                if not ls:
-                    inner.append(Spacer(1, 3))
-                    continue
-                if ls.startswith('- ') or ls.startswith('\u2022 '):
-                    bt = self._inline(self._esc(ls[2:]))
-                    inner.append(Paragraph(f'\u2022  {bt}', ParagraphStyle(
-                        f'BB_{id(ls)}', parent=body_style, leftIndent=16)))
-                else:
-                    inner.append(Paragraph(self._inline(self._esc(ls)), body_style))
-
-        out.append(Spacer(1, 6))
-        out.append(BoxedContent(inner, bg_color=bg, border_color=border))
-        out.append(Spacer(1, 10))
-        return out
-
-    def _code_block(self, code):
-        out = [Spacer(1, 4)]
-        inner = []
-        for ln in code.split('\n'):
-            escaped = self._esc(ln) if ln.strip() else ' '
-            inner.append(Paragraph(escaped, self.styles['code']))
-        out.append(BoxedContent(inner, bg_color=BG_CODE, border_color=TEAL_DIM))
-        out.append(Spacer(1, 6))
-        return out
-
-    def _table(self, table_lines):
-        out = []
-        if len(table_lines) < 3:
-            return out
-
-        headers = [c.strip() for c in table_lines[0].split('|') if c.strip()]
-        rows = []
-        for line in table_lines[2:]:
-            cells = [c.strip() for c in line.split('|') if c.strip()]
-            if cells:
-                rows.append(cells)
-
-        if not headers or not rows:
-            return out
-
-        data = [[Paragraph(self._esc(h), self.styles['table_header']) for h in headers]]
-        for row in rows:
-            data.append([Paragraph(self._inline(self._esc(c)), self.styles['table_cell'])
-                        for c in row])
-
-        ncols = len(headers)
-        for row in data:
-            while len(row) < ncols:
-                row.append(Paragraph('', self.styles['table_cell']))
-
-        col_w = CONTENT_W / ncols
-        t = Table(data, colWidths=[col_w] * ncols)
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor("#222222")),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor("#1E1E1E")),
-            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-
-        out.append(Spacer(1, 6))
-        out.append(t)
-        out.append(Spacer(1, 8))
-        return out
-
-
 # ══════════════════════════════════════════════════════════════
 # CONTENT LOADING
 # ══════════════════════════════════════════════════════════════
 
 def load_file(path):
+    DEPS.read(path)
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
+            return SourceText(f.read(), path)
     except FileNotFoundError:
         print(f"  [warn] Not found: {path}")
         return ""
@@ -847,11 +448,13 @@ def find_pattern_file(pattern_num, section_key):
         path = base / dir_name / filename
         if path.exists():
             return load_file(path)
+        DEPS.read(path)   # adding it later changes the archive
 
     path = base / filename
     if path.exists():
         return load_file(path)
 
+    DEPS.read(path)
     print(f"  [warn] Pattern file not found: {filename}")
     return ""
 
@@ -861,21 +464,42 @@ def find_pattern_file(pattern_num, section_key):
 # ══════════════════════════════════════════════════════════════
 
 class CompleteArchiveBuilder:
-    def __init__(self):
-        self.styles = create_styles()
-        self.parser = MarkdownParser(self.styles)
+    def __init__(self, workers=None, part_cache=True, styles=None, cache=None):
+        self.workers = workers
+        self.part_cache = part_cache
+        # The build daemon passes a style sheet and parse cache it keeps warm.
+        self.styles = styles or create_styles()
+        self.cache = cache or BlockCache(CACHE_DIR)
+        WIDTHS.install()
+        self.parser = FlowableLowering(self.styles, skip_roles=('section', 'title'),
+                                       cache=self.cache)
         self.flow = []
-        self.pull_quote_idx = 0
-        self.page_estimate = 0  # rough page counter for pull quote insertion
-
-    def _esc(self, text):
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-    def _inline(self, text):
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b><i>\1</i></b>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        return text
+        self.parts = []         # [name, flow index, digest of what it reads]
+        self.pages = 0
+
+    # ── Parts ──
+
+    def _begin_part(self, name):
+        """Start a part: what follows in the flow, up to the next part, is
+        laid out (and cached) as one fragment."""
+        self.parts.append([name, len(self.flow), hashlib.blake2b(digest_size=16)])
+
+    def _note(self, *inputs):
+        """Feed what the current part's pages depend on, beyond the code,
+        into its cache key."""
+        self.parts[-1][2].update(repr(inputs).encode('utf-8'))
+
+    def _part_keys(self):
+        """[(cache key, flow index)] for ParallelLayout."""
+        version = code_version(CODE)
+        styles = repr(sorted((name, FRAGMENTS.style_key(style))
+                             for name, style in self.styles.items()))
+        keys = []
+        for name, start, digest in self.parts:
+            h = hashlib.blake2b(f"{version}\0{styles}\0".encode('utf-8'), digest_size=16)
+            h.update(digest.digest())
+            keys.append((f"{name}-{h.hexdigest()}", start))
+        return keys
 
     # ── Structural Elements ──
 
@@ -884,7 +508,8 @@ class CompleteArchiveBuilder:
         self.flow.append(NextPageTemplate('part'))
         self.flow.append(PageBreak())
         self.flow.append(Spacer(1, 2.3 * inch))
-        self.flow.append(Paragraph(f"PART {num}", self.styles['part_label']))
+        self.flow.append(mark(Paragraph(f"PART {num}", self.styles['part_label']),
+                              f"PART {num}"))
         self.flow.append(Paragraph(title, self.styles['part_name']))
         self.flow.append(Spacer(1, 6))
         self.flow.append(TealDivider())
@@ -892,14 +517,13 @@ class CompleteArchiveBuilder:
         self.flow.append(Paragraph(desc, self.styles['part_desc']))
         self.flow.append(NextPageTemplate('body'))
         self.flow.append(PageBreak())
-        self.page_estimate += 1
 
     def _chapter_title_page(self, title, subtitle=None):
         """Full-page chapter title with just the title centered."""
         self.flow.append(NextPageTemplate('part'))
         self.flow.append(PageBreak())
         self.flow.append(Spacer(1, 2.8 * inch))
-        self.flow.append(Paragraph(title, self.styles['chap_page_title']))
+        self.flow.append(mark(Paragraph(title, self.styles['chap_page_title']), title))
         self.flow.append(Spacer(1, 8))
         self.flow.append(HorizontalRule(color=TEAL, thickness=2))
         if subtitle:
@@ -907,46 +531,46 @@ class CompleteArchiveBuilder:
             self.flow.append(Paragraph(subtitle, self.styles['chap_page_subtitle']))
         self.flow.append(NextPageTemplate('body'))
         self.flow.append(PageBreak())
-        self.page_estimate += 1
 
-    def _pull_quote_page(self):
-        """Full-page pull quote for visual rhythm."""
-        if self.pull_quote_idx >= len(PULL_QUOTES):
-            return
-        quote = PULL_QUOTES[self.pull_quote_idx]
-        self.pull_quote_idx += 1
+    def _quote_slot(self):
+        """A place a pull quote page may go; the layout puts one at the
+        slot nearest every QUOTE_EVERY pages."""
+        self.flow.append(Slot())
 
-        self.flow.append(NextPageTemplate('quote'))
-        self.flow.append(PageBreak())
-        self.flow.append(Spacer(1, 2.8 * inch))
-        self.flow.append(Paragraph(
-            f'\u201c{self._esc(quote)}\u201d',
-            self.styles['pull_quote']))
-        self.flow.append(NextPageTemplate('body'))
-        self.flow.append(PageBreak())
-        self.page_estimate += 1
-
-    def _maybe_pull_quote(self):
-        """Insert a pull quote page if we are due for one (~every 35 pages)."""
-        if self.page_estimate > 0 and self.page_estimate % 35 < 3:
-            self._pull_quote_page()
+    def _pull_quotes(self):
+        """The pull quote pages, in order, for ParallelLayout to insert."""
+        return Cadence(QUOTE_EVERY, 'quote', [
+            [Spacer(1, 2.8 * inch),
+             Paragraph(f'\u201c{escape(quote)}\u201d', self.styles['pull_quote'])]
+            for quote in PULL_QUOTES])
 
     def _chapter(self, title, content, subtitle=None, page_break=True):
-        """Render a chapter with header and parsed markdown content."""
+        """Queue a chapter with header and parsed markdown content.
+
+        Only the parsed blocks are kept here; the flowables are built when
+        layout reaches the chapter (see _chapter_flowables).
+        """
         if not content:
             return
-        self.flow.append(Spacer(1, 0.12 * inch))
-        self.flow.append(Paragraph(title, self.styles['chapter_title']))
+        self._note('chapter', title, content, subtitle, page_break)
+        blocks = self.parser.blocks(content)
+        source = source_of(content)
+        count = self.parser.count(blocks)
+        self.flow.append(DeferredFlowables(
+            lambda: self._chapter_flowables(title, blocks, subtitle, page_break,
+                                            source), weight=count))
+
+    def _chapter_flowables(self, title, blocks, subtitle, page_break, source=None):
+        out = [Spacer(1, 0.12 * inch),
+               Paragraph(title, self.styles['chapter_title'])]
         if subtitle:
-            self.flow.append(Paragraph(subtitle, self.styles['chapter_subtitle']))
-        self.flow.append(HorizontalRule(color=TEAL, thickness=2))
-        self.flow.append(Spacer(1, 8))
-        flowables = self.parser.parse(content)
-        self.flow.extend(flowables)
-        # Estimate pages: ~45 flowables per page roughly
-        self.page_estimate += max(1, len(flowables) // 40)
+            out.append(Paragraph(subtitle, self.styles['chapter_subtitle']))
+        out.append(HorizontalRule(color=TEAL, thickness=2))
+        out.append(Spacer(1, 8))
+        out.extend(self.parser.lower(blocks, source))
         if page_break:
-            self.flow.append(PageBreak())
+            out.append(PageBreak())
+        return out
 
     def _chapter_from_file(self, title, filepath, subtitle=None, page_break=True):
         """Load a file and render as a chapter."""
@@ -959,6 +583,7 @@ class CompleteArchiveBuilder:
         """Render a quick reference as a bordered card with teal accent."""
         if not content:
             return
+        self._note('card', content, pattern_name)
 
         self.flow.append(Spacer(1, 0.1 * inch))
 
@@ -1021,18 +646,23 @@ class CompleteArchiveBuilder:
 
         self.flow.append(NextPageTemplate('body'))
         self.flow.append(PageBreak())
-        self.page_estimate += 1
 
     # ════════════════════════════════════════════════════════
     # TABLE OF CONTENTS
     # ════════════════════════════════════════════════════════
 
     def _section_toc(self):
+        self.flow.extend(self._contents())
+
+    def _contents(self):
+        """The table of contents; ParallelLayout numbers a second copy.
+        Each entry's key is the label its part divider or chapter title
+        page is marked with."""
         S = self.styles
-        self.flow.append(Spacer(1, 0.2 * inch))
-        self.flow.append(Paragraph("TABLE OF CONTENTS", S['toc_heading']))
-        self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
-        self.flow.append(Spacer(1, 12))
+        out = [Spacer(1, 0.2 * inch),
+               mark(Paragraph("TABLE OF CONTENTS", S['toc_heading']), CONTENTS),
+               HorizontalRule(color=TEAL, thickness=1.5),
+               Spacer(1, 12)]
 
         dim_hex = '6B7280'
 
@@ -1071,23 +701,23 @@ class CompleteArchiveBuilder:
             ("EPILOGUE", []),
         ]
 
+        def entry(label, key):
+            return ContentsLine(
+                f'<font color="#{dim_hex}">\u2500\u2500</font>  {label}', key, S['toc_entry'])
+
         for part_name, chapters in toc:
-            self.flow.append(Paragraph(part_name, S['toc_part']))
+            out.append(ContentsLine(part_name, part_name.split(':')[0], S['toc_part']))
             if part_name == "PART II: THE 9 PATTERNS":
                 for pnum in range(1, 10):
                     pname = PATTERN_NAMES[pnum]
-                    self.flow.append(Paragraph(
-                        f'<font color="#{dim_hex}">\u2500\u2500</font>  '
-                        f'Pattern {pnum}: The {pname} Pattern',
-                        S['toc_entry']))
+                    out.append(entry(f'Pattern {pnum}: The {pname} Pattern',
+                                     f"THE {pname.upper()} PATTERN"))
             for prefix, name in chapters:
                 label = f'{prefix}: {name}' if prefix else name
-                self.flow.append(Paragraph(
-                    f'<font color="#{dim_hex}">\u2500\u2500</font>  {label}',
-                    S['toc_entry']))
+                out.append(entry(label, name.upper()))
 
-        self.flow.append(PageBreak())
-        self.page_estimate += 3
+        out.append(PageBreak())
+        return out
 
     # ════════════════════════════════════════════════════════
     # PART I: ORIENTATION
@@ -1117,7 +747,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-0-emergency" / "0.4-crisis-triage.md",
             "When the pattern creates real danger.")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Chapter 2: What This Is
         self._chapter_title_page("WHAT THIS IS",
@@ -1147,7 +777,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-1-foundation" / "1.6-identify-primary-pattern.md",
             "Three criteria. One pattern. Start here.")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Chapter 3: The Four Doors Protocol
         self._chapter_title_page("THE FOUR DOORS PROTOCOL",
@@ -1173,7 +803,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-2-four-doors" / "2.5-door-4-rewrite.md",
             "Replace the pattern with something that serves you")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
     # ════════════════════════════════════════════════════════
     # PART II: THE 9 PATTERNS
@@ -1189,6 +819,7 @@ class CompleteArchiveBuilder:
             tagline = PATTERN_TAGLINES[pnum]
 
             print(f"    Pattern {pnum}: {pname}...")
+            self._begin_part(f"pattern-{pnum}")
 
             # Pattern chapter title page
             self._chapter_title_page(
@@ -1210,15 +841,13 @@ class CompleteArchiveBuilder:
                     self.flow.append(PageBreak())
                     self._quick_reference_card(content, pname)
                     self.flow.append(PageBreak())
-                    self.page_estimate += 2
                 else:
                     # All pattern sub-sections get page breaks for breathing room
                     self._chapter(full_title, content, section_subtitle,
                                   page_break=True)
+                    self._quote_slot()
 
-            # Pull quote after every 2-3 patterns
-            if pnum in {3, 6, 9}:
-                self._pull_quote_page()
+            self._quote_slot()
 
     # ════════════════════════════════════════════════════════
     # PART III: ADVANCED WORK
@@ -1228,7 +857,7 @@ class CompleteArchiveBuilder:
         self._part_divider("III", "ADVANCED WORK",
             "When you run multiple patterns. When the pattern returns.")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Pattern Combinations
         self._chapter_title_page("PATTERN COMBINATIONS",
@@ -1250,7 +879,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-5-advanced" / "5.3-relapse-protocol.md",
             "Recovery framework for when the pattern returns")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
     # ════════════════════════════════════════════════════════
     # PART IV: CONTEXT
@@ -1272,7 +901,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-6-context" / "6.2-patterns-in-relationships.md",
             "How each pattern operates in intimate relationships")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         self._chapter_title_page("PATTERNS IN PARENTING",
             "Breaking the transmission")
@@ -1286,7 +915,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-6-context" / "6.4-patterns-and-the-body.md",
             "The somatic dimension of pattern activation")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Letters from the Field (Module 7)
         self._chapter_title_page("LETTERS FROM THE FIELD",
@@ -1295,7 +924,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-7-field-notes" / "7.1-letters-from-the-field.md",
             "Composite accounts drawn from real experiences. The patterns are real. The progress is real.")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
     # ════════════════════════════════════════════════════════
     # PART V: IMPLEMENTATION
@@ -1330,7 +959,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-4-implementation" / "4.5-weeks-9-12-rewrite.md",
             "Replace the pattern. Graduated exposure. New behaviors.")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Daily Practice
         self._chapter_title_page("DAILY PRACTICE",
@@ -1353,13 +982,20 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-4-implementation" / "4.8-progress-markers.md",
             "The signs that tell you the protocol is doing its job")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         # Tracking Templates
         self._section_tracking_templates()
 
+    def _ws_line(self, line):
+        """A template answer line; an all-underscore blank is ruled instead."""
+        if line.strip('_'):
+            return Paragraph(line, self.styles['ws_line'])
+        return WriteLine(self.styles['ws_line'], len(line))
+
     def _section_tracking_templates(self):
         """Printable tracking templates."""
+        self._begin_part("tracking-templates")
         self._chapter_title_page("TRACKING TEMPLATES",
             "Print these. Fill them in. The data is the antidote to the pattern.")
 
@@ -1388,7 +1024,7 @@ class CompleteArchiveBuilder:
         ]
         for label, line in fields:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
         self.flow.append(PageBreak())
 
         # Template 2: Weekly Check-In
@@ -1419,7 +1055,7 @@ class CompleteArchiveBuilder:
         ]
         for label, line in fields2:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
         self.flow.append(PageBreak())
 
         # Template 3: Pattern Archaeology Report
@@ -1448,7 +1084,7 @@ class CompleteArchiveBuilder:
         ]
         for label, line in fields3:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
         self.flow.append(PageBreak())
 
         # Template 4: 90-Day Review
@@ -1480,7 +1116,7 @@ class CompleteArchiveBuilder:
         ]
         for label, line in fields4:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
         self.flow.append(PageBreak())
 
         # Template 5: Daily Practice Log (week view)
@@ -1502,8 +1138,6 @@ class CompleteArchiveBuilder:
                                     "Average Score: ___/10", S['ws_label']))
         self.flow.append(PageBreak())
 
-        self.page_estimate += 5
-
     # ════════════════════════════════════════════════════════
     # PART VI: RESOURCES
     # ════════════════════════════════════════════════════════
@@ -1530,7 +1164,7 @@ class CompleteArchiveBuilder:
             CONTENT_DIR / "module-8-resources" / "8.4-supporting-someone-with-patterns.md",
             "For partners, friends, family")
 
-        self._maybe_pull_quote()
+        self._quote_slot()
 
         self._chapter_title_page("GLOSSARY",
             "All Archivist Method terminology defined")
@@ -1553,13 +1187,14 @@ class CompleteArchiveBuilder:
             "The Archivist\u2019s Final Note")
 
         content = load_file(CONTENT_DIR / "epilogue" / "epilogue.md")
+        self._note('epilogue', content)
         if content:
             self.flow.append(Spacer(1, 0.12 * inch))
             self.flow.append(Paragraph("THE ARCHIVIST\u2019S FINAL NOTE",
                                         self.styles['chapter_title']))
             self.flow.append(HorizontalRule(color=TEAL, thickness=2))
             self.flow.append(Spacer(1, 8))
-            self.flow.extend(self.parser.parse(content))
+            self.flow.append(DeferredFlowables(lambda: self.parser.parse(content)))
             self.flow.append(PageBreak())
 
     # ════════════════════════════════════════════════════════
@@ -1603,6 +1238,35 @@ class CompleteArchiveBuilder:
     # BUILD
     # ════════════════════════════════════════════════════════
 
+    def _make_doc(self, path, numbered=True):
+        """The document template; numbered=False leaves page numbers to
+        ParallelLayout's merge."""
+        doc = ExpandingDocTemplate(
+            path, pagesize=letter,
+            leftMargin=MARGIN_L, rightMargin=MARGIN_R,
+            topMargin=MARGIN_T, bottomMargin=MARGIN_B,
+            title="The Archivist Method \u2014 Complete Archive",
+            author="The Archivist Method",
+        )
+
+        frame = Frame(MARGIN_L, MARGIN_B, CONTENT_W,
+                      PAGE_H - MARGIN_T - MARGIN_B, id='main')
+
+        doc.addPageTemplates([
+            PageTemplate(id='cover', frames=[Frame(MARGIN_L, MARGIN_B,
+                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='cover_f')],
+                onPage=draw_cover),
+            PageTemplate(id='body', frames=[frame],
+                onPage=draw_body if numbered else _body_chrome),
+            PageTemplate(id='part', frames=[Frame(MARGIN_L, MARGIN_B,
+                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='part_f')],
+                onPage=draw_part),
+            PageTemplate(id='quote', frames=[Frame(MARGIN_L, MARGIN_B,
+                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='quote_f')],
+                onPage=draw_quote),
+        ])
+        return doc
+
     def build(self):
         output_path = OUTPUT_DIR / "THE-ARCHIVIST-METHOD-COMPLETE-ARCHIVE.pdf"
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -1612,62 +1276,69 @@ class CompleteArchiveBuilder:
         print(f"  Output: {output_path}")
         print(f"{'='*60}\n")
 
+        DEPS.start()
+        sources = [p for d in ARCHIVE_SOURCE_DIRS
+                   for p in sorted((CONTENT_DIR / d).rglob('*.md'))]
+        t0 = time.perf_counter()
+        n, parsed, workers = self.cache.prefetch(sources)
+        print(f"  Parsing sources... {n} files, {parsed} parsed on "
+              f"{workers} worker(s) ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
         print("  [1/9] Title page...")
+        self._begin_part("front")
         self._section_title_page()
 
         print("  [2/9] Table of contents...")
         self._section_toc()
 
         print("  [3/9] Part I: Orientation...")
+        self._begin_part("orientation")
         self._part_i_orientation()
 
         print("  [4/9] Part II: The 9 Patterns...")
+        self._begin_part("patterns")
         self._part_ii_patterns()
 
         print("  [5/9] Part III: Advanced Work...")
+        self._begin_part("advanced")
         self._part_iii_advanced()
 
         print("  [6/9] Part IV: Context...")
+        self._begin_part("context")
         self._part_iv_context()
 
         print("  [7/9] Part V: Implementation...")
+        self._begin_part("implementation")
         self._part_v_implementation()
 
         print("  [8/9] Part VI: Resources...")
+        self._begin_part("resources")
         self._part_vi_resources()
 
         print("  [9/9] Epilogue + Final Page...")
+        self._begin_part("epilogue")
         self._section_epilogue()
         self._section_final_page()
 
-        print(f"\n  Rendering PDF ({len(self.flow)} flowables)...")
-        print(f"  Estimated pages: {self.page_estimate}")
-
-        doc = BaseDocTemplate(
-            str(output_path), pagesize=letter,
-            leftMargin=MARGIN_L, rightMargin=MARGIN_R,
-            topMargin=MARGIN_T, bottomMargin=MARGIN_B,
-            title="The Archivist Method \u2014 Complete Archive",
-            author="The Archivist Method",
-        )
-
-        frame = Frame(MARGIN_L, MARGIN_B, CONTENT_W,
-                      PAGE_H - MARGIN_T - MARGIN_B, id='main')
-
-        doc.addPageTemplates([
-            PageTemplate(id='cover', frames=[Frame(MARGIN_L, MARGIN_B,
-                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='cover_f')],
-                onPage=draw_cover),
-            PageTemplate(id='body', frames=[frame], onPage=draw_body),
-            PageTemplate(id='part', frames=[Frame(MARGIN_L, MARGIN_B,
-                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='part_f')],
-                onPage=draw_part),
-            PageTemplate(id='quote', frames=[Frame(MARGIN_L, MARGIN_B,
-                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='quote_f')],
-                onPage=draw_quote),
-        ])
-
-        doc.build(self.flow)
+        print(f"\n  {self.cache.summary()}")
+        deferred = sum(isinstance(f, DeferredFlowables) for f in self.flow)
+        print(f"  Rendering PDF ({len(self.flow)} flowables, "
+              f"{deferred} chapters deferred to layout)...")
+
+        layout = ParallelLayout(self._make_doc, draw_page_number,
+                                numbered=('body',), workers=self.workers)
+        cache = PartCache(CACHE_DIR, 'complete-archive') if self.part_cache else None
+        LINES.attach(CACHE_DIR, 'complete-archive')
+        quotes = self._pull_quotes()
+        pages = self.pages = layout.build(self.flow, str(output_path),
+                                          parts=self._part_keys(), cache=cache,
+                                          contents=self._contents,
+                                          cadence=quotes)
+        LINES.save()
+        if cache is not None:
+            cache.save()
+        DEPS.code(CODE)
+        DEPS.save(CACHE_DIR, 'complete-archive', output_path)
 
         size_kb = os.path.getsize(output_path) / 1024
         size_mb = size_kb / 1024
@@ -1675,6 +1346,20 @@ class CompleteArchiveBuilder:
         print(f"  COMPLETE ARCHIVE GENERATED")
         print(f"  File: {output_path.name}")
         print(f"  Size: {size_mb:.1f} MB ({size_kb:.0f} KB)")
+        print(f"  Pages: {pages}")
+        print(f"  {quotes.summary()}")
+        print(f"  {layout.summary()}")
+        if cache is not None:
+            print(f"  {cache.summary()}")
+        print(f"  {FRAGMENTS.summary()}")
+        print(f"  {LINES.summary()}")
+        print(f"  {WIDTHS.summary()}")
+        print(f"  {STYLES.summary()}")
+        print(f"  {WATCHDOG.summary()}")
+        print(f"  {DEPS.summary()}")
+        peak = peak_rss_mb()
+        if peak is not None:
+            print(f"  Peak RSS: {peak:.0f} MB")
         print(f"  {'='*60}")
         return str(output_path)
 
@@ -1684,7 +1369,14 @@ class CompleteArchiveBuilder:
 # ══════════════════════════════════════════════════════════════
 
 def main():
-    builder = CompleteArchiveBuilder()
+    workers = None
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    if '--watch' in sys.argv:
+        from build_daemon import BuildDaemon
+        BuildDaemon(workers).watch(['complete-archive'])
+        return
+    builder = CompleteArchiveBuilder(workers, part_cache='--no-cache' not in sys.argv)
     path = builder.build()
     print(f"\n  Generated: {path}")
 
@@ -8,7 +8,6 @@ Usage:
 """
 
 import os
-import re
 from pathlib import Path
 
 from reportlab.lib.pagesizes import letter
@@ -17,10 +16,17 @@ from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.platypus import (
-    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer,
+    PageTemplate, Frame, Paragraph, Spacer,
     PageBreak, Table, TableStyle, NextPageTemplate, Flowable
 )
 
+from archivist_pdf.chrome import static_chrome
+from archivist_pdf.deps import DEPS, snapshot
+from archivist_pdf.flowables import WriteArea, BoxedContent
+from archivist_pdf.inline import escape, render_inline
+from archivist_pdf.styles import STYLES
+from archivist_pdf.watchdog import WATCHDOG, WatchedDocTemplate
+
 # ══════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ══════════════════════════════════════════════════════════════
@@ -59,6 +65,10 @@ MARGIN_B = 0.7 * inch
 CONTENT_W = PAGE_W - MARGIN_L - MARGIN_R
 
 OUTPUT_DIR = Path(__file__).parent.parent / "outputs"
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+PACKAGE_DIR = Path(__file__).parent / "archivist_pdf"
+# The code this process runs, hashed once as it is imported (archivist_pdf.deps).
+CODE = snapshot(Path(__file__), *PACKAGE_DIR.glob('*.py'))
 FOOTER_TEXT = "THE ARCHIVIST METHOD\u2122 | CLASSIFIED"
 
 
@@ -106,118 +116,6 @@ class TealDivider(Flowable):
         self.canv.line(mid + 15, 10, mid + 120, 10)
 
 
-class BoxedContent(Flowable):
-    MAX_HEIGHT = 680
-
-    def __init__(self, content_flowables, width=None, bg_color=BG_CALLOUT,
-                 border_color=TEAL, padding=12):
-        Flowable.__init__(self)
-        self._content = [f for f in content_flowables if f is not None]
-        self._box_width = width or CONTENT_W
-        self.bg_color = bg_color
-        self.border_color = border_color
-        self.padding = padding
-        self._height = 0
-
-    def wrap(self, availWidth, availHeight):
-        if not self._content:
-            return (0, 0)
-        self._box_width = min(self._box_width, availWidth)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, max(availHeight - h, 50))
-                h += fh
-            except Exception:
-                h += 14
-        self._height = h + 2 * self.padding
-        if self._height > self.MAX_HEIGHT:
-            self._height = min(self._height, availHeight)
-        return (self._box_width, self._height)
-
-    def split(self, availWidth, availHeight):
-        if not self._content:
-            return []
-        if self._height <= availHeight:
-            return []
-        if availHeight < 200:
-            return []
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        split_idx = 0
-        target = availHeight - 2 * self.padding
-        for idx, f in enumerate(self._content):
-            try:
-                _, fh = f.wrap(inner_w, max(target - h, 50))
-            except Exception:
-                fh = 14
-            if h + fh > target and idx > 0:
-                split_idx = idx
-                break
-            h += fh
-        else:
-            return []
-        if split_idx == 0:
-            return []
-        first = BoxedContent(self._content[:split_idx], self._box_width,
-                             self.bg_color, self.border_color, self.padding)
-        second = BoxedContent(self._content[split_idx:], self._box_width,
-                              self.bg_color, self.border_color, self.padding)
-        return [first, second]
-
-    def draw(self):
-        if not self._content:
-            return
-        self.canv.setFillColor(self.bg_color)
-        self.canv.roundRect(0, 0, self._box_width, self._height, 4, fill=1, stroke=0)
-        if self.border_color:
-            self.canv.setStrokeColor(self.border_color)
-            self.canv.setLineWidth(3)
-            self.canv.line(2, 4, 2, self._height - 4)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        y = self._height - self.padding
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, self._height)
-                if y - fh >= -self.padding:
-                    f.drawOn(self.canv, self.padding + 8, y - fh)
-                y -= fh
-            except Exception:
-                y -= 14
-
-
-class WriteArea(Flowable):
-    """Blank lined area for writing exercises."""
-    def __init__(self, num_lines=4, width=None, label=None):
-        Flowable.__init__(self)
-        self._width = width
-        self.num_lines = num_lines
-        self.label = label
-        self.line_height = 24
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        label_h = 16 if self.label else 0
-        self._height = label_h + self.num_lines * self.line_height + 8
-        return (self._width, self._height)
-
-    def draw(self):
-        y = self._height
-        if self.label:
-            self.canv.setFont('Helvetica-Bold', 9.5)
-            self.canv.setFillColor(TEAL)
-            y -= 14
-            self.canv.drawString(0, y, self.label)
-            y -= 6
-
-        self.canv.setStrokeColor(BORDER_COLOR)
-        self.canv.setLineWidth(0.5)
-        for i in range(self.num_lines):
-            y -= self.line_height
-            self.canv.line(8, y, self._width - 8, y)
-
-
 # ══════════════════════════════════════════════════════════════
 # STYLES
 # ══════════════════════════════════════════════════════════════
@@ -388,6 +286,7 @@ def _draw_bg(c, doc):
     c.restoreState()
 
 
+@static_chrome
 def draw_cover(c, doc):
     _draw_bg(c, doc)
     c.saveState()
@@ -398,7 +297,8 @@ def draw_cover(c, doc):
     c.restoreState()
 
 
-def draw_body(c, doc):
+@static_chrome
+def _body_chrome(c, doc):
     _draw_bg(c, doc)
     c.saveState()
 
@@ -420,11 +320,20 @@ def draw_body(c, doc):
     c.setFont('Helvetica', 7)
     c.setFillColor(TEXT_DIM)
     c.drawString(MARGIN_L, y_ftr - 4, FOOTER_TEXT)
-    c.drawRightString(PAGE_W - MARGIN_R, y_ftr - 4, str(c.getPageNumber()))
 
     c.restoreState()
 
 
+def draw_body(c, doc):
+    _body_chrome(c, doc)
+    c.saveState()
+    c.setFont('Helvetica', 7)
+    c.setFillColor(TEXT_DIM)
+    c.drawRightString(PAGE_W - MARGIN_R, MARGIN_B - 24, str(c.getPageNumber()))
+    c.restoreState()
+
+
+@static_chrome
 def draw_part(c, doc):
     _draw_bg(c, doc)
 
@@ -541,24 +450,17 @@ PATTERN_CIRCUIT_BREAKS = {
 # ══════════════════════════════════════════════════════════════
 
 class CrashCourseBuilder:
-    def __init__(self):
-        self.styles = create_styles()
+    def __init__(self, styles=None):
+        # The build daemon passes a style sheet it keeps warm.
+        self.styles = styles or create_styles()
         self.flow = []
-
-    def _esc(self, text):
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-    def _inline(self, text):
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b><i>\1</i></b>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        return text
+        self.pages = 0
 
     def _gold_box(self, text):
         inner = [
             Paragraph("\u2666 GOLD NUGGET", self.styles['gold_title']),
             Spacer(1, 4),
-            Paragraph(self._esc(text), self.styles['gold_body']),
+            Paragraph(escape(text), self.styles['gold_body']),
         ]
         self.flow.append(Spacer(1, 8))
         self.flow.append(BoxedContent(inner, bg_color=HexColor("#242010"),
@@ -572,7 +474,7 @@ class CrashCourseBuilder:
         ]
         for item in items:
             inner.append(Paragraph(
-                f"\u2022  {self._esc(item)}", self.styles['callout_body']))
+                f"\u2022  {escape(item)}", self.styles['callout_body']))
         self.flow.append(Spacer(1, 8))
         self.flow.append(BoxedContent(inner, bg_color=HexColor("#1A2420"),
                                        border_color=TEAL))
@@ -580,10 +482,10 @@ class CrashCourseBuilder:
 
     def _warning_box(self, title, text):
         inner = [
-            Paragraph(f"\u26A0 {self._esc(title)}", ParagraphStyle(
-                'WarnT', parent=self.styles['callout_title'], textColor=RED_ACCENT)),
+            Paragraph(f"\u26A0 {escape(title)}", STYLES.derive(
+                self.styles['callout_title'], textColor=RED_ACCENT)),
             Spacer(1, 4),
-            Paragraph(self._esc(text), self.styles['warning_body']),
+            Paragraph(escape(text), self.styles['warning_body']),
         ]
         self.flow.append(Spacer(1, 8))
         self.flow.append(BoxedContent(inner, bg_color=HexColor("#2A1A1A"),
@@ -592,12 +494,12 @@ class CrashCourseBuilder:
 
     def _info_box(self, title, items):
         inner = [
-            Paragraph(self._esc(title), self.styles['callout_title']),
+            Paragraph(escape(title), self.styles['callout_title']),
             Spacer(1, 4),
         ]
         for item in items:
             inner.append(Paragraph(
-                f"\u2022  {self._esc(item)}", self.styles['callout_body']))
+                f"\u2022  {escape(item)}", self.styles['callout_body']))
         self.flow.append(Spacer(1, 8))
         self.flow.append(BoxedContent(inner, bg_color=BG_CALLOUT,
                                        border_color=TEAL_DIM))
@@ -625,15 +527,15 @@ class CrashCourseBuilder:
         self.flow.append(PageBreak())
 
     def _p(self, text):
-        self.flow.append(Paragraph(self._inline(self._esc(text)), self.styles['body']))
+        self.flow.append(Paragraph(render_inline(text), self.styles['body']))
 
     def _bullet(self, text):
         self.flow.append(Paragraph(
-            f"\u2022  {self._inline(self._esc(text))}", self.styles['bullet']))
+            f"\u2022  {render_inline(text)}", self.styles['bullet']))
 
     def _num(self, n, text):
         self.flow.append(Paragraph(
-            f'<font color="#14B8A6">{n}.</font>  {self._inline(self._esc(text))}',
+            f'<font color="#14B8A6">{n}.</font>  {render_inline(text)}',
             self.styles['numbered']))
 
     # ════════════════════════════════════════════════════════
@@ -768,11 +670,11 @@ class CrashCourseBuilder:
             inner = [
                 Paragraph(f"PATTERN {pnum}", S['pattern_num']),
                 Paragraph(f"THE {name.upper()} PATTERN", S['pattern_name']),
-                Paragraph(self._esc(tagline), ParagraphStyle(
-                    f'PT_{pnum}', parent=S['pattern_desc'],
+                Paragraph(escape(tagline), STYLES.derive(
+                    S['pattern_desc'],
                     fontName='Helvetica-Oblique', textColor=TEXT_SECONDARY)),
                 Spacer(1, 3),
-                Paragraph(self._esc(origin), S['pattern_desc']),
+                Paragraph(escape(origin), S['pattern_desc']),
             ]
             self.flow.append(BoxedContent(inner, bg_color=BG_CALLOUT,
                                            border_color=TEAL_DIM, padding=10))
@@ -889,8 +791,8 @@ class CrashCourseBuilder:
             name = PATTERN_NAMES[pnum]
             sigs = PATTERN_BODY_SIGNATURES[pnum]
             data.append([
-                Paragraph(self._esc(name), self.styles['table_cell_bold']),
-                Paragraph(self._esc(sigs), self.styles['table_cell']),
+                Paragraph(escape(name), self.styles['table_cell_bold']),
+                Paragraph(escape(sigs), self.styles['table_cell']),
             ])
 
         t = Table(data, colWidths=[1.4 * inch, CONTENT_W - 1.4 * inch])
@@ -949,13 +851,13 @@ class CrashCourseBuilder:
             triggers = PATTERN_TRIGGERS[pnum]
 
             inner = [
-                Paragraph(f"THE {name.upper()} PATTERN", ParagraphStyle(
-                    f'TN_{pnum}', parent=self.styles['callout_title'])),
+                Paragraph(f"THE {name.upper()} PATTERN",
+                          self.styles['callout_title']),
                 Spacer(1, 2),
             ]
             for trig in triggers:
                 inner.append(Paragraph(
-                    f"\u2022  {self._esc(trig)}", self.styles['callout_body']))
+                    f"\u2022  {escape(trig)}", self.styles['callout_body']))
 
             self.flow.append(BoxedContent(inner, bg_color=BG_CALLOUT,
                                            border_color=TEAL_DIM, padding=8))
@@ -1018,19 +920,19 @@ class CrashCourseBuilder:
             scripts = PATTERN_CIRCUIT_BREAKS[pnum]
 
             inner = [
-                Paragraph(f"PATTERN {pnum}: {name.upper()}", ParagraphStyle(
-                    f'CB_{pnum}', parent=self.styles['callout_title'])),
+                Paragraph(f"PATTERN {pnum}: {name.upper()}",
+                          self.styles['callout_title']),
                 Spacer(1, 6),
-                Paragraph("Full script:", ParagraphStyle(
-                    f'CBL_{pnum}', parent=self.styles['callout_body'],
+                Paragraph("Full script:", STYLES.derive(
+                    self.styles['callout_body'],
                     textColor=TEXT_SECONDARY, fontSize=9)),
-                Paragraph(f'"{self._esc(scripts["full"])}"',
+                Paragraph(f'"{escape(scripts["full"])}"',
                           self.styles['script']),
                 Spacer(1, 4),
-                Paragraph("Short version:", ParagraphStyle(
-                    f'CBS_{pnum}', parent=self.styles['callout_body'],
+                Paragraph("Short version:", STYLES.derive(
+                    self.styles['callout_body'],
                     textColor=TEXT_SECONDARY, fontSize=9)),
-                Paragraph(f'"{self._esc(scripts["short"])}"',
+                Paragraph(f'"{escape(scripts["short"])}"',
                           self.styles['script_short']),
             ]
             self.flow.append(BoxedContent(inner, bg_color=BG_CALLOUT,
@@ -1349,7 +1251,7 @@ class CrashCourseBuilder:
         ]
         for f in features:
             inner_ca.append(Paragraph(
-                f"\u2022  {self._esc(f)}", S['callout_body']))
+                f"\u2022  {escape(f)}", S['callout_body']))
         inner_ca.append(Spacer(1, 8))
         inner_ca.append(Paragraph("$297", ParagraphStyle(
             'CAPrice', parent=S['callout_body'], fontName='Helvetica-Bold',
@@ -1392,6 +1294,7 @@ class CrashCourseBuilder:
         print(f"  Output: {output_path}")
         print(f"{'='*60}\n")
 
+        DEPS.start()
         print("  [1/10] Title page...")
         self._section_title_page()
         print("  [2/10] What This Is...")
@@ -1416,7 +1319,7 @@ class CrashCourseBuilder:
 
         print(f"\n  Rendering PDF ({len(self.flow)} flowables)...")
 
-        doc = BaseDocTemplate(
+        doc = WatchedDocTemplate(
             str(output_path), pagesize=letter,
             leftMargin=MARGIN_L, rightMargin=MARGIN_R,
             topMargin=MARGIN_T, bottomMargin=MARGIN_B,
@@ -1438,10 +1341,18 @@ class CrashCourseBuilder:
         ])
 
         doc.build(self.flow)
+        self.pages = doc.page
+        # The course text lives in this file; its code is all it reads.
+        DEPS.code(CODE)
+        DEPS.save(CACHE_DIR, 'crash-course', output_path)
 
         size_kb = os.path.getsize(output_path) / 1024
         print(f"\n  Done! {output_path.name}")
         print(f"  Size: {size_kb:.0f} KB")
+        print(f"  Pages: {doc.page}")
+        print(f"  {STYLES.summary()}")
+        print(f"  {WATCHDOG.summary()}")
+        print(f"  {DEPS.summary()}")
         return str(output_path)
 
 
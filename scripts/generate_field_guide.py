@@ -4,18 +4,43 @@ THE ARCHIVIST METHOD - Field Guide PDF Generator
 Generates pattern-specific field guide PDFs with dark theme styling.
 
 Usage:
-    python3 generate_field_guide.py <pattern_number>
-    python3 generate_field_guide.py 1  # Generates Disappearing pattern guide
+    python3 generate_field_guide.py <pattern_number>... [--workers N] [--no-cache]
+    python3 generate_field_guide.py 1      # Generates Disappearing pattern guide
+    python3 generate_field_guide.py 2 5 7  # Three guides in one run
+    python3 generate_field_guide.py all    # All nine guides
+    python3 generate_field_guide.py 4 --watch  # Rebuild on content edits
 
 Pattern numbers:
     1: Disappearing    2: Apology Loop    3: Testing
     4: Attraction to Harm    5: Draining Bond    6: Compliment Deflection
     7: Perfectionism    8: Success Sabotage    9: Rage
+
+Every guide shares its Welcome, Four Doors, 90-Day, Crisis and Templates
+sections with the other eight. Each guide is laid out in parts kept in
+.cache/parts-v2/field-guide/: the shared parts are laid out by whichever
+guide builds first and reused by the rest, so a guide after the first lays
+out only its title page, its pattern and its closing page. Page numbers
+and the running head are drawn when the parts are merged (--no-cache: lay
+out the whole guide, keep nothing).
+
+With several guides, one run parses every source and builds the styles
+once, builds the first guide itself -- laying out the shared parts -- and
+forks one worker per core (--workers to choose) for the rest, which
+inherit all of it warm. It prints a line per guide: pages, size, time.
+
+--watch keeps rebuilding the given guides as their sources are edited,
+laying out only the parts that changed (see build_daemon.py).
 """
 
+import contextlib
+import hashlib
+import io
+import multiprocessing
 import sys
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from reportlab.lib.pagesizes import letter
@@ -24,8 +49,30 @@ from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.platypus import (
-    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer,
-    PageBreak, Table, TableStyle, NextPageTemplate, Flowable
+    PageTemplate, Frame, Spacer,
+    PageBreak, NextPageTemplate
+)
+
+from archivist_pdf.cache import BlockCache
+from archivist_pdf.chrome import static_chrome
+from archivist_pdf.deps import DEPS, snapshot
+from archivist_pdf.flowables import (
+    HorizontalRule, TealDivider, WriteLine, BoxedContent,
+)
+from archivist_pdf.inline import escape, render_inline
+from archivist_pdf.lazy import DeferredFlowables, ExpandingDocTemplate
+from archivist_pdf.lower import FlowableLowering
+from archivist_pdf.metrics import WIDTHS
+from archivist_pdf.parallel import ParallelLayout
+from archivist_pdf.paragraphs import FRAGMENTS, LINES, Paragraph
+from archivist_pdf.partcache import PartCache, code_version
+from archivist_pdf.styles import STYLES
+from archivist_pdf.watchdog import WATCHDOG, SourceText, source_of
+from archivist_pdf.toc import CONTENTS, ContentsLine, mark
+from archivist_pdf.theme import (
+    BG_DARK, BG_CALLOUT, TEAL, TEAL_DIM, GOLD, WHITE, TEXT_PRIMARY,
+    TEXT_SECONDARY, TEXT_DIM, BORDER_COLOR,
+    PAGE_W, PAGE_H, MARGIN_L, MARGIN_R, MARGIN_T, MARGIN_B, CONTENT_W,
 )
 
 # ══════════════════════════════════════════════════════════════
@@ -68,170 +115,16 @@ PATTERN_TAGLINES = {
     9: "The anger is not proportional. It is old. It belongs to another room.",
 }
 
-# ── Design Specs (Match Complete Archive) ──
-BG_DARK = HexColor("#1A1A1A")          # Background on ALL pages
-BG_CALLOUT = HexColor("#242424")       # Callout box background
-BG_CODE = HexColor("#222222")          # Code block background
-TEAL = HexColor("#14B8A6")             # Primary accent
-TEAL_DIM = HexColor("#0F7B6E")         # Dimmed teal
-GOLD = HexColor("#F59E0B")             # Gold nugget accent
-WHITE = HexColor("#FFFFFF")            # Headers
-TEXT_PRIMARY = HexColor("#E5E5E5")     # Body text
-TEXT_SECONDARY = HexColor("#9CA3AF")   # Secondary text
-TEXT_DIM = HexColor("#6B7280")         # Dim text
-BORDER_COLOR = HexColor("#333333")     # Subtle borders
-RED_ACCENT = HexColor("#EF4444")       # Warning accent
-
-PAGE_W, PAGE_H = letter
-MARGIN_L = 0.75 * inch
-MARGIN_R = 0.75 * inch
-MARGIN_T = 0.7 * inch
-MARGIN_B = 0.7 * inch
-CONTENT_W = PAGE_W - MARGIN_L - MARGIN_R
-
-CONTENT_DIR = Path(__file__).parent.parent / "content" / "book"
+CONTENT_DIR = Path(__file__).parent.parent / "the-archivist-method"
 OUTPUT_DIR = Path(__file__).parent.parent / "outputs"
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+PACKAGE_DIR = Path(__file__).parent / "archivist_pdf"
+# The code this process runs, hashed once as it is imported (archivist_pdf.deps).
+CODE = snapshot(Path(__file__), *PACKAGE_DIR.glob('*.py'))
 
 FOOTER_TEXT = "THE ARCHIVIST METHOD\u2122 | CLASSIFIED"
 
 
-# ══════════════════════════════════════════════════════════════
-# CUSTOM FLOWABLES
-# ══════════════════════════════════════════════════════════════
-
-class HorizontalRule(Flowable):
-    def __init__(self, width=None, color=TEAL_DIM, thickness=1):
-        Flowable.__init__(self)
-        self._width = width
-        self.color = color
-        self.thickness = thickness
-
-    def draw(self):
-        self.canv.setStrokeColor(self.color)
-        self.canv.setLineWidth(self.thickness)
-        self.canv.line(0, 0, self._width or CONTENT_W, 0)
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        return (self._width, self.thickness + 6)
-
-
-class TealDivider(Flowable):
-    def __init__(self, width=None):
-        Flowable.__init__(self)
-        self._width = width
-
-    def wrap(self, availWidth, availHeight):
-        self._width = self._width or availWidth
-        return (self._width, 20)
-
-    def draw(self):
-        mid = self._width / 2
-        self.canv.setStrokeColor(TEAL_DIM)
-        self.canv.setLineWidth(0.5)
-        self.canv.line(mid - 120, 10, mid - 15, 10)
-        self.canv.setFillColor(TEAL)
-        self.canv.saveState()
-        self.canv.translate(mid, 10)
-        self.canv.rotate(45)
-        self.canv.rect(-4, -4, 8, 8, fill=1, stroke=0)
-        self.canv.restoreState()
-        self.canv.line(mid + 15, 10, mid + 120, 10)
-
-
-class BoxedContent(Flowable):
-    """Content in a styled box with background and left border.
-    Falls back to inline rendering if content exceeds page height."""
-    MAX_HEIGHT = 680  # Max height before falling back to splitting
-
-    def __init__(self, content_flowables, width=None, bg_color=BG_CALLOUT,
-                 border_color=TEAL, padding=12):
-        Flowable.__init__(self)
-        self._content = [f for f in content_flowables if f is not None]
-        self._box_width = width or CONTENT_W
-        self.bg_color = bg_color
-        self.border_color = border_color
-        self.padding = padding
-        self._height = 0
-        self._too_tall = False
-
-    def wrap(self, availWidth, availHeight):
-        if not self._content:
-            return (0, 0)
-        self._box_width = min(self._box_width, availWidth)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, max(availHeight - h, 50))
-                h += fh
-            except Exception:
-                h += 14  # fallback line height
-        self._height = h + 2 * self.padding
-        if self._height > self.MAX_HEIGHT:
-            self._too_tall = True
-            self._height = min(self._height, availHeight)
-        return (self._box_width, self._height)
-
-    def split(self, availWidth, availHeight):
-        """If too large for current page, move to next page. If too tall for any
-        page, break into two BoxedContent pieces."""
-        if not self._content:
-            return []
-        if self._height <= availHeight:
-            return []  # fits, no split needed
-
-        # Try to fit on next page (return empty = move to next page)
-        if availHeight < 200:
-            return []
-
-        # Split content: find a split point
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        h = 0
-        split_idx = 0
-        target = availHeight - 2 * self.padding
-        for idx, f in enumerate(self._content):
-            try:
-                _, fh = f.wrap(inner_w, max(target - h, 50))
-            except Exception:
-                fh = 14
-            if h + fh > target and idx > 0:
-                split_idx = idx
-                break
-            h += fh
-        else:
-            return []  # can't split meaningfully
-
-        if split_idx == 0:
-            return []
-
-        first = BoxedContent(self._content[:split_idx], self._box_width,
-                             self.bg_color, self.border_color, self.padding)
-        second = BoxedContent(self._content[split_idx:], self._box_width,
-                              self.bg_color, self.border_color, self.padding)
-        return [first, second]
-
-    def draw(self):
-        if not self._content:
-            return
-        self.canv.setFillColor(self.bg_color)
-        self.canv.roundRect(0, 0, self._box_width, self._height, 4, fill=1, stroke=0)
-        if self.border_color:
-            self.canv.setStrokeColor(self.border_color)
-            self.canv.setLineWidth(3)
-            self.canv.line(2, 4, 2, self._height - 4)
-        inner_w = max(self._box_width - 2 * self.padding - 8, 50)
-        y = self._height - self.padding
-        for f in self._content:
-            try:
-                _, fh = f.wrap(inner_w, self._height)
-                if y - fh >= -self.padding:
-                    f.drawOn(self.canv, self.padding + 8, y - fh)
-                y -= fh
-            except Exception:
-                y -= 14
-
-
 # ══════════════════════════════════════════════════════════════
 # STYLES
 # ══════════════════════════════════════════════════════════════
@@ -394,6 +287,7 @@ def _draw_bg(c, doc):
     c.restoreState()
 
 
+@static_chrome
 def draw_cover(c, doc):
     _draw_bg(c, doc)
     c.saveState()
@@ -406,7 +300,8 @@ def draw_cover(c, doc):
     c.restoreState()
 
 
-def draw_body(c, doc):
+@static_chrome
+def _body_chrome(c, doc):
     _draw_bg(c, doc)
     c.saveState()
 
@@ -425,7 +320,7 @@ def draw_body(c, doc):
         c.drawRightString(PAGE_W - MARGIN_R, y_hdr + 2,
                           f"FIELD GUIDE: THE {pname.upper()} PATTERN")
 
-    # Footer: line + classified text + page number
+    # Footer: line + classified text
     y_ftr = MARGIN_B - 20
     c.setStrokeColor(BORDER_COLOR)
     c.line(MARGIN_L, y_ftr + 8, PAGE_W - MARGIN_R, y_ftr + 8)
@@ -433,306 +328,36 @@ def draw_body(c, doc):
     c.setFont('Helvetica', 7)
     c.setFillColor(TEXT_DIM)
     c.drawString(MARGIN_L, y_ftr - 4, FOOTER_TEXT)
-    c.drawRightString(PAGE_W - MARGIN_R, y_ftr - 4,
-                      str(c.getPageNumber()))
 
     c.restoreState()
 
 
-def draw_part(c, doc):
-    _draw_bg(c, doc)
-
-
-# ══════════════════════════════════════════════════════════════
-# MARKDOWN PARSER
-# ══════════════════════════════════════════════════════════════
-
-class MarkdownParser:
-    """Converts markdown to reportlab flowables with Archivist dark theme."""
-
-    def __init__(self, styles):
-        self.styles = styles
-
-    def _esc(self, text):
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-    def _inline(self, text):
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<b><i>\1</i></b>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        teal_hex = TEAL.hexval()[2:] if hasattr(TEAL, 'hexval') else '14B8A6'
-        text = re.sub(r'`([^`]+)`',
-            lambda m: f'<font face="Courier" color="#{teal_hex}">{m.group(1)}</font>', text)
-        text = text.replace('\u2014', '\u2014')  # em dash
-        return text
-
-    def parse(self, md_text):
-        """Parse markdown into flowables."""
-        out = []
-        lines = md_text.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-            s = line.strip()
-
-            if not s:
-                i += 1
-                continue
-
-            # Skip top-level headings with section numbers (handled externally as chapter titles)
-            if s.startswith('# ') and re.match(r'^# \d+\.\d+', s):
-                i += 1
-                continue
-
-            # ═══ boxed blocks (Gold Nuggets, Key Takeaways, Quick Wins, etc.)
-            if '\u2550' in s or '\u2500' in s:  # ═ or ─
-                header_line = s
-                block = []
-                i += 1
-                while i < len(lines):
-                    ls = lines[i].strip()
-                    if '\u2550' in ls or '\u2500' in ls:
-                        i += 1
-                        break
-                    block.append(ls)
-                    i += 1
-                text = '\n'.join(block).strip()
-                if text:
-                    out.extend(self._box(text, header_line))
-                continue
-
-            # Code blocks
-            if s.startswith('```'):
-                code = []
-                i += 1
-                while i < len(lines):
-                    if lines[i].strip().startswith('```'):
-                        i += 1
-                        break
-                    code.append(lines[i])
-                    i += 1
-                out.extend(self._code_block('\n'.join(code)))
-                continue
+def draw_body(c, doc):
+    _body_chrome(c, doc)
+    draw_page_number(c, c.getPageNumber())
 
-            # Headers
-            if s.startswith('####'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['sub3_header']))
-                i += 1; continue
-
-            if s.startswith('###'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['subsection_header']))
-                i += 1; continue
-
-            if s.startswith('##'):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Spacer(1, 4))
-                out.append(Paragraph(t, self.styles['section_header']))
-                out.append(HorizontalRule(color=TEAL_DIM))
-                out.append(Spacer(1, 4))
-                i += 1; continue
-
-            if s.startswith('# '):
-                t = self._inline(self._esc(s.lstrip('#').strip()))
-                out.append(Paragraph(t, self.styles['chapter_title']))
-                i += 1; continue
-
-            # Horizontal rule
-            if s in ('---', '***', '___'):
-                out.append(Spacer(1, 6))
-                out.append(TealDivider())
-                out.append(Spacer(1, 6))
-                i += 1; continue
-
-            # Timestamps [T+00:00]
-            if re.match(r'^\*?\*?\[T[+-]\d+:\d+\]', s):
-                t = self._inline(self._esc(s.strip('*')))
-                out.append(Paragraph(t, self.styles['timestamp']))
-                i += 1; continue
-
-            # Tables
-            if '|' in s and i + 1 < len(lines) and '---' in lines[i + 1]:
-                table_lines = []
-                while i < len(lines) and '|' in lines[i].strip():
-                    table_lines.append(lines[i].strip())
-                    i += 1
-                out.extend(self._table(table_lines))
-                continue
 
-            # Bullet points
-            if s.startswith('- ') or s.startswith('\u2022 '):
-                bt = self._inline(self._esc(s[2:].strip()))
-                out.append(Paragraph(
-                    f'\u2022  {bt}', self.styles['bullet']))
-                i += 1; continue
-
-            # Numbered list
-            nm = re.match(r'^(\d+)\.\s+(.+)', s)
-            if nm:
-                num, txt = nm.group(1), nm.group(2).strip()
-                txt = self._inline(self._esc(txt))
-                teal_hex = TEAL.hexval()[2:] if hasattr(TEAL, 'hexval') else '14B8A6'
-                out.append(Paragraph(
-                    f'<font color="#{teal_hex}">{num}.</font>  {txt}',
-                    self.styles['numbered']))
-                i += 1; continue
-
-            # Regular paragraph (collect continuation lines)
-            paras = [s]
-            i += 1
-            while i < len(lines):
-                ns = lines[i].strip()
-                if (not ns or ns.startswith('#') or ns.startswith('- ') or
-                    ns.startswith('\u2022 ') or ns.startswith('```') or
-                    '\u2550' in ns or ns in ('---', '***', '___') or
-                    re.match(r'^\d+\.', ns) or re.match(r'^\*?\*?\[T[+-]', ns) or
-                    ('|' in ns and i + 1 < len(lines) and '---' in lines[i + 1])):
-                    break
-                paras.append(ns)
-                i += 1
-            full = ' '.join(paras)
-            full = self._inline(self._esc(full))
-            out.append(Paragraph(full, self.styles['body']))
+def draw_page_number(c, number):
+    c.saveState()
+    c.setFont('Helvetica', 7)
+    c.setFillColor(TEXT_DIM)
+    c.drawRightString(PAGE_W - MARGIN_R, MARGIN_B - 24, str(number))
+    c.restoreState()
 
-        return out
 
-    def _detect_type(self, header, text):
-        c = (header + ' ' + text).upper()
-        if 'GOLD NUGGET' in c: return 'gold'
-        if 'KEY TAKEAWAY' in c: return 'takeaway'
-        if 'QUICK WIN' in c: return 'quickwin'
-        if 'WARNING' in c or 'BEFORE YOU' in c or '\u26A0' in c: return 'warning'
-        if 'ARCHIVIST OBSERVES' in c: return 'archivist'
-        if 'PATTERN ARCHAEOLOGY' in c and 'SUBJECT' in c: return 'log'
-        if 'PATTERN EXECUTION LOG' in c: return 'log'
-        if 'COPY TO PHONE' in c or 'QUICK REFERENCE' in c: return 'reference'
-        return 'info'
-
-    def _box(self, text, header=""):
-        out = []
-        btype = self._detect_type(header, text)
-
-        configs = {
-            'gold':      (GOLD, HexColor("#242010"), 'gold_title', 'gold_body', '\u2666 GOLD NUGGET'),
-            'takeaway':  (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', '\u2611 KEY TAKEAWAYS'),
-            'quickwin':  (HexColor("#22C55E"), HexColor("#1A2A1A"), 'callout_title', 'callout_body', '\u26A1 QUICK WIN'),
-            'warning':   (RED_ACCENT, HexColor("#2A1A1A"), 'callout_title', 'warning_body', '\u26A0 IMPORTANT'),
-            'archivist': (TEAL_DIM, HexColor("#1E2428"), 'callout_title', 'callout_body', '\U0001F4DC THE ARCHIVIST OBSERVES'),
-            'log':       (TEAL_DIM, BG_CODE, 'callout_title', 'callout_body', None),
-            'reference': (TEAL, HexColor("#1A2420"), 'callout_title', 'callout_body', None),
-            'info':      (TEAL_DIM, BG_CALLOUT, 'callout_title', 'callout_body', None),
-        }
-
-        border, bg, title_key, body_key, default_title = configs.get(btype, configs['info'])
-
-        # For quickwin/warning, create custom title style with different color
-        title_style = self.styles[title_key]
-        if btype == 'quickwin':
-            title_style = ParagraphStyle(f'QW_{id(text)}', parent=title_style,
-                                         textColor=HexColor("#22C55E"))
-        elif btype == 'warning':
-            title_style = ParagraphStyle(f'WN_{id(text)}', parent=title_style,
-                                         textColor=RED_ACCENT)
-        body_style = self.styles[body_key]
-
-        inner = []
-        block_lines = text.split('\n')
-        start = 0
-        title = default_title
-
-        # Detect title in first line of block
-        for idx, bl in enumerate(block_lines):
-            bl_s = bl.strip()
-            if not bl_s: continue
-            emoji_markers = ['\U0001F48E', '\U0001F511', '\u26A1', '\u26A0', '\U0001F4DC']
-            keywords = ['GOLD NUGGET', 'KEY TAKEAWAY', 'QUICK WIN', 'WARNING', 'BEFORE YOU', 'ARCHIVIST OBSERVES']
-            if any(k in bl_s.upper() for k in keywords) or any(e in bl_s for e in emoji_markers):
-                if title is None:
-                    title = re.sub(r'[💎🔑⚡⚠️📜\s]+$', '', bl_s).strip()
-                    title = re.sub(r'^[💎🔑⚡⚠️📜\s]+', '', title).strip()
-                start = idx + 1
-                break
-            break
-
-        if title:
-            inner.append(Paragraph(self._esc(title), title_style))
-            inner.append(Spacer(1, 4))
+def draw_running_head(c, pname):
+    """The guide's name in the header, for parts laid out without it."""
+    c.saveState()
+    c.setFont('Helvetica', 7)
+    c.setFillColor(TEAL_DIM)
+    c.drawRightString(PAGE_W - MARGIN_R, PAGE_H - MARGIN_T + 20,
+                      f"FIELD GUIDE: THE {pname.upper()} PATTERN")
+    c.restoreState()
 
-        remaining = '\n'.join(block_lines[start:]).strip()
-        if remaining:
-            for ln in remaining.split('\n'):
-                ls = ln.strip()
-                if not ls:
-                    inner.append(Spacer(1, 3))
-                    continue
-                if ls.startswith('- ') or ls.startswith('\u2022 '):
-                    bt = self._inline(self._esc(ls[2:]))
-                    inner.append(Paragraph(f'\u2022  {bt}', ParagraphStyle(
-                        f'BB_{id(ls)}', parent=body_style, leftIndent=16)))
-                else:
-                    inner.append(Paragraph(self._inline(self._esc(ls)), body_style))
-
-        out.append(Spacer(1, 6))
-        out.append(BoxedContent(inner, bg_color=bg, border_color=border))
-        out.append(Spacer(1, 10))
-        return out
 
-    def _code_block(self, code):
-        out = [Spacer(1, 4)]
-        inner = []
-        for ln in code.split('\n'):
-            escaped = self._esc(ln) if ln.strip() else ' '
-            inner.append(Paragraph(escaped, self.styles['code']))
-        out.append(BoxedContent(inner, bg_color=BG_CODE, border_color=TEAL_DIM))
-        out.append(Spacer(1, 6))
-        return out
-
-    def _table(self, table_lines):
-        out = []
-        if len(table_lines) < 3:
-            return out
-
-        headers = [c.strip() for c in table_lines[0].split('|') if c.strip()]
-        rows = []
-        for line in table_lines[2:]:  # skip header separator
-            cells = [c.strip() for c in line.split('|') if c.strip()]
-            if cells:
-                rows.append(cells)
-
-        if not headers or not rows:
-            return out
-
-        # Build table data
-        data = [[Paragraph(self._esc(h), self.styles['table_header']) for h in headers]]
-        for row in rows:
-            data.append([Paragraph(self._inline(self._esc(c)), self.styles['table_cell'])
-                        for c in row])
-
-        # Pad rows to have same number of columns
-        ncols = len(headers)
-        for row in data:
-            while len(row) < ncols:
-                row.append(Paragraph('', self.styles['table_cell']))
-
-        col_w = CONTENT_W / ncols
-        t = Table(data, colWidths=[col_w] * ncols)
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor("#222222")),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor("#1E1E1E")),
-            ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-
-        out.append(Spacer(1, 6))
-        out.append(t)
-        out.append(Spacer(1, 8))
-        return out
+@static_chrome
+def draw_part(c, doc):
+    _draw_bg(c, doc)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -740,9 +365,10 @@ class MarkdownParser:
 # ══════════════════════════════════════════════════════════════
 
 def load_file(path):
+    DEPS.read(path)
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
+            return SourceText(f.read(), path)
     except FileNotFoundError:
         print(f"  [warn] Not found: {path}")
         return ""
@@ -759,12 +385,14 @@ def find_pattern_file(pattern_num, section_key, suffix):
         path = base / dir_name / filename
         if path.exists():
             return load_file(path)
+        DEPS.read(path)   # adding it later changes the guide
 
     # Try flat
     path = base / filename
     if path.exists():
         return load_file(path)
 
+    DEPS.read(path)
     print(f"  [warn] Pattern file not found: {filename}")
     return ""
 
@@ -796,21 +424,45 @@ def get_all_at_a_glance(exclude_num):
     return result
 
 
+def guide_sources(pnum):
+    """Every markdown file a pattern's guide reads, in section order."""
+    patterns = CONTENT_DIR / "module-3-patterns"
+    files = []
+    for d in (CONTENT_DIR / "module-1-foundation",
+              CONTENT_DIR / "module-2-four-doors",
+              patterns / PATTERN_DIR_NAMES[pnum]):
+        files += sorted(d.glob('*.md'))
+    files += sorted(patterns.glob('*/*.0-at-a-glance.md'))
+    for d in (CONTENT_DIR / "module-4-implementation",
+              CONTENT_DIR / "module-0-emergency"):
+        files += sorted(d.glob('*.md'))
+    return files
+
+
 # ══════════════════════════════════════════════════════════════
 # FIELD GUIDE BUILDER
 # ══════════════════════════════════════════════════════════════
 
 class FieldGuideBuilder:
-    def __init__(self, pattern_num):
+    def __init__(self, pattern_num, workers=None, part_cache=True,
+                 styles=None, cache=None):
         self.pnum = pattern_num
+        self.workers = workers
+        self.part_cache = part_cache
         self.name = PATTERN_NAMES[pattern_num]
         self.tagline = PATTERN_TAGLINES[pattern_num]
-        self.styles = create_styles()
-        self.parser = MarkdownParser(self.styles)
+        # A batch passes the style sheet and parse cache every guide shares.
+        self.styles = styles or create_styles()
+        self.cache = cache or BlockCache(CACHE_DIR)
+        WIDTHS.install()
+        self.parser = FlowableLowering(self.styles, cache=self.cache)
         self.flow = []
+        self.parts = []         # [name, flow index, digest of what it reads]
+        self.pages = 0
 
     # ── 1. TITLE PAGE ──
     def _section_title_page(self):
+        self._begin_part(f"front-{self.pnum}")
         self.flow.append(NextPageTemplate('cover'))
         self.flow.append(Spacer(1, 2.0 * inch))
         self.flow.append(Paragraph("THE ARCHIVIST METHOD", self.styles['cover_series']))
@@ -838,10 +490,16 @@ class FieldGuideBuilder:
 
     # ── 2. TABLE OF CONTENTS ──
     def _section_toc(self):
-        self.flow.append(Spacer(1, 0.2 * inch))
-        self.flow.append(Paragraph("CONTENTS", self.styles['toc_heading']))
-        self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
-        self.flow.append(Spacer(1, 12))
+        self.flow.extend(self._contents())
+
+    def _contents(self):
+        """The contents; ParallelLayout numbers a second copy. An entry's
+        key is the title it points at: its chapter title upper-cased, or
+        the one given alongside it."""
+        out = [Spacer(1, 0.2 * inch),
+               mark(Paragraph("CONTENTS", self.styles['toc_heading']), CONTENTS),
+               HorizontalRule(color=TEAL, thickness=1.5),
+               Spacer(1, 12)]
 
         sections = [
             ("01  WELCOME", ["What This Is", "Why Not Therapy", "Why This Is Different"]),
@@ -851,31 +509,39 @@ class FieldGuideBuilder:
                 "At a Glance", "What It Is", "Pattern in Context", "Pattern Markers",
                 "Execution Log", "The Circuit", "Pattern Archaeology", "What It Costs",
                 "How to Interrupt It", "The Rewrite", "Troubleshooting", "Quick Reference"]),
-            ("04  THE OTHER 8 PATTERNS", ["Brief overview of each pattern"]),
+            ("04  THE OTHER 8 PATTERNS", [
+                ("Brief overview of each pattern", "THE OTHER 8 PATTERNS")]),
             ("05  THE 90-DAY PROTOCOL", [
                 "The 90-Day Map", "Daily Practice Protocol",
                 "Weekly Check-In", "Progress Markers"]),
             ("06  CRISIS PROTOCOLS", [
-                "You Just Ran Your Pattern", "Five-Minute Emergency",
+                "You Just Ran Your Pattern",
+                ("Five-Minute Emergency", "FIVE-MINUTE EMERGENCY PROTOCOL"),
                 "Which Pattern Ran?", "Crisis Triage"]),
             ("07  TRACKING TEMPLATES", [
-                "Pattern Execution Log", "Weekly Check-In Template",
-                "Pattern Archaeology Report", "90-Day Review"]),
+                ("Pattern Execution Log", "PATTERN EXECUTION LOG TEMPLATE"),
+                ("Weekly Check-In Template", "WEEKLY CHECK-IN TEMPLATE"),
+                ("Pattern Archaeology Report", "PATTERN ARCHAEOLOGY REPORT TEMPLATE"),
+                ("90-Day Review", "90-DAY REVIEW TEMPLATE")]),
             ("08  WHAT\u2019S NEXT", ["The Complete Archive"]),
         ]
 
         dim_hex = TEXT_DIM.hexval()[2:] if hasattr(TEXT_DIM, 'hexval') else '6B7280'
         for heading, entries in sections:
-            self.flow.append(Paragraph(heading, self.styles['toc_section']))
+            out.append(ContentsLine(heading, f"SECTION {heading[:2]}",
+                                    self.styles['toc_section']))
             for e in entries:
-                self.flow.append(Paragraph(
-                    f'<font color="#{dim_hex}">\u2500\u2500</font>  {e}',
+                e, key = e if isinstance(e, tuple) else (e, e.upper())
+                out.append(ContentsLine(
+                    f'<font color="#{dim_hex}">\u2500\u2500</font>  {e}', key,
                     self.styles['toc_entry']))
 
-        self.flow.append(PageBreak())
+        out.append(PageBreak())
+        return out
 
     # ── 3. WELCOME ──
     def _section_welcome(self):
+        self._begin_part("foundation")
         self._part_divider("01", "WELCOME",
             "What The Archivist Method is, why it exists, and how it works.")
 
@@ -904,6 +570,7 @@ class FieldGuideBuilder:
 
     # ── 5. YOUR PATTERN ──
     def _section_your_pattern(self):
+        self._begin_part(f"pattern-{self.pnum}")
         self._part_divider("03", f"THE {self.name.upper()} PATTERN", self.tagline)
 
         pattern_files = get_pattern_files(self.pnum)
@@ -934,10 +601,11 @@ class FieldGuideBuilder:
             "Brief overview of each pattern. Awareness without deep dive.")
 
         overviews = get_all_at_a_glance(self.pnum)
+        self._note('overviews', overviews)
 
         self.flow.append(Spacer(1, 0.15 * inch))
-        self.flow.append(Paragraph("THE OTHER 8 PATTERNS",
-            self.styles['chapter_title']))
+        self.flow.append(mark(Paragraph("THE OTHER 8 PATTERNS",
+            self.styles['chapter_title']), "THE OTHER 8 PATTERNS"))
         self.flow.append(Paragraph(
             "You may run more than one pattern. Here is a brief overview of each.",
             self.styles['chapter_subtitle']))
@@ -956,8 +624,8 @@ class FieldGuideBuilder:
             inner.append(Paragraph(
                 f"PATTERN {pnum}: THE {pname.upper()} PATTERN",
                 self.styles['pattern_card_name']))
-            inner.append(Paragraph(ptagline, ParagraphStyle(
-                f'PT_{pnum}', parent=self.styles['pattern_card_body'],
+            inner.append(Paragraph(ptagline, STYLES.derive(
+                self.styles['pattern_card_body'],
                 textColor=TEXT_SECONDARY, fontName='Helvetica-Oblique')))
             inner.append(Spacer(1, 4))
 
@@ -972,7 +640,7 @@ class FieldGuideBuilder:
                         val = match.group(1).strip()
                         label = field.rstrip(':')
                         inner.append(Paragraph(
-                            f'<b>{self.parser._esc(label)}:</b> {self.parser._inline(self.parser._esc(val))}',
+                            f'<b>{escape(label)}:</b> {render_inline(val)}',
                             self.styles['pattern_card_body']))
 
             self.flow.append(BoxedContent(inner, bg_color=BG_CALLOUT,
@@ -983,6 +651,7 @@ class FieldGuideBuilder:
 
     # ── 7. 90-DAY PROTOCOL ──
     def _section_90_day(self):
+        self._begin_part("protocols")
         self._part_divider("05", "THE 90-DAY PROTOCOL",
             "Four phases. Twelve weeks. The minimum viable path to pattern interruption.")
 
@@ -1019,6 +688,12 @@ class FieldGuideBuilder:
         for title, subtitle, path in files:
             self._chapter(title, load_file(path), subtitle, page_break=False)
 
+    def _ws_line(self, line):
+        """A template answer line; an all-underscore blank is ruled instead."""
+        if line.strip('_'):
+            return Paragraph(line, self.styles['ws_line'])
+        return WriteLine(self.styles['ws_line'], len(line))
+
     # ── 9. TRACKING TEMPLATES ──
     def _section_templates(self):
         self._part_divider("07", "TRACKING TEMPLATES",
@@ -1027,7 +702,8 @@ class FieldGuideBuilder:
         S = self.styles
 
         # ── Template 1: Pattern Execution Log ──
-        self.flow.append(Paragraph("PATTERN EXECUTION LOG", S['ws_title']))
+        self.flow.append(mark(Paragraph("PATTERN EXECUTION LOG", S['ws_title']),
+                              "PATTERN EXECUTION LOG TEMPLATE"))
         self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
         self.flow.append(Spacer(1, 6))
         self.flow.append(Paragraph(
@@ -1049,12 +725,13 @@ class FieldGuideBuilder:
         ]
         for label, line in fields:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
 
         self.flow.append(PageBreak())
 
         # ── Template 2: Weekly Check-In ──
-        self.flow.append(Paragraph("WEEKLY CHECK-IN", S['ws_title']))
+        self.flow.append(mark(Paragraph("WEEKLY CHECK-IN", S['ws_title']),
+                              "WEEKLY CHECK-IN TEMPLATE"))
         self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
         self.flow.append(Spacer(1, 6))
         self.flow.append(Paragraph(
@@ -1079,12 +756,13 @@ class FieldGuideBuilder:
         ]
         for label, line in fields2:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
 
         self.flow.append(PageBreak())
 
         # ── Template 3: Pattern Archaeology Report ──
-        self.flow.append(Paragraph("PATTERN ARCHAEOLOGY REPORT", S['ws_title']))
+        self.flow.append(mark(Paragraph("PATTERN ARCHAEOLOGY REPORT", S['ws_title']),
+                              "PATTERN ARCHAEOLOGY REPORT TEMPLATE"))
         self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
         self.flow.append(Spacer(1, 6))
         self.flow.append(Paragraph(
@@ -1109,12 +787,13 @@ class FieldGuideBuilder:
         ]
         for label, line in fields3:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
 
         self.flow.append(PageBreak())
 
         # ── Template 4: 90-Day Review ──
-        self.flow.append(Paragraph("90-DAY REVIEW", S['ws_title']))
+        self.flow.append(mark(Paragraph("90-DAY REVIEW", S['ws_title']),
+                              "90-DAY REVIEW TEMPLATE"))
         self.flow.append(HorizontalRule(color=TEAL, thickness=1.5))
         self.flow.append(Spacer(1, 6))
         self.flow.append(Paragraph(
@@ -1141,18 +820,20 @@ class FieldGuideBuilder:
         ]
         for label, line in fields4:
             self.flow.append(Paragraph(label, S['ws_label']))
-            self.flow.append(Paragraph(line, S['ws_line']))
+            self.flow.append(self._ws_line(line))
 
         self.flow.append(PageBreak())
 
     # ── 10. WHAT'S NEXT ──
     def _section_whats_next(self):
+        self._begin_part(f"closing-{self.pnum}")
         self._part_divider("08", "WHAT\u2019S NEXT",
             "You have the field guide. Here is the full system.")
 
         S = self.styles
         self.flow.append(Spacer(1, 0.4 * inch))
-        self.flow.append(Paragraph("THE COMPLETE ARCHIVE", S['cta_heading']))
+        self.flow.append(mark(Paragraph("THE COMPLETE ARCHIVE", S['cta_heading']),
+                              "THE COMPLETE ARCHIVE"))
         self.flow.append(Spacer(1, 8))
         self.flow.append(TealDivider())
         self.flow.append(Spacer(1, 16))
@@ -1182,8 +863,8 @@ class FieldGuideBuilder:
         ]
         for f in features:
             self.flow.append(Paragraph(
-                f'\u2022  {f}', ParagraphStyle(f'CTA_B_{id(f)}',
-                parent=S['body'], leftIndent=24, bulletIndent=12)))
+                f'\u2022  {f}', STYLES.derive(
+                S['body'], leftIndent=24, bulletIndent=12)))
 
         self.flow.append(Paragraph("$297", S['cta_price']))
         self.flow.append(Paragraph(
@@ -1207,6 +888,31 @@ class FieldGuideBuilder:
 
         self.flow.append(PageBreak())
 
+    # ── Parts ──
+
+    def _begin_part(self, name):
+        """Start a part: what follows in the flow, up to the next part, is
+        laid out (and cached) as one fragment. Parts every guide shares are
+        named without the pattern number, and must not read it."""
+        self.parts.append([name, len(self.flow), hashlib.blake2b(digest_size=16)])
+
+    def _note(self, *inputs):
+        """Feed what the current part's pages depend on, beyond the code,
+        into its cache key."""
+        self.parts[-1][2].update(repr(inputs).encode('utf-8'))
+
+    def _part_keys(self):
+        """[(cache key, flow index)] for ParallelLayout."""
+        version = code_version(CODE)
+        styles = repr(sorted((name, FRAGMENTS.style_key(style))
+                             for name, style in self.styles.items()))
+        keys = []
+        for name, start, digest in self.parts:
+            h = hashlib.blake2b(f"{version}\0{styles}\0".encode('utf-8'), digest_size=16)
+            h.update(digest.digest())
+            keys.append((f"{name}-{h.hexdigest()}", start))
+        return keys
+
     # ── Helpers ──
 
     def _part_divider(self, num, title, desc):
@@ -1214,7 +920,8 @@ class FieldGuideBuilder:
         if self.flow:
             self.flow.append(PageBreak())
         self.flow.append(Spacer(1, 2.3 * inch))
-        self.flow.append(Paragraph(f"SECTION {num}", self.styles['part_label']))
+        self.flow.append(mark(Paragraph(f"SECTION {num}", self.styles['part_label']),
+                              f"SECTION {num}"))
         self.flow.append(Paragraph(title, self.styles['part_name']))
         self.flow.append(Spacer(1, 6))
         self.flow.append(TealDivider())
@@ -1227,17 +934,55 @@ class FieldGuideBuilder:
         if not content:
             return
         self.flow.append(Spacer(1, 0.12 * inch))
-        self.flow.append(Paragraph(title, self.styles['chapter_title']))
+        self.flow.append(mark(Paragraph(title, self.styles['chapter_title']), title))
         if subtitle:
             self.flow.append(Paragraph(subtitle, self.styles['chapter_subtitle']))
         self.flow.append(HorizontalRule(color=TEAL, thickness=2))
         self.flow.append(Spacer(1, 8))
-        self.flow.extend(self.parser.parse(content))
+        # Lowered when layout reaches it: never, for a part the cache supplies.
+        self._note('chapter', title, content, subtitle, page_break)
+        blocks = self.parser.blocks(content)
+        source = source_of(content)
+        self.flow.append(DeferredFlowables(
+            lambda: self.parser.lower(blocks, source),
+            weight=self.parser.count(blocks)))
         if page_break:
             self.flow.append(PageBreak())
 
     # ── Build ──
 
+    def _make_doc(self, path, numbered=True):
+        """The document template; numbered=False leaves page numbers and the
+        running head to ParallelLayout's merge."""
+        doc = ExpandingDocTemplate(
+            path, pagesize=letter,
+            leftMargin=MARGIN_L, rightMargin=MARGIN_R,
+            topMargin=MARGIN_T, bottomMargin=MARGIN_B,
+            title=f"The Archivist Method - Field Guide: The {self.name} Pattern",
+            author="The Archivist Method",
+        )
+        if numbered:
+            doc._pattern_name = self.name
+
+        frame = Frame(MARGIN_L, MARGIN_B, CONTENT_W,
+                      PAGE_H - MARGIN_T - MARGIN_B, id='main')
+
+        doc.addPageTemplates([
+            PageTemplate(id='cover', frames=[Frame(MARGIN_L, MARGIN_B,
+                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='cover_f')],
+                onPage=draw_cover),
+            PageTemplate(id='body', frames=[frame],
+                onPage=draw_body if numbered else _body_chrome),
+            PageTemplate(id='part', frames=[Frame(MARGIN_L, MARGIN_B,
+                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='part_f')],
+                onPage=draw_part),
+        ])
+        return doc
+
+    def _number_page(self, c, number):
+        draw_running_head(c, self.name)
+        draw_page_number(c, number)
+
     def build(self):
         output_name = f"THE-ARCHIVIST-METHOD-FIELD-GUIDE-{self.name.upper().replace(' ', '-')}.pdf"
         output_path = OUTPUT_DIR / output_name
@@ -1248,6 +993,12 @@ class FieldGuideBuilder:
         print(f"  Output: {output_path}")
         print(f"{'='*60}\n")
 
+        DEPS.start()
+        t0 = time.perf_counter()
+        n, parsed, workers = self.cache.prefetch(guide_sources(self.pnum))
+        print(f"  Parsing sources... {n} files, {parsed} parsed on "
+              f"{workers} worker(s) ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
         print("  [1/8] Title page...")
         self._section_title_page()
         print("  [2/8] Table of contents...")
@@ -1267,53 +1018,158 @@ class FieldGuideBuilder:
         print("  [8/8] What's Next...")
         self._section_whats_next()
 
-        print(f"\n  Rendering PDF ({len(self.flow)} flowables)...")
-
-        doc = BaseDocTemplate(
-            str(output_path), pagesize=letter,
-            leftMargin=MARGIN_L, rightMargin=MARGIN_R,
-            topMargin=MARGIN_T, bottomMargin=MARGIN_B,
-            title=f"The Archivist Method - Field Guide: The {self.name} Pattern",
-            author="The Archivist Method",
-        )
-        doc._pattern_name = self.name
-
-        frame = Frame(MARGIN_L, MARGIN_B, CONTENT_W,
-                      PAGE_H - MARGIN_T - MARGIN_B, id='main')
-
-        doc.addPageTemplates([
-            PageTemplate(id='cover', frames=[Frame(MARGIN_L, MARGIN_B,
-                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='cover_f')],
-                onPage=draw_cover),
-            PageTemplate(id='body', frames=[frame], onPage=draw_body),
-            PageTemplate(id='part', frames=[Frame(MARGIN_L, MARGIN_B,
-                CONTENT_W, PAGE_H - MARGIN_T - MARGIN_B, id='part_f')],
-                onPage=draw_part),
-        ])
-
-        doc.build(self.flow)
+        print(f"\n  {self.cache.summary()}")
+        print(f"  Rendering PDF ({len(self.flow)} flowables)...")
+
+        layout = ParallelLayout(self._make_doc, self._number_page,
+                                numbered=('body',), workers=self.workers)
+        cache = PartCache(CACHE_DIR, 'field-guide') if self.part_cache else None
+        LINES.attach(CACHE_DIR, f'field-guide-{self.pnum}')
+        pages = self.pages = layout.build(self.flow, str(output_path),
+                                          parts=self._part_keys(), cache=cache,
+                                          contents=self._contents)
+        LINES.save()
+        if cache is not None:
+            cache.save()
+        DEPS.code(CODE)
+        DEPS.save(CACHE_DIR, f'field-guide-{self.pnum}', output_path)
 
         size_kb = os.path.getsize(output_path) / 1024
         print(f"\n  Done! {output_path.name}")
         print(f"  Size: {size_kb:.0f} KB")
+        print(f"  Pages: {pages}")
+        print(f"  {layout.summary()}")
+        if cache is not None:
+            print(f"  {cache.summary()}")
+        print(f"  {FRAGMENTS.summary()}")
+        print(f"  {LINES.summary()}")
+        print(f"  {WIDTHS.summary()}")
+        print(f"  {STYLES.summary()}")
+        print(f"  {WATCHDOG.summary()}")
+        print(f"  {DEPS.summary()}")
         return str(output_path)
 
 
+# ══════════════════════════════════════════════════════════════
+# BATCH
+# ══════════════════════════════════════════════════════════════
+
+_BATCH = None   # (styles, parse cache, part_cache), for forked workers
+
+
+def _build_guide(pnum, workers=1):
+    """Build one guide of a batch with its output captured. Returns
+    (pattern, path, pages, size in bytes, seconds, warnings, error)."""
+    styles, cache, part_cache = _BATCH
+    log = io.StringIO()
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            builder = FieldGuideBuilder(pnum, workers, part_cache, styles, cache)
+            path = builder.build()
+    except Exception as e:
+        return pnum, None, 0, 0, time.perf_counter() - t0, [], f"{type(e).__name__}: {e}"
+    warnings = [line.strip() for line in log.getvalue().splitlines() if '[warn]' in line]
+    return (pnum, path, builder.pages, os.path.getsize(path),
+            time.perf_counter() - t0, warnings, None)
+
+
+def build_guides(pnums, workers=None, part_cache=True, styles=None, cache=None):
+    """Build several guides in one process tree; returns _build_guide()'s
+    result for each, in order.
+
+    Every source is parsed and the styles are created here, once. The first
+    guide is built in this process, so the parts every guide shares are
+    laid out once and the width, fragment and line-break caches are warm;
+    the others are built by forked workers that inherit all of it."""
+    global _BATCH
+    workers = workers or os.cpu_count() or 1
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        workers = 1
+
+    print(f"\n{'='*60}")
+    print(f"  FIELD GUIDE GENERATOR: {len(pnums)} guides")
+    print(f"  Output: {OUTPUT_DIR}")
+    print(f"{'='*60}\n")
+
+    t0 = time.perf_counter()
+    cache = cache or BlockCache(CACHE_DIR)
+    sources = dict.fromkeys(p for pnum in pnums for p in guide_sources(pnum))
+    n, parsed, parse_workers = cache.prefetch(list(sources))
+    _BATCH = (styles or create_styles(), cache, part_cache)
+    print(f"  Preloading... {n} files, {parsed} parsed on {parse_workers} worker(s) "
+          f"({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+    def report(result):
+        pnum, _, pages, size, took, warnings, error = result
+        if error:
+            print(f"  [warn] {pnum}. {PATTERN_NAMES[pnum]}: failed ({error})")
+            return
+        print(f"  {pnum}. {PATTERN_NAMES[pnum]:<24} {pages:>4} pages "
+              f"{size / 1024:>5.0f} KB {took:>6.2f} s")
+        for warning in warnings:
+            print(f"     {warning}")
+
+    try:
+        results = [_build_guide(pnums[0], workers)]
+        report(results[0])
+        rest = pnums[1:]
+        used = max(1, min(workers, len(rest)))
+        if used == 1:
+            results += [_build_guide(p) for p in rest]
+        else:
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(used, mp_context=context) as pool:
+                results += pool.map(_build_guide, rest)
+        for result in results[1:]:
+            report(result)
+    finally:
+        _BATCH = None
+
+    print(f"\n  {len(pnums)} guides in {time.perf_counter() - t0:.2f} s, "
+          f"{len(rest)} built on {used} worker(s)")
+    return results
+
+
 # ══════════════════════════════════════════════════════════════
 # MAIN
 # ══════════════════════════════════════════════════════════════
 
 def main():
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    part_cache = '--no-cache' not in args
+    watch = '--watch' in args
+    args = [a for a in args if a not in ('--no-cache', '--watch')]
+    if not args:
         print(__doc__)
         sys.exit(1)
 
-    pnum = int(sys.argv[1])
-    if pnum not in PATTERN_NAMES:
-        print(f"Error: Invalid pattern number {pnum}. Must be 1-9.")
-        sys.exit(1)
-
-    builder = FieldGuideBuilder(pnum)
+    if args == ['all']:
+        pnums = sorted(PATTERN_NAMES)
+    else:
+        pnums = list(dict.fromkeys(int(a) for a in args))
+    for pnum in pnums:
+        if pnum not in PATTERN_NAMES:
+            print(f"Error: Invalid pattern number {pnum}. Must be 1-9.")
+            sys.exit(1)
+
+    if watch:
+        from build_daemon import BuildDaemon
+        BuildDaemon(workers).watch([f"field-guide-{pnum}" for pnum in pnums])
+        return
+
+    if len(pnums) > 1:
+        results = build_guides(pnums, workers, part_cache)
+        if any(error for *_, error in results):
+            sys.exit(1)
+        return
+
+    builder = FieldGuideBuilder(pnums[0], workers, part_cache)
     path = builder.build()
     print(f"\n  Generated: {path}")
 